@@ -18,7 +18,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.core.config import settings, trading_config
+from src.core.config import load_yaml, settings, trading_config
 from src.core.database import SessionLocal, init_db
 from src.core.logger import logger, get_component_logger
 from src.data.delta_client import DeltaExchangeClient
@@ -150,6 +150,11 @@ class InternalBroadcastRequest(BaseModel):
     data: Dict = Field(..., example={"symbol": "BTCUSD", "status": "filled"})
 
 
+class InternalBroadcastBatchRequest(BaseModel):
+    """Batch of internal broadcasts from trading agent, in emission order."""
+    events: List[InternalBroadcastRequest] = Field(..., max_length=100)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
@@ -895,7 +900,7 @@ async def update_risk_settings(request: RiskSettingsUpdate):
         config_path = Path(__file__).parent.parent.parent / "config" / "config.yaml"
         
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
         
         if request.max_daily_loss_percent is not None:
             config['risk_management']['max_daily_loss_percent'] = request.max_daily_loss_percent
@@ -1161,6 +1166,48 @@ async def receive_broadcast_from_agent(request: InternalBroadcastRequest):
         }
 
 
+@app.post("/api/v1/internal/broadcast_batch", tags=["Internal"])
+async def receive_broadcast_batch_from_agent(request: InternalBroadcastBatchRequest):
+    """
+    Internal endpoint for trading agent to broadcast several events at once.
+    
+    Events are forwarded to WebSocket clients in the order received, exactly
+    as if each had been posted to /api/v1/internal/broadcast.
+    
+    Args:
+        request: Batch of broadcast requests
+        
+    Returns:
+        Success status
+    """
+    try:
+        logger.info(
+            "Received broadcast batch from trading agent",
+            event_count=len(request.events)
+        )
+        
+        for event in request.events:
+            await broadcast_to_websockets({
+                'type': event.type,
+                'data': event.data
+            })
+        
+        return {
+            "status": "success",
+            "message": f"{len(request.events)} events broadcasted",
+            "clients_notified": len(websocket_clients)
+        }
+        
+    except Exception as e:
+        logger.error("Failed to broadcast event batch", error=str(e), exc_info=True)
+        # Don't fail the request - trading agent should continue
+        return {
+            "status": "error",
+            "message": str(e),
+            "clients_notified": 0
+        }
+
+
 @app.get("/metrics", tags=["Monitoring"])
 async def metrics():
     """Prometheus metrics endpoint."""
@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 
 from src.core.logger import logger
 from backend.database.models import Base
+from src.core.database import migrate_indexes
 
 # Database URL from environment
 DATABASE_URL = os.getenv(
@@ -51,6 +52,7 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+    migrate_indexes(engine)
     logger.info("Database tables created")
     
     # If PostgreSQL, create TimescaleDB hypertable
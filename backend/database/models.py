@@ -1,6 +1,7 @@
 """Enhanced database models for PostgreSQL + TimescaleDB."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 
 from sqlalchemy import (
@@ -11,6 +12,9 @@ from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# Pre-bound aware-UTC clock used as the Python-side column default
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class OHLCVData(Base):
     """OHLCV candle data - TimescaleDB hypertable."""
@@ -18,8 +22,8 @@ class OHLCVData(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     time = Column(DateTime(timezone=True), nullable=False, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    timeframe = Column(String(10), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
+    timeframe = Column(String(10), nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -29,6 +33,7 @@ class OHLCVData(Base):
     __table_args__ = (
         Index('idx_symbol_time', 'symbol', 'time'),
         Index('idx_timeframe_time', 'timeframe', 'time'),
+        Index('ix_ohlcv_key', 'symbol', 'timeframe', 'time', unique=True),  # UPSERT conflict target
     )
 
 
@@ -37,7 +42,7 @@ class Trade(Base):
     __tablename__ = 'trades'
     
     id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
     side = Column(String(10), nullable=False)  # 'buy' or 'sell'
     entry_price = Column(Float, nullable=False)
     exit_price = Column(Float, nullable=True)
@@ -47,8 +52,8 @@ class Trade(Base):
     stop_loss = Column(Float, nullable=True)
     take_profit = Column(Float, nullable=True)
     close_reason = Column(String(50), nullable=True)  # 'stop_loss', 'take_profit', 'signal', 'manual'
-    is_closed = Column(Boolean, default=False, index=True)
-    timestamp = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    is_closed = Column(Boolean, default=False)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow, index=True)
     closed_at = Column(DateTime(timezone=True), nullable=True)
     holding_period = Column(Integer, nullable=True)  # seconds
     
@@ -75,7 +80,7 @@ class Position(Base):
     stop_loss = Column(Float, nullable=True)
     take_profit = Column(Float, nullable=True)
     unrealized_pnl = Column(Float, default=0.0)
-    timestamp = Column(DateTime(timezone=True), default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow)
     
     # Relation to trade
     trade_id = Column(Integer, ForeignKey('trades.id'), nullable=True)
@@ -87,7 +92,7 @@ class PerformanceMetrics(Base):
     __tablename__ = 'performance_metrics'
     
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(DateTime(timezone=True), nullable=False, index=True)
+    date = Column(DateTime(timezone=True), nullable=False)
     balance = Column(Float, nullable=False)
     equity = Column(Float, nullable=False)
     daily_pnl = Column(Float, default=0.0)
@@ -113,8 +118,8 @@ class ModelPrediction(Base):
     __tablename__ = 'model_predictions'
     
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow, index=True)
+    symbol = Column(String(20), nullable=False)
     timeframe = Column(String(10), nullable=False)
     model_name = Column(String(50), nullable=False)
     prediction = Column(String(10), nullable=False)  # 'BUY', 'SELL', 'HOLD'
@@ -134,7 +139,7 @@ class CircuitBreakerEvent(Base):
     __tablename__ = 'circuit_breaker_events'
     
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow)
     breaker_type = Column(String(50), nullable=False)  # 'daily_loss', 'drawdown', etc.
     reason = Column(Text, nullable=False)
     portfolio_balance = Column(Float, nullable=False)
@@ -12,6 +12,13 @@ import sys
 import time
 from pathlib import Path
 
+# libuv-backed event loop where available (not on Windows)
+try:
+    import uvloop  # type: ignore[import]
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -133,6 +140,8 @@ async def main():
 
 if __name__ == "__main__":
     try:
+        if HAS_UVLOOP:
+            uvloop.install()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\nShutdown complete")
@@ -17,7 +17,7 @@ from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
-from src.core.database import Base, Trade, Position, PerformanceMetrics
+from src.core.database import Base, Trade, Position, PerformanceMetrics, migrate_indexes
 from src.core.logger import logger
 
 
@@ -177,6 +177,23 @@ def migrate_positions_table(engine):
     logger.info("Positions table migration complete")
 
 
+def migrate_ohlcv_table(engine):
+    """Bring ohlcv_data's indexes in line with the model.
+    
+    Delegates to migrate_indexes, which init_db also runs: it dedupes
+    candles and creates the unique (symbol, timeframe, time) UPSERT key
+    when missing, and drops superseded indexes. Failures abort the migration.
+    """
+    inspector = inspect(engine)
+    
+    if 'ohlcv_data' not in inspector.get_table_names():
+        logger.info("OHLCV table doesn't exist, will be created fresh")
+        return
+    
+    migrate_indexes(engine)
+    logger.info("OHLCV table migration complete")
+
+
 def create_new_tables(engine):
     """Create any new tables that don't exist."""
     inspector = inspect(engine)
@@ -218,6 +235,7 @@ def main():
         migrate_trades_table(engine)
         migrate_performance_metrics_table(engine)
         migrate_positions_table(engine)
+        migrate_ohlcv_table(engine)
         
         # Create new tables
         logger.info("\n--- Creating New Tables ---")
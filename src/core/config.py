@@ -2,13 +2,42 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, List, Optional, Union
 
 import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+_YAML_BASE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_SCALAR_TAGS = (
+    'tag:yaml.org,2002:bool',
+    'tag:yaml.org,2002:float',
+    'tag:yaml.org,2002:int',
+    'tag:yaml.org,2002:null',
+)
+
+
+class FastLoader(_YAML_BASE_LOADER):
+    """Safe YAML loader (libyaml-backed when available) with a pruned resolver set.
+
+    Only bool/float/int/null implicit resolvers are kept; timestamp, merge
+    and value resolution are never used by our config files and just add
+    regex work to every plain scalar.
+    """
+
+
+FastLoader.yaml_implicit_resolvers = {
+    first_char: [(tag, regexp) for tag, regexp in resolvers if tag in _YAML_SCALAR_TAGS]
+    for first_char, resolvers in _YAML_BASE_LOADER.yaml_implicit_resolvers.items()
+}
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse YAML using the shared FastLoader."""
+    return yaml.load(stream, Loader=FastLoader)
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -48,6 +77,7 @@ class Settings(BaseSettings):
     # Market Data
     update_interval: int = Field(default=900, alias="UPDATE_INTERVAL")
     timeframes: str = Field(default="15m,1h,4h", alias="TIMEFRAMES")
+    cache_dir: str = Field(default="cache", alias="CACHE_DIR")
     
     class Config:
         env_file = ".env"
@@ -69,7 +99,7 @@ class TradingConfig:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return load_yaml(f)
     
     @property
     def trading(self) -> dict:
@@ -1,6 +1,7 @@
 """Database models and connection management - Enhanced unified schema."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 
 from sqlalchemy import (
@@ -14,6 +15,9 @@ from sqlalchemy import (
     Index,
     ForeignKey,
     create_engine,
+    event,
+    inspect,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -24,6 +28,9 @@ from src.core.config import settings
 # Create base class for models
 Base = declarative_base()
 
+# Pre-bound aware-UTC clock used as the Python-side column default
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class OHLCVData(Base):
     """OHLCV candle data - supports TimescaleDB."""
@@ -32,8 +39,8 @@ class OHLCVData(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     time = Column(DateTime(timezone=True), nullable=False, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    timeframe = Column(String(10), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
+    timeframe = Column(String(10), nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -43,6 +50,7 @@ class OHLCVData(Base):
     __table_args__ = (
         Index('idx_symbol_time', 'symbol', 'time'),
         Index('idx_timeframe_time', 'timeframe', 'time'),
+        Index('ix_ohlcv_key', 'symbol', 'timeframe', 'time', unique=True),  # UPSERT conflict target
     )
     
     # Alias for compatibility
@@ -57,7 +65,7 @@ class Trade(Base):
     __tablename__ = "trades"
     
     id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
     side = Column(String(10), nullable=False)  # 'buy' or 'sell'
     entry_price = Column(Float, nullable=False)
     exit_price = Column(Float, nullable=True)
@@ -67,8 +75,8 @@ class Trade(Base):
     stop_loss = Column(Float, nullable=True)
     take_profit = Column(Float, nullable=True)
     close_reason = Column(String(50), nullable=True)  # 'stop_loss', 'take_profit', 'signal', 'manual'
-    is_closed = Column(Boolean, default=False, index=True)
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    is_closed = Column(Boolean, default=False)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow, index=True)
     closed_at = Column(DateTime(timezone=True), nullable=True)
     holding_period = Column(Integer, nullable=True)  # seconds
     
@@ -101,7 +109,7 @@ class Position(Base):
     stop_loss = Column(Float, nullable=True)
     take_profit = Column(Float, nullable=True)
     unrealized_pnl = Column(Float, default=0.0)
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    timestamp = Column(DateTime(timezone=True), default=_utcnow)
     
     # Relation to trade
     trade_id = Column(Integer, ForeignKey('trades.id'), nullable=True)
@@ -114,7 +122,7 @@ class PerformanceMetrics(Base):
     __tablename__ = "performance_metrics"
     
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(DateTime(timezone=True), nullable=False, index=True)
+    date = Column(DateTime(timezone=True), nullable=False)
     balance = Column(Float, nullable=False)
     equity = Column(Float, nullable=False)
     daily_pnl = Column(Float, default=0.0)
@@ -141,8 +149,8 @@ class ModelPrediction(Base):
     __tablename__ = "model_predictions"
     
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow, index=True)
+    symbol = Column(String(20), nullable=False)
     timeframe = Column(String(10), nullable=False)
     model_name = Column(String(50), nullable=False)
     prediction = Column(String(10), nullable=False)  # 'BUY', 'SELL', 'HOLD'
@@ -163,7 +171,7 @@ class CircuitBreakerEvent(Base):
     __tablename__ = "circuit_breaker_events"
     
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow)
     breaker_type = Column(String(50), nullable=False)  # 'daily_loss', 'drawdown', etc.
     reason = Column(Text, nullable=False)
     portfolio_balance = Column(Float, nullable=False)
@@ -188,7 +196,7 @@ class EquitySnapshot(Base):
     __tablename__ = "equity_snapshots"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    timestamp = Column(DateTime(timezone=True), default=_utcnow)
     equity = Column(Float, nullable=False)
     balance = Column(Float, nullable=True)
     note = Column(String, nullable=True)
@@ -199,17 +207,73 @@ class EquitySnapshot(Base):
 
 
 # Database engine and session
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
+if "sqlite" in settings.database_url:
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False}
+    )
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block the sync writer (and vice versa)."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+else:
+    engine = create_engine(
+        settings.database_url,
+        pool_size=8,
+        max_overflow=16,
+        pool_pre_ping=True
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Indexes from earlier schemas that are covered by other indexes
+_OBSOLETE_INDEXES = (
+    'ix_ohlcv_data_symbol',
+    'ix_ohlcv_data_timeframe',
+    'ix_trades_symbol',
+    'ix_trades_is_closed',
+    'ix_performance_metrics_date',
+    'ix_model_predictions_symbol',
+    'ix_circuit_breaker_events_timestamp',
+    'ix_equity_snapshots_timestamp',
+    # Duplicated ix_ohlcv_key, which serves latest-candle lookups scanned backwards
+    'ix_ohlcv_symbol_tf_time_desc',
+)
+
+
+def migrate_indexes(bind) -> None:
+    """Bring indexes on existing tables in line with the models.
+    
+    ``create_all`` neither drops indexes removed from a model nor adds
+    indexes to tables that already exist.
+    """
+    existing = {index['name'] for index in inspect(bind).get_indexes(OHLCVData.__tablename__)}
+    
+    with bind.begin() as conn:
+        for name in _OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        
+        if 'ix_ohlcv_key' not in existing:
+            # The upsert's conflict target is unique; keep the newest copy of each candle
+            conn.execute(text(
+                "DELETE FROM ohlcv_data WHERE id NOT IN ("
+                "SELECT MAX(id) FROM ohlcv_data GROUP BY symbol, timeframe, time)"
+            ))
+    
+    for index in OHLCVData.__table__.indexes:
+        if index.name not in existing:
+            index.create(bind=bind, checkfirst=True)
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+    migrate_indexes(engine)
 
 
 def get_db():
@@ -243,6 +307,7 @@ __all__ = [
     'engine',
     'SessionLocal',
     'init_db',
+    'migrate_indexes',
     'get_db',
     'get_db_session',
 ]
@@ -2,12 +2,16 @@
 
 import json
 import logging
+import logging.config
 import logging.handlers
+import atexit
 import os
+import queue
 import sys
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -17,9 +21,93 @@ import shutil
 import structlog
 from structlog.typing import FilteringBoundLogger, EventDict
 
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from src.core.config import settings
 
 
+# Level name -> numeric level, resolved once instead of getattr() per call
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+}
+
+def _encode_fallback(obj: Any) -> Any:
+    """Encode values JSON has no native support for (``default``/``enc_hook``)."""
+    # numpy scalars and arrays convert to plain Python values
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+if HAS_MSGSPEC:
+    class LogRec(msgspec.Struct, frozen=True, omit_defaults=True):
+        """Component log payload; encodes straight to JSON without a dict."""
+        
+        timestamp_utc: str
+        timestamp_local: str
+        component: str
+        level: str
+        operation: str
+        message: str
+        session_id: str
+        context: dict
+        duration_ms: Optional[float] = None
+        error: Optional[dict] = None
+    
+    # Note: non-finite floats are written as null, keeping the file strict JSON
+    _encode_log_rec = msgspec.json.Encoder(enc_hook=_encode_fallback).encode
+
+# Single background worker for compressing rotated log files
+_COMPRESS_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    """Gzip a rotated log file and remove the uncompressed copy."""
+    try:
+        with open(source, 'rb') as src, gzip.open(dest, 'wb', compresslevel=1) as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+        os.remove(source)
+    except OSError:
+        # Leave the uncompressed file in place; it is still a valid backup
+        pass
+
+
+class CompressingTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Timed rotating handler that gzips rotated files off the logging thread.
+
+    Rollover only renames the active file; compression runs on a worker
+    so writers are not stalled for the duration of the gzip.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = lambda name: name + ".gz"
+    
+    def rotate(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+        
+        uncompressed = dest[:-len(".gz")]
+        os.rename(source, uncompressed)
+        _COMPRESS_POOL.submit(_gzip_file, uncompressed, dest)
+
+
 class ComponentLogger:
     """Component-aware logger with dedicated log files, rotation, and cleanup."""
     
@@ -35,14 +123,14 @@ class ComponentLogger:
         
         # Create component-specific logger
         self.logger = logging.getLogger(f"component.{component_name}")
-        self.logger.setLevel(getattr(logging, log_level.upper()))
+        self.logger.setLevel(_LEVELS.get(log_level.upper(), logging.INFO))
         
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
         
         # Create JSON file handler with rotation
         log_file = self.log_dir / f"{component_name}_{datetime.now().strftime('%Y%m%d')}.json"
-        file_handler = logging.handlers.TimedRotatingFileHandler(
+        file_handler = CompressingTimedRotatingFileHandler(
             log_file,
             when='midnight',
             interval=1,
@@ -81,14 +169,45 @@ class ComponentLogger:
     def log(self, level: str, operation: str, message: str, context: Optional[Dict] = None, 
             duration_ms: Optional[float] = None, error: Optional[Exception] = None):
         """Log structured message with component context."""
+        level = level.upper()
+        log_level = _LEVELS.get(level, logging.INFO)
+        
+        # Skip payload construction and serialization for filtered levels
+        if not self.logger.isEnabledFor(log_level):
+            return
+        
         now_utc = datetime.now(timezone.utc)
         now_local = datetime.now()
         
+        error_data = None
+        if error is not None:
+            error_data = {
+                "type": type(error).__name__,
+                "message": str(error),
+                "traceback": self._get_traceback(error)
+            }
+        
+        if HAS_MSGSPEC:
+            rec = LogRec(
+                timestamp_utc=now_utc.isoformat(),
+                timestamp_local=now_local.strftime("%Y-%m-%d %H:%M:%S %Z"),
+                component=self.component_name,
+                level=level,
+                operation=operation,
+                message=message,
+                session_id=self.get_session_id(),
+                context=context or {},
+                duration_ms=duration_ms,
+                error=error_data,
+            )
+            self.logger.log(log_level, _encode_log_rec(rec).decode('utf-8'))
+            return
+        
         log_data = {
             "timestamp_utc": now_utc.isoformat(),
             "timestamp_local": now_local.strftime("%Y-%m-%d %H:%M:%S %Z"),
             "component": self.component_name,
-            "level": level.upper(),
+            "level": level,
             "operation": operation,
             "message": message,
             "session_id": self.get_session_id(),
@@ -98,16 +217,14 @@ class ComponentLogger:
         if duration_ms is not None:
             log_data["duration_ms"] = duration_ms
         
-        if error is not None:
-            log_data["error"] = {
-                "type": type(error).__name__,
-                "message": str(error),
-                "traceback": self._get_traceback(error)
-            }
+        if error_data is not None:
+            log_data["error"] = error_data
         
-        # Log using appropriate level
-        log_level = getattr(logging, level.upper())
-        self.logger.log(log_level, json.dumps(log_data, ensure_ascii=False))
+        self.logger.log(log_level, json.dumps(log_data, default=_encode_fallback, ensure_ascii=False))
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check the level before building a context dict that may be discarded."""
+        return self.logger.isEnabledFor(level)
     
     def info(self, operation: str, message: str, context: Optional[Dict] = None, duration_ms: Optional[float] = None):
         """Log info level message."""
@@ -153,7 +270,7 @@ class JSONFormatter(logging.Formatter):
                     "message": record.getMessage(),
                     "component": getattr(record, 'component', 'unknown')
                 }
-                return json.dumps(log_data, ensure_ascii=False)
+                return json.dumps(log_data, default=_encode_fallback, ensure_ascii=False)
         except Exception:
             return f"{record.levelname}: {record.getMessage()}"
 
@@ -243,9 +360,191 @@ def add_local_timestamp(logger: Any, method_name: str, event_dict: EventDict) ->
     return event_dict
 
 
+def render_json_bytes(logger: Any, method_name: str, event_dict: EventDict) -> bytes:
+    """Render an event dict straight to JSON bytes for BytesLogger."""
+    if HAS_ORJSON:
+        return orjson.dumps(event_dict, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(event_dict, default=str, ensure_ascii=False).encode('utf-8')
+
+
+class TeeBytesFile:
+    """Write-only binary file object fanning structlog output out to several streams."""
+    
+    def __init__(self, *streams):
+        self._streams = streams
+    
+    def write(self, data: bytes) -> None:
+        for stream in self._streams:
+            # A closed console (e.g. a detached stdout) must not fail the file write
+            if not stream.closed:
+                stream.write(data)
+    
+    def flush(self) -> None:
+        for stream in self._streams:
+            if not stream.closed:
+                stream.flush()
+
+
+class QueuedBytesWriter:
+    """Write-only binary file object that hands writes to a background thread.
+    
+    Producers only enqueue the rendered bytes; a single writer thread drains
+    the queue in batches and flushes the target once per batch. The target
+    can be swapped in-band so loggers cached by structlog keep working
+    across reconfiguration.
+    """
+    
+    _STOP = object()
+    _RETARGET = object()
+    
+    def __init__(self, target):
+        self._target = target
+        self._queue = queue.SimpleQueue()
+        self.dropped = 0  # Failed writes/flushes
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, data: bytes) -> None:
+        self._queue.put(data)
+    
+    def flush(self) -> None:
+        # The writer thread flushes after each drained batch
+        pass
+    
+    def set_target(self, target, release=None) -> None:
+        """Switch to a new target after pending writes; ``release`` is closed afterwards."""
+        self._queue.put((self._RETARGET, target, release))
+    
+    def close(self) -> None:
+        """Drain pending writes and stop the writer thread."""
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=5)
+        if self.dropped > 1:
+            sys.stderr.write(f"log-writer: {self.dropped} log writes/flushes failed\n")
+    
+    def _report_failure(self, operation: str, error: Exception) -> None:
+        """Count a failed write/flush, reporting the first one on stderr.
+        
+        The sink is the log itself, so failures can only surface here; later
+        ones are counted in ``dropped`` instead of flooding stderr.
+        """
+        self.dropped += 1
+        if self.dropped == 1:
+            try:
+                sys.stderr.write(f"log-writer: {operation} failed, dropping log output: {error!r}\n")
+            except Exception:
+                pass
+    
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            stopping = False
+            
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                try:
+                    if isinstance(item, tuple) and item[0] is self._RETARGET:
+                        self._target.flush()
+                        self._target = item[1]
+                        if item[2] is not None:
+                            item[2].close()
+                    else:
+                        self._target.write(item)
+                except Exception as e:
+                    self._report_failure("write", e)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            try:
+                self._target.flush()
+            except Exception as e:
+                self._report_failure("flush", e)
+            
+            if stopping:
+                return
+
+
+# Logging sinks owned by setup_logging; replaced on reconfiguration
+_app_log_file = None
+_app_log_writer: Optional[QueuedBytesWriter] = None
+_stdlib_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _build_logging_config(level: str, log_queue: queue.SimpleQueue) -> Dict[str, Any]:
+    """Build the dictConfig schema for the root (third-party library) logger."""
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "queue": log_queue,
+            },
+        },
+        "root": {
+            "handlers": ["queue"],
+            "level": level,
+        },
+    }
+
+
+def _build_stdlib_listener(log_queue: queue.SimpleQueue, file_path: str) -> logging.handlers.QueueListener:
+    """Create the listener that writes queued third-party records off-thread."""
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.handlers.RotatingFileHandler(
+        file_path,
+        maxBytes=50 * 1024 * 1024,
+        backupCount=5,
+        encoding="utf-8"
+    )
+    for handler in (console_handler, file_handler):
+        handler.setFormatter(formatter)
+    
+    return logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+
+
+def shutdown_logging() -> None:
+    """Drain queued log records and close the log files."""
+    global _app_log_file, _app_log_writer, _stdlib_listener
+    
+    _stop_stdlib_listener()
+    
+    if _app_log_writer is not None:
+        _app_log_writer.close()
+        _app_log_writer = None
+    
+    if _app_log_file is not None:
+        _app_log_file.close()
+        _app_log_file = None
+
+
+def _stop_stdlib_listener() -> None:
+    """Stop the third-party log listener and close its handlers."""
+    global _stdlib_listener
+    
+    if _stdlib_listener is not None:
+        _stdlib_listener.stop()
+        for handler in _stdlib_listener.handlers:
+            handler.close()
+        _stdlib_listener = None
+
+
 def setup_logging(log_level: Optional[str] = None, log_file: Optional[str] = None) -> FilteringBoundLogger:
     """Configure structured logging for the application.
     
+    Application events go through structlog straight to JSON bytes without
+    touching the stdlib logging machinery; the bytes are queued to a writer
+    thread that appends them to the log file and stdout. The stdlib root
+    logger is configured only for third-party libraries: it enqueues records
+    for a QueueListener writing ``third_party.log`` next to the application
+    log. Callers never block on file I/O.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file
@@ -253,24 +552,34 @@ def setup_logging(log_level: Optional[str] = None, log_file: Optional[str] = Non
     Returns:
         Configured logger instance
     """
-    level = log_level or settings.log_level
+    global _app_log_file, _app_log_writer, _stdlib_listener
+    
+    level_no = _LEVELS.get((log_level or settings.log_level).upper(), logging.INFO)
+    level = logging.getLevelName(level_no)
     file_path = log_file or settings.log_file
     
     # Create logs directory if it doesn't exist
     log_dir = Path(file_path).parent
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper()),
-    )
+    # Third-party libraries log through a queue; dictConfig replaces any
+    # root handlers from a previous call
+    _stop_stdlib_listener()
+    stdlib_queue = queue.SimpleQueue()
+    logging.config.dictConfig(_build_logging_config(level, stdlib_queue))
+    _stdlib_listener = _build_stdlib_listener(stdlib_queue, str(log_dir / "third_party.log"))
+    _stdlib_listener.start()
+    
+    previous_file = _app_log_file
+    _app_log_file = open(file_path, 'ab', buffering=64 * 1024)
+    stdout = getattr(sys.stdout, 'buffer', None)
+    target = TeeBytesFile(_app_log_file, stdout) if stdout is not None else _app_log_file
     
-    # Add file handler
-    file_handler = logging.FileHandler(file_path)
-    file_handler.setLevel(getattr(logging, level.upper()))
-    logging.root.addHandler(file_handler)
+    if _app_log_writer is None:
+        _app_log_writer = QueuedBytesWriter(target)
+    else:
+        # Loggers cached on first use hold this writer; swap its target in-band
+        _app_log_writer.set_target(target, release=previous_file)
     
     # Configure structlog with enhanced timestamp
     structlog.configure(
@@ -281,19 +590,21 @@ def setup_logging(log_level: Optional[str] = None, log_file: Optional[str] = Non
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if level.upper() == "DEBUG" else structlog.dev.ConsoleRenderer(),
+            render_json_bytes,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper())),
+        wrapper_class=structlog.make_filtering_bound_logger(level_no),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(file=_app_log_writer),
         cache_logger_on_first_use=True,
     )
     
-    return structlog.get_logger()
+    # Bind eagerly so callers get the concrete filtering logger, not a lazy proxy
+    return structlog.get_logger().bind()
 
 
 # Create global logger instance
 logger = setup_logging()
+atexit.register(shutdown_logging)
 
 # Initialize component loggers
 def get_component_logger(component_name: str, log_level: str = "INFO") -> ComponentLogger:
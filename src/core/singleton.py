@@ -4,70 +4,92 @@ import os
 import sys
 from pathlib import Path
 
+# Windows compatibility for fcntl
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+    # Windows doesn't have fcntl, use alternative locking
+    import msvcrt
+
 
 class SingletonLock:
-    """Ensure only one instance of trading agent runs at a time."""
+    """Ensure only one instance of trading agent runs at a time.
+    
+    Holds an OS advisory lock (flock on POSIX, msvcrt byte lock on Windows)
+    on the lockfile for the lifetime of the process. The OS drops the lock
+    if the process dies, so there is no stale-PID detection to do.
+    """
     
     def __init__(self, lockfile=".trading_agent.lock"):
         self.lockfile = Path(lockfile)
         self.acquired = False
+        self._fh = None
     
     def acquire(self):
         """Acquire lock or exit if already locked."""
-        if self.lockfile.exists():
+        self._fh = open(self.lockfile, 'a+')
+        self._fh.seek(0)
+        
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
             try:
-                with open(self.lockfile, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # Check if process is still running (Windows-compatible)
-                try:
-                    if sys.platform == "win32":
-                        # On Windows, use tasklist to check if process exists
-                        import subprocess
-                        result = subprocess.run(
-                            ['tasklist', '/FI', f'PID eq {pid}'],
-                            capture_output=True,
-                            text=True
-                        )
-                        if str(pid) in result.stdout:
-                            print(f"❌ Trading agent already running (PID: {pid})")
-                            print("⚠️  Stop the existing instance before starting a new one.")
-                            print(f"   Use: taskkill /F /PID {pid}")
-                            sys.exit(1)
-                        else:
-                            # Process doesn't exist, remove stale lockfile
-                            print(f"🧹 Removing stale lockfile (PID {pid} not running)")
-                            self.lockfile.unlink()
-                    else:
-                        # On Unix-like systems, use kill signal 0
-                        os.kill(pid, 0)
-                        print(f"❌ Trading agent already running (PID: {pid})")
-                        print("⚠️  Stop the existing instance before starting a new one.")
-                        print(f"   Use: kill {pid}")
-                        sys.exit(1)
-                except (OSError, subprocess.SubprocessError):
-                    # Process doesn't exist, remove stale lockfile
-                    print(f"🧹 Removing stale lockfile (PID {pid} not running)")
-                    self.lockfile.unlink()
-            except (ValueError, FileNotFoundError):
-                # Invalid lockfile, remove it
-                self.lockfile.unlink()
+                pid = self._fh.read().strip() or "unknown"
+            except OSError:
+                # Windows refuses reads of the locked byte range
+                pid = "unknown"
+            self._fh.close()
+            self._fh = None
+            
+            print(f"❌ Trading agent already running (PID: {pid})")
+            print("⚠️  Stop the existing instance before starting a new one.")
+            if sys.platform == "win32":
+                print(f"   Use: taskkill /F /PID {pid}")
+            else:
+                print(f"   Use: kill {pid}")
+            sys.exit(1)
         
-        # Create lockfile with current PID
-        with open(self.lockfile, 'w') as f:
-            f.write(str(os.getpid()))
+        # Record current PID for operators; the lock itself is the OS lock
+        self._fh.seek(0)
+        self._fh.truncate()
+        self._fh.write(str(os.getpid()))
+        self._fh.flush()
         
         self.acquired = True
         print(f"🔒 Singleton lock acquired (PID: {os.getpid()})")
     
     def release(self):
-        """Release lock."""
-        if self.acquired and self.lockfile.exists():
-            try:
-                self.lockfile.unlink()
-                print(f"🔓 Singleton lock released")
-            except OSError as e:
-                print(f"Warning: Could not remove lock file: {e}")
+        """Release lock.
+        
+        The lockfile is left in place: unlinking it would let one process
+        lock the old inode while another creates and locks a new file. Its
+        PID is cleared while the lock is still held.
+        """
+        if not self.acquired or self._fh is None:
+            return
+        
+        try:
+            self._fh.seek(0)
+            self._fh.truncate()
+            self._fh.flush()
+            if HAS_FCNTL:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError as e:
+            print(f"Warning: Could not release lock file cleanly: {e}")
+        finally:
+            self._fh.close()
+            self._fh = None
+            self.acquired = False
+        
+        print(f"🔓 Singleton lock released")
     
     def __enter__(self):
         """Context manager entry."""
@@ -78,4 +100,3 @@ class SingletonLock:
         """Context manager exit."""
         self.release()
         return False
-
@@ -0,0 +1,218 @@
+"""Single-pass loop kernels for FeatureEngineer.
+
+Kernels are compiled when numba is installed; otherwise the equivalent
+NumPy/TA-Lib ``_numpy_*`` implementation is used. Both are always defined
+so tests can check that they agree. Explicit signatures make numba compile
+the kernels eagerly at import (or load them from its on-disk cache) instead
+of on the first feature build. The cache lives under ``~/.kubera/numba_cache``
+unless ``NUMBA_CACHE_DIR`` is set, so it survives fresh checkouts and
+read-only installs.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import talib
+
+try:
+    import numba
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA and not numba.config.CACHE_DIR:
+    # Set on numba's config rather than the environment so child processes
+    # and other libraries are unaffected; NUMBA_CACHE_DIR still wins
+    numba.config.CACHE_DIR = str(Path.home() / '.kubera' / 'numba_cache')
+
+
+def _numpy_vwap(close, volume, out):
+    """Running volume weighted average price, written into ``out``."""
+    cum_volume = np.cumsum(volume)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(np.cumsum(close * volume), cum_volume, out=out)
+    out[cum_volume <= 0] = np.nan
+    return out
+
+
+def _numpy_derived_features(close, sma20, sma50, sma200, rsi, macd, macd_signal, ema12, ema26,
+                            price_to_sma, sma_diff, trend_strength, crosses):
+    """Ratio, spread and crossover features in one pass over the inputs.
+    
+    ``price_to_sma`` rows are close over SMA 20/50/200; ``crosses`` rows
+    are the SMA 20/50 cross, RSI overbought, RSI oversold and MACD cross.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for row, sma in enumerate((sma20, sma50, sma200)):
+            np.divide(close, sma, out=price_to_sma[row])
+        np.subtract(sma20, sma50, out=sma_diff)
+        np.divide(ema12 - ema26, close, out=trend_strength)
+    # Comparisons write 0/1 straight into the int8 rows; crosses are then
+    # mapped to -1/+1 in place, with no int64 temporaries
+    np.greater(sma20, sma50, out=crosses[0], casting='unsafe')
+    np.greater(rsi, 70.0, out=crosses[1], casting='unsafe')
+    np.less(rsi, 30.0, out=crosses[2], casting='unsafe')
+    np.greater(macd, macd_signal, out=crosses[3], casting='unsafe')
+    for row in (0, 3):
+        crosses[row] *= 2
+        crosses[row] -= 1
+
+
+def _numpy_multi_sma(close, periods, out):
+    """Simple moving averages for every period; row ``p`` is ``periods[p]``."""
+    for p, period in enumerate(periods):
+        out[p] = talib.SMA(close, timeperiod=int(period))
+    return out
+
+
+def _numpy_multi_ema(close, periods, out):
+    """Exponential moving averages for every period; row ``p`` is ``periods[p]``."""
+    for p, period in enumerate(periods):
+        out[p] = talib.EMA(close, timeperiod=int(period))
+    return out
+
+
+def _numpy_rolling_std(x, window, out):
+    """Rolling sample standard deviation over ``window`` values of ``x``."""
+    out[:] = pd.Series(x).rolling(window=window).std().to_numpy()
+    return out
+
+
+if HAS_NUMBA:
+    @njit('f8[::1](f8[::1], f8[::1], f8[::1])', cache=True)
+    def vwap(close, volume, out):
+        """Running volume weighted average price, written into ``out``."""
+        s1 = 0.0
+        s2 = 0.0
+        for i in range(close.shape[0]):
+            s1 += close[i] * volume[i]
+            s2 += volume[i]
+            out[i] = s1 / s2 if s2 > 0 else np.nan
+        return out
+    
+    @njit('void(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], '
+          'f8[:, ::1], f8[::1], f8[::1], i1[:, ::1])', cache=True, error_model='numpy')
+    def derived_features(close, sma20, sma50, sma200, rsi, macd, macd_signal, ema12, ema26,
+                         price_to_sma, sma_diff, trend_strength, crosses):
+        """Ratio, spread and crossover features in one pass over the inputs.
+        
+        ``price_to_sma`` rows are close over SMA 20/50/200; ``crosses`` rows
+        are the SMA 20/50 cross, RSI overbought, RSI oversold and MACD cross.
+        """
+        for i in range(close.shape[0]):
+            c = close[i]
+            price_to_sma[0, i] = c / sma20[i]
+            price_to_sma[1, i] = c / sma50[i]
+            price_to_sma[2, i] = c / sma200[i]
+            sma_diff[i] = sma20[i] - sma50[i]
+            trend_strength[i] = (ema12[i] - ema26[i]) / c
+            # Branchless flags: comparison result as 0/1, crosses mapped to -1/+1
+            crosses[0, i] = 2 * (sma20[i] > sma50[i]) - 1
+            crosses[1, i] = rsi[i] > 70
+            crosses[2, i] = rsi[i] < 30
+            crosses[3, i] = 2 * (macd[i] > macd_signal[i]) - 1
+    
+    @njit('f8[:, ::1](f8[::1], i8[::1], f8[:, ::1])', cache=True)
+    def multi_sma(close, periods, out):
+        """Simple moving averages for every period in one sweep over ``close``.
+        
+        Row ``p`` of ``out`` holds the SMA for ``periods[p]``, NaN until the
+        window fills. Running sums follow TA-Lib's update order.
+        """
+        n = close.shape[0]
+        totals = np.zeros(periods.shape[0])
+        out[:] = np.nan
+        for i in range(n):
+            x = close[i]
+            for p in range(periods.shape[0]):
+                period = periods[p]
+                totals[p] += x
+                if i >= period - 1:
+                    out[p, i] = totals[p] / period
+                    totals[p] -= close[i - period + 1]
+        return out
+    
+    @njit('f8[:, ::1](f8[::1], i8[::1], f8[:, ::1])', cache=True)
+    def multi_ema(close, periods, out):
+        """Exponential moving averages for every period in one sweep over ``close``.
+        
+        Each EMA is seeded with the SMA of its first ``period`` values, as
+        TA-Lib does, and row ``p`` of ``out`` holds the EMA for ``periods[p]``.
+        """
+        n = close.shape[0]
+        out[:] = np.nan
+        seeds = np.zeros(periods.shape[0])
+        for i in range(n):
+            x = close[i]
+            for p in range(periods.shape[0]):
+                period = periods[p]
+                if i < period - 1:
+                    seeds[p] += x
+                elif i == period - 1:
+                    out[p, i] = (seeds[p] + x) / period
+                else:
+                    prev = out[p, i - 1]
+                    out[p, i] = (x - prev) * (2.0 / (period + 1)) + prev
+        return out
+    
+    @njit('f8[::1](f8[::1], i8, f8[::1])', cache=True)
+    def rolling_std(x, window, out):
+        """Rolling sample standard deviation over ``window`` values of ``x``.
+        
+        Welford running mean/M2 with O(1) add and remove per step. NaNs are
+        left out of the window, and output is NaN until ``window`` valid
+        values are present, matching pandas rolling(window).std().
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(x.shape[0]):
+            value = x[i]
+            if not np.isnan(value):
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+            
+            if i >= window:
+                old = x[i - window]
+                if not np.isnan(old):
+                    count -= 1
+                    if count == 0:
+                        mean = 0.0
+                        m2 = 0.0
+                    else:
+                        delta = old - mean
+                        mean -= delta / count
+                        m2 -= delta * (old - mean)
+            
+            if count >= window and window > 1:
+                out[i] = np.sqrt(max(m2, 0.0) / (count - 1))
+            else:
+                out[i] = np.nan
+        return out
+else:
+    vwap = _numpy_vwap
+    derived_features = _numpy_derived_features
+    multi_sma = _numpy_multi_sma
+    multi_ema = _numpy_multi_ema
+    rolling_std = _numpy_rolling_std
+
+
+def warmup():
+    """Run every kernel once on a tiny input.
+    
+    Called during startup so loading compiled kernels, and any failure to
+    do so, happens before the first sync rather than inside it.
+    """
+    n = 4
+    close = np.linspace(1.0, 2.0, n)
+    periods = np.array([2, 3], dtype=np.int64)
+    vwap(close, close, np.empty(n))
+    multi_sma(close, periods, np.empty((2, n)))
+    multi_ema(close, periods, np.empty((2, n)))
+    rolling_std(close, 2, np.empty(n))
+    derived_features(close, close, close, close, close, close, close, close, close,
+                     np.empty((3, n)), np.empty(n), np.empty(n), np.empty((4, n), dtype=np.int8))
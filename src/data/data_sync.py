@@ -1,8 +1,10 @@
 """Automatic data synchronization service to maintain database freshness."""
 
 import asyncio
+import io
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -16,9 +18,25 @@ from src.core.config import trading_config
 class DataSyncService:
     """Service to automatically sync fresh data from Delta Exchange."""
     
+    CANDLE_COLUMNS = ('symbol', 'timeframe', 'time', 'open', 'high', 'low', 'close', 'volume')
+    COMMIT_BATCH = 1000  # Rows per UPSERT commit; bounds lock hold time and failure blast radius
+    
     def __init__(self):
         self.delta_client = DeltaExchangeClient()
-        self.db = SessionLocal()
+        # Sessions are opened per operation from the pooled engine so
+        # concurrent pair syncs get independent connections
+        self.session_factory = SessionLocal
+        
+        # Candle write statements are built once and reused for every batch
+        columns = ', '.join(self.CANDLE_COLUMNS)
+        values = ', '.join(f':{col}' for col in self.CANDLE_COLUMNS)
+        self._upsert_stmt = text(
+            f"INSERT INTO ohlcv_data ({columns}) VALUES ({values}) "
+            "ON CONFLICT (symbol, timeframe, time) DO UPDATE SET "
+            "open = excluded.open, high = excluded.high, low = excluded.low, "
+            "close = excluded.close, volume = excluded.volume"
+        )
+        self._insert_ignore_stmt = text(f"INSERT OR IGNORE INTO ohlcv_data ({columns}) VALUES ({values})")
         
         # Load configuration
         sync_config = trading_config.data.get('sync', {})
@@ -28,7 +46,9 @@ class DataSyncService:
         self.batch_size = sync_config.get('batch_size', 1000)
         self.retry_attempts = sync_config.get('retry_attempts', 3)
         self.retry_delay = sync_config.get('retry_delay', 300)
+        self.max_concurrency = sync_config.get('max_concurrency', 8)
         self.is_running = False
+        self.last_sync: Optional[str] = None
         
     async def start_sync(self):
         """Start the data synchronization service."""
@@ -44,30 +64,46 @@ class DataSyncService:
                 await asyncio.sleep(300)  # Wait 5 minutes on error
     
     async def sync_latest_data(self):
-        """Sync the latest data for all configured symbols and timeframes."""
-        for symbol in self.symbols:
-            for timeframe in self.timeframes:
-                try:
-                    await self.sync_symbol_timeframe(symbol, timeframe)
-                except Exception as e:
-                    logger.error(f"Failed to sync {symbol} {timeframe}", error=str(e))
+        """Sync the latest data for all configured symbols and timeframes.
+        
+        Symbol/timeframe pairs are synced concurrently, bounded by
+        ``max_concurrency`` in-flight API fetches.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pairs = [(symbol, timeframe) for symbol in self.symbols for timeframe in self.timeframes]
+        
+        async def _bounded_sync(symbol: str, timeframe: str):
+            async with semaphore:
+                await self.sync_symbol_timeframe(symbol, timeframe)
+        
+        results = await asyncio.gather(
+            *(_bounded_sync(symbol, timeframe) for symbol, timeframe in pairs),
+            return_exceptions=True
+        )
+        
+        for (symbol, timeframe), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to sync candles", symbol=symbol, timeframe=timeframe, error=str(result))
+        
+        self.last_sync = datetime.now(timezone.utc).isoformat()
     
     async def sync_symbol_timeframe(self, symbol: str, timeframe: str):
         """Sync data for a specific symbol and timeframe."""
         # Get the latest timestamp in database
-        latest_timestamp = self.get_latest_timestamp(symbol, timeframe)
+        latest_timestamp = await asyncio.to_thread(self.get_latest_timestamp, symbol, timeframe)
+        
+        end_time = datetime.now(timezone.utc)
         
         if latest_timestamp:
             # Fetch data from latest timestamp to now
             start_time = latest_timestamp + timedelta(seconds=1)
-            end_time = datetime.now(timezone.utc)
         else:
             # No data exists, fetch last 7 days
-            start_time = datetime.now(timezone.utc) - timedelta(days=7)
-            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=7)
         
-        # Fetch fresh data from Delta Exchange
-        df = self.delta_client.get_ohlc_candles(
+        # Fetch fresh data from Delta Exchange off the event loop
+        df = await asyncio.to_thread(
+            self.delta_client.get_ohlc_candles,
             symbol=symbol,
             resolution=timeframe,
             start=start_time,
@@ -76,57 +112,117 @@ class DataSyncService:
         )
         
         if not df.empty:
-            # Store new data in database
-            await self.store_candles(df, symbol, timeframe)
-            logger.info(f"Synced {len(df)} new candles for {symbol} {timeframe}")
+            # Store new data in database; a cold start has nothing to conflict with
+            if latest_timestamp:
+                await self.store_candles(df, symbol, timeframe)
+            else:
+                await self.bulk_load_candles(df, symbol, timeframe)
+            logger.info("Synced new candles", symbol=symbol, timeframe=timeframe, count=len(df))
     
     def get_latest_timestamp(self, symbol: str, timeframe: str) -> Optional[datetime]:
-        """Get the latest timestamp for a symbol/timeframe in database."""
-        from sqlalchemy import func
+        """Get the latest timestamp for a symbol/timeframe in database.
         
-        result = self.db.query(func.max(OHLCVData.time)).filter(
-            OHLCVData.symbol == symbol,
-            OHLCVData.timeframe == timeframe
-        ).scalar()
+        ORDER BY time DESC LIMIT 1 is served by a single backward seek on
+        the ix_ohlcv_key (symbol, timeframe, time) index rather than
+        aggregating the partition.
+        """
+        with self.session_factory() as db:
+            result = db.query(OHLCVData.time).filter(
+                OHLCVData.symbol == symbol,
+                OHLCVData.timeframe == timeframe
+            ).order_by(OHLCVData.time.desc()).limit(1).scalar()
         
         return result  # ORM automatically handles type conversion
     
     async def store_candles(self, df: pd.DataFrame, symbol: str, timeframe: str):
-        """Store new candles in database with deduplication."""
-        new_records = 0
-        updated_records = 0
+        """Store new candles in database with deduplication.
         
-        for _, row in df.iterrows():
-            try:
-                # Check if record exists
-                result = self.db.execute(
-                    text("SELECT id FROM ohlcv_data WHERE symbol = :symbol AND timeframe = :timeframe AND time = :time"),
-                    {"symbol": symbol, "timeframe": timeframe, "time": str(row['timestamp'])}
-                ).fetchone()
+        Uses INSERT ... ON CONFLICT DO UPDATE over the (symbol, timeframe,
+        time) unique index, so existing candles are refreshed and new ones
+        inserted. Rows are written and committed in ``COMMIT_BATCH``-sized
+        executemany chunks; a failing chunk is rolled back on its own and
+        the remaining chunks are still stored.
+        """
+        records = self._candle_records(df, symbol, timeframe)
+        stored = await asyncio.to_thread(self._upsert_records, records, symbol, timeframe)
+        logger.info("Upserted candles", symbol=symbol, timeframe=timeframe, count=stored, failed=len(records) - stored)
+    
+    def _upsert_records(self, records: List[Dict], symbol: str, timeframe: str) -> int:
+        """Run the candle UPSERT in its own session; returns the number of rows stored."""
+        stored = 0
+        
+        with self.session_factory() as db:
+            for offset in range(0, len(records), self.COMMIT_BATCH):
+                chunk = records[offset:offset + self.COMMIT_BATCH]
+                try:
+                    db.execute(self._upsert_stmt, chunk)
+                    db.commit()
+                    stored += len(chunk)
+                except Exception as e:
+                    db.rollback()
+                    logger.error("Failed to store candle batch", error=str(e), symbol=symbol,
+                                 timeframe=timeframe, offset=offset, rows=len(chunk))
+        
+        return stored
+    
+    async def bulk_load_candles(self, df: pd.DataFrame, symbol: str, timeframe: str):
+        """Load candles for a symbol/timeframe that has no rows yet.
+        
+        PostgreSQL streams the batch through COPY FROM STDIN; SQLite uses a
+        single executemany of INSERT OR IGNORE. Other backends, and a COPY
+        that hits a conflicting row, fall back to the UPSERT path.
+        """
+        try:
+            loaded = await asyncio.to_thread(self._bulk_insert_candles, df, symbol, timeframe)
+        except Exception as e:
+            logger.warning("Bulk load failed, falling back to upsert", error=str(e), symbol=symbol, timeframe=timeframe)
+            loaded = False
+        
+        if loaded:
+            logger.info("Bulk loaded candles", symbol=symbol, timeframe=timeframe, count=len(df))
+        else:
+            await self.store_candles(df, symbol, timeframe)
+    
+    def _bulk_insert_candles(self, df: pd.DataFrame, symbol: str, timeframe: str) -> bool:
+        """Bulk insert candles; returns False if the backend has no bulk path."""
+        with self.session_factory() as db:
+            dialect = db.get_bind().dialect.name
+            
+            if dialect == 'postgresql':
+                buf = io.StringIO()
+                self._candle_frame(df, symbol, timeframe).to_csv(buf, sep='\t', header=False, index=False)
+                buf.seek(0)
                 
-                if result:
-                    # Update existing record
-                    self.db.execute(
-                        text("UPDATE ohlcv_data SET open = :open, high = :high, low = :low, close = :close, volume = :volume WHERE id = :id"),
-                        {"open": float(row['open']), "high": float(row['high']), "low": float(row['low']), 
-                         "close": float(row['close']), "volume": float(row['volume']), "id": result[0]}
-                    )
-                    updated_records += 1
-                else:
-                    # Insert new record
-                    self.db.execute(
-                        text("INSERT INTO ohlcv_data (symbol, timeframe, time, open, high, low, close, volume) VALUES (:symbol, :timeframe, :time, :open, :high, :low, :close, :volume)"),
-                        {"symbol": symbol, "timeframe": timeframe, "time": str(row['timestamp']), 
-                         "open": float(row['open']), "high": float(row['high']), 
-                         "low": float(row['low']), "close": float(row['close']), "volume": float(row['volume'])}
-                    )
-                    new_records += 1
-            except Exception as e:
-                logger.error(f"Failed to store candle", error=str(e), symbol=symbol, timeframe=timeframe, time=row['timestamp'])
-                continue
+                raw_conn = db.connection().connection
+                with raw_conn.cursor() as cursor:
+                    cursor.copy_from(buf, 'ohlcv_data', columns=self.CANDLE_COLUMNS, sep='\t')
+            elif dialect == 'sqlite':
+                db.execute(self._insert_ignore_stmt, self._candle_records(df, symbol, timeframe))
+            else:
+                return False
+            
+            db.commit()
         
-        self.db.commit()
-        logger.info(f"Stored {new_records} new, {updated_records} updated candles for {symbol} {timeframe}")
+        return True
+    
+    def _candle_frame(self, df: pd.DataFrame, symbol: str, timeframe: str) -> pd.DataFrame:
+        """Shape fetched candles into ohlcv_data column order."""
+        return df.assign(
+            symbol=symbol,
+            timeframe=timeframe,
+            time=df['timestamp'].astype(str)
+        )[list(self.CANDLE_COLUMNS)]
+    
+    def _candle_records(self, df: pd.DataFrame, symbol: str, timeframe: str) -> List[Dict]:
+        """Build executemany parameter dicts from one pass over contiguous arrays."""
+        times = df['timestamp'].astype(str).to_numpy()
+        ohlcv = df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64).tolist()
+        
+        return [
+            {"symbol": symbol, "timeframe": timeframe, "time": time_str,
+             "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for time_str, (o, h, l, c, v) in zip(times, ohlcv)
+        ]
     
     def stop_sync(self):
         """Stop the data synchronization service."""
@@ -135,13 +231,15 @@ class DataSyncService:
         logger.info("Data synchronization service stopped")
     
     def close(self):
-        """Close database session and cleanup resources."""
-        if hasattr(self, 'db') and self.db:
-            try:
-                self.db.close()
-                logger.debug("DataSyncService database session closed")
-            except Exception as e:
-                logger.warning(f"Error closing DataSyncService database session: {e}")
+        """Release the API client's HTTP connections.
+        
+        Database sessions are scoped to each operation, so none are held here.
+        """
+        try:
+            self.delta_client.session.close()
+            logger.debug("DataSyncService HTTP session closed")
+        except Exception as e:
+            logger.warning("Error closing DataSyncService HTTP session", error=str(e))
     
     def __enter__(self):
         """Context manager entry."""
@@ -152,9 +250,13 @@ class DataSyncService:
         self.close()
     
     def get_sync_status(self) -> Dict:
-        """Get current synchronization status."""
+        """Get current synchronization status.
+        
+        ``last_sync`` is stamped once per completed cycle rather than
+        formatted on every status request.
+        """
         return {
             "is_running": self.is_running,
             "sync_interval": self.sync_interval,
-            "last_sync": datetime.now(timezone.utc).isoformat() if self.is_running else None
+            "last_sync": self.last_sync if self.is_running else None
         }
@@ -1,6 +1,6 @@
 """Data quality validation and cleaning."""
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 import numpy as np
@@ -8,6 +8,144 @@ import pandas as pd
 
 from src.core.logger import logger
 
+# Optional JIT for the per-batch numeric kernels; falls back to plain NumPy
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _volume_stats(volume):
+    """Zero negative volumes; return (volume, median, negative count, >10x median count)."""
+    negative = volume < 0
+    neg_count = negative.sum()
+    volume = np.where(negative, 0.0, volume)
+    
+    median = np.median(volume)
+    high_count = 0
+    if median > 0:
+        high_count = (volume > median * 10).sum()
+    
+    return volume, median, neg_count, high_count
+
+
+@njit(cache=True)
+def _quality_score(original, final, missing, outliers, ohlc_errors, volume_anomalies):
+    """Retention score minus capped issue penalties, floored at 0."""
+    # Base score from data retention
+    retention_score = (final / original) * 100
+    
+    # Penalties for issues
+    penalties = min((missing / original) * 20, 10)
+    penalties += min((outliers / original) * 10, 5)
+    penalties += min((ohlc_errors / original) * 15, 10)
+    penalties += min((volume_anomalies / original) * 5, 5)
+    
+    return max(retention_score - penalties, 0.0)
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """Forward fill NaNs along the last axis of a float array (leading NaNs are kept)."""
+    positions = np.where(np.isnan(values), 0, np.arange(values.shape[-1]))
+    np.maximum.accumulate(positions, axis=-1, out=positions)
+    return np.take_along_axis(values, positions, axis=-1)
+
+
+def _median(values: np.ndarray) -> float:
+    """Median by O(n) selection rather than a full sort."""
+    mid = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, mid)[mid])
+    lower, upper = np.partition(values, (mid - 1, mid))[mid - 1:mid + 1]
+    return (float(lower) + float(upper)) / 2
+
+
+class OHLCVArrays:
+    """Struct-of-arrays view of an OHLCV batch.
+    
+    Validator stages operate on these contiguous buffers instead of
+    re-indexing DataFrame columns. ``rows`` maps each entry back to its
+    position in the source frame so any other columns are carried through.
+    Timestamps are held as naive UTC datetime64[ns]; ``tz`` is restored on
+    the way out.
+    """
+    
+    __slots__ = ('ts', 'o', 'h', 'l', 'c', 'v', 'sym', 'tf', 'rows', 'tz')
+    
+    PRICE_FIELDS = (('open', 'o'), ('high', 'h'), ('low', 'l'), ('close', 'c'))
+    FIELDS = PRICE_FIELDS + (('volume', 'v'),)
+    
+    def __init__(self, ts, o, h, l, c, v, sym, tf, rows, tz=None):
+        self.ts = ts
+        self.o = o
+        self.h = h
+        self.l = l
+        self.c = c
+        self.v = v
+        self.sym = sym
+        self.tf = tf
+        self.rows = rows
+        self.tz = tz
+    
+    def __len__(self) -> int:
+        return len(self.ts)
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'OHLCVArrays':
+        """Copy the OHLCV columns of ``df`` into owned float64/datetime64 arrays."""
+        ts = df['timestamp']
+        tz = ts.dt.tz
+        if tz is not None:
+            ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+        
+        return cls(
+            ts=ts.to_numpy(dtype='datetime64[ns]'),
+            **{attr: df[col].to_numpy(dtype=np.float64, copy=True) for col, attr in cls.FIELDS},
+            sym=df['symbol'].to_numpy(),
+            tf=df['timeframe'].to_numpy(),
+            rows=np.arange(len(df)),
+            tz=tz
+        )
+    
+    def take(self, indexer: np.ndarray) -> 'OHLCVArrays':
+        """Select rows by boolean mask or integer positions."""
+        return OHLCVArrays(
+            self.ts[indexer], self.o[indexer], self.h[indexer], self.l[indexer],
+            self.c[indexer], self.v[indexer], self.sym[indexer], self.tf[indexer],
+            self.rows[indexer], self.tz
+        )
+    
+    def to_frame(self, source: pd.DataFrame, reset_index: bool = False) -> pd.DataFrame:
+        """Rebuild a DataFrame with ``source``'s column order and index labels.
+        
+        With ``reset_index`` the result gets a fresh RangeIndex instead, as
+        a re-sorted frame does.
+        """
+        ts = pd.DatetimeIndex(self.ts)
+        if self.tz is not None:
+            ts = ts.tz_localize('UTC').tz_convert(self.tz)
+        
+        arrays = {'timestamp': ts, 'symbol': self.sym, 'timeframe': self.tf}
+        for col in ('symbol', 'timeframe'):
+            # Keep categorical label columns categorical
+            if isinstance(source[col].dtype, pd.CategoricalDtype):
+                arrays[col] = pd.Categorical(arrays[col], dtype=source[col].dtype)
+        arrays.update((col, getattr(self, attr)) for col, attr in self.FIELDS)
+        
+        return pd.DataFrame(
+            {col: arrays[col] if col in arrays else source[col].to_numpy()[self.rows]
+             for col in source.columns},
+            index=pd.RangeIndex(len(self)) if reset_index else source.index[self.rows]
+        )
+
 
 class DataValidator:
     """Validate and clean market data."""
@@ -18,6 +156,9 @@ class DataValidator:
     def validate_and_clean(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
         """Run all validation checks and clean data.
         
+        The frame is unpacked into an :class:`OHLCVArrays` once, every stage
+        works on the arrays, and the cleaned frame is rebuilt at the end.
+        
         Args:
             df: Raw OHLCV DataFrame
             
@@ -29,31 +170,38 @@ class DataValidator:
         
         original_count = len(df)
         metrics = {'original_count': original_count}
+        x = OHLCVArrays.from_frame(df)
+        
+        # One aware-UTC "now" boundary for the whole run
+        now = pd.Timestamp.now(tz='UTC')
         
         # Check for missing data
-        df, missing_stats = self._handle_missing_data(df)
+        x, missing_stats = self._handle_missing_data(x)
         metrics['missing_data'] = missing_stats
         
         # Check for duplicates
-        df, duplicate_count = self._remove_duplicates(df)
+        x, duplicate_count = self._remove_duplicates(x)
         metrics['duplicates_removed'] = duplicate_count
         
         # Validate timestamps
-        df, timestamp_issues = self._validate_timestamps(df)
+        x, timestamp_issues = self._validate_timestamps(x, now)
         metrics['timestamp_issues'] = timestamp_issues
         
         # Check for outliers
-        df, outlier_stats = self._detect_outliers(df)
+        x, outlier_stats = self._detect_outliers(x)
         metrics['outliers'] = outlier_stats
         
         # Validate OHLC relationships
-        df, ohlc_errors = self._validate_ohlc(df)
+        x, ohlc_errors = self._validate_ohlc(x)
         metrics['ohlc_errors'] = ohlc_errors
         
         # Volume validation
-        df, volume_anomalies = self._validate_volume(df)
+        x, volume_anomalies = self._validate_volume(x)
         metrics['volume_anomalies'] = volume_anomalies
         
+        # A re-sorted batch gets a fresh index, as sort_values().reset_index() did
+        df = x.to_frame(df, reset_index=timestamp_issues.get('unsorted', False))
+        
         final_count = len(df)
         metrics['final_count'] = final_count
         metrics['rows_removed'] = original_count - final_count
@@ -69,172 +217,177 @@ class DataValidator:
         
         return df, metrics
     
-    def _handle_missing_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
+    def _handle_missing_data(self, x: OHLCVArrays) -> Tuple[OHLCVArrays, dict]:
         """Handle missing data."""
-        missing_stats = {}
+        prices = np.vstack((x.o, x.h, x.l, x.c))
         
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            missing_count = df[col].isna().sum()
-            missing_stats[col] = missing_count
-            
-            if missing_count > 0:
-                logger.warning(f"Missing data in {col}", count=missing_count)
-                
-                # Forward fill for price data
-                if col != 'volume':
-                    df[col] = df[col].ffill()
-                else:
-                    # Zero fill for volume
-                    df[col] = df[col].fillna(0)
+        # Count NaNs for all price columns in one pass
+        price_missing = np.isnan(prices).sum(axis=1)
+        volume_missing = np.isnan(x.v)
+        missing_stats = {col: int(count) for (col, _), count in zip(OHLCVArrays.PRICE_FIELDS, price_missing)}
+        missing_stats['volume'] = int(volume_missing.sum())
+        
+        for col, count in missing_stats.items():
+            if count > 0:
+                logger.warning(f"Missing data in {col}", count=count)
+        
+        if price_missing.any():
+            # Forward fill for price data, all four rows at once
+            x.o, x.h, x.l, x.c = _ffill(prices)
+        
+        if missing_stats['volume']:
+            # Zero fill for volume
+            x.v[volume_missing] = 0.0
         
         # Drop rows that still have NaN
-        rows_before = len(df)
-        df = df.dropna(subset=['open', 'high', 'low', 'close'])
-        rows_after = len(df)
+        rows_before = len(x)
+        remaining = np.isnan(x.o) | np.isnan(x.h) | np.isnan(x.l) | np.isnan(x.c)
+        if remaining.any():
+            x = x.take(~remaining)
         
-        missing_stats['rows_dropped'] = rows_before - rows_after
+        missing_stats['rows_dropped'] = rows_before - len(x)
         
-        return df, missing_stats
+        return x, missing_stats
     
-    def _remove_duplicates(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    def _remove_duplicates(self, x: OHLCVArrays) -> Tuple[OHLCVArrays, int]:
         """Remove duplicate timestamps."""
-        duplicate_count = df.duplicated(subset=['timestamp', 'symbol', 'timeframe']).sum()
+        duplicated = pd.DataFrame({'timestamp': x.ts, 'symbol': x.sym, 'timeframe': x.tf}).duplicated(
+            keep='last'
+        ).to_numpy()
+        duplicate_count = int(duplicated.sum())
         
         if duplicate_count > 0:
             logger.warning("Duplicate timestamps found", count=duplicate_count)
-            df = df.drop_duplicates(subset=['timestamp', 'symbol', 'timeframe'], keep='last')
+            x = x.take(~duplicated)
         
-        return df, duplicate_count
+        return x, duplicate_count
     
-    def _validate_timestamps(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
-        """Validate timestamp consistency."""
-        issues = {}
+    def _validate_timestamps(self, x: OHLCVArrays, now: pd.Timestamp) -> Tuple[OHLCVArrays, dict]:
+        """Validate timestamp consistency.
         
-        if 'timestamp' not in df.columns:
-            return df, issues
+        Future, ordering and gap checks all run over one int64 nanosecond
+        view of the timestamps, sharing a single diff array.
+        """
+        issues = {}
         
         # Check for future timestamps
-        now = datetime.now(timezone.utc)
-        future_count = (df['timestamp'] > now).sum()
+        ts = x.ts.view(np.int64)
+        future = ts > now.value
+        future_count = int(future.sum())
         if future_count > 0:
             logger.warning("Future timestamps detected", count=future_count)
-            df = df[df['timestamp'] <= now]
+            x = x.take(~future)
+            ts = x.ts.view(np.int64)
             issues['future_timestamps'] = future_count
         
         # Check timestamp ordering
-        if not df['timestamp'].is_monotonic_increasing:
+        time_diffs = np.diff(ts)
+        if (time_diffs < 0).any():
             logger.warning("Timestamps not in order, sorting")
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            x = x.take(np.argsort(ts, kind='stable'))
+            time_diffs = np.diff(x.ts.view(np.int64))
             issues['unsorted'] = True
         
         # Check for large gaps
-        if len(df) > 1:
-            time_diffs = df['timestamp'].diff()
-            median_diff = time_diffs.median()
-            large_gaps = (time_diffs > median_diff * 3).sum()
+        if time_diffs.size:
+            large_gaps = int((time_diffs > _median(time_diffs) * 3).sum())
             if large_gaps > 0:
                 logger.warning("Large time gaps detected", count=large_gaps)
                 issues['large_gaps'] = large_gaps
         
-        return df, issues
+        return x, issues
     
-    def _detect_outliers(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, dict]:
+    def _detect_outliers(self, x: OHLCVArrays) -> Tuple[OHLCVArrays, dict]:
         """Detect and handle outliers using IQR method."""
-        outlier_stats = {}
+        if not len(x):
+            return x, {}
         
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            if col not in df.columns:
-                continue
-            
-            # Calculate IQR
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            # Define outlier bounds
-            lower_bound = Q1 - 3 * IQR
-            upper_bound = Q3 + 3 * IQR
-            
-            # Count outliers
-            outliers = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            outlier_stats[col] = outliers
-            
-            if outliers > 0:
-                logger.warning(f"Outliers in {col}", count=outliers, bounds=(lower_bound, upper_bound))
-                
-                # Cap outliers instead of removing
-                df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
+        values = np.vstack([getattr(x, attr) for _, attr in OHLCVArrays.FIELDS])
+        
+        # Calculate IQR for all columns in one quantile pass
+        q1, q3 = np.quantile(values, [0.25, 0.75], axis=1)
+        iqr = q3 - q1
+        
+        # Define outlier bounds, one per column
+        lower_bound = (q1 - 3 * iqr)[:, None]
+        upper_bound = (q3 + 3 * iqr)[:, None]
+        
+        # Count outliers
+        outlier_counts = ((values < lower_bound) | (values > upper_bound)).sum(axis=1)
+        outlier_stats = {col: int(count) for (col, _), count in zip(OHLCVArrays.FIELDS, outlier_counts)}
+        
+        for i, (col, _) in enumerate(OHLCVArrays.FIELDS):
+            if outlier_counts[i]:
+                logger.warning(f"Outliers in {col}", count=outlier_stats[col],
+                               bounds=(lower_bound[i, 0], upper_bound[i, 0]))
         
-        return df, outlier_stats
+        if outlier_counts.any():
+            # Cap outliers instead of removing
+            np.clip(values, lower_bound, upper_bound, out=values)
+            for row, (_, attr) in zip(values, OHLCVArrays.FIELDS):
+                setattr(x, attr, row)
+        
+        return x, outlier_stats
     
-    def _validate_ohlc(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    def _validate_ohlc(self, x: OHLCVArrays) -> Tuple[OHLCVArrays, int]:
         """Validate OHLC relationships (High >= Low, etc.)."""
         errors = 0
+        o, h, l, c = x.o, x.h, x.l, x.c
         
         # Check High >= Low
-        invalid_hl = df['high'] < df['low']
-        if invalid_hl.any():
-            error_count = invalid_hl.sum()
-            errors += error_count
-            logger.warning("Invalid High/Low relationship", count=error_count)
+        swap = h < l
+        swap_count = int(swap.sum())
+        if swap_count:
+            errors += swap_count
+            logger.warning("Invalid High/Low relationship", count=swap_count)
             # Fix by swapping
-            df.loc[invalid_hl, ['high', 'low']] = df.loc[invalid_hl, ['low', 'high']].values
+            h[swap], l[swap] = l[swap], h[swap]
         
         # Check Open, Close within High/Low range
-        invalid_open = (df['open'] > df['high']) | (df['open'] < df['low'])
-        invalid_close = (df['close'] > df['high']) | (df['close'] < df['low'])
+        open_count = int(((o > h) | (o < l)).sum())
+        close_count = int(((c > h) | (c < l)).sum())
         
-        if invalid_open.any():
-            error_count = invalid_open.sum()
-            errors += error_count
-            logger.warning("Open price outside High/Low range", count=error_count)
-            df.loc[invalid_open, 'open'] = df.loc[invalid_open, 'close']
+        if open_count:
+            errors += open_count
+            logger.warning("Open price outside High/Low range", count=open_count)
+            np.clip(o, l, h, out=o)
         
-        if invalid_close.any():
-            error_count = invalid_close.sum()
-            errors += error_count
-            logger.warning("Close price outside High/Low range", count=error_count)
-            # Clip to range
-            df.loc[invalid_close, 'close'] = df.loc[invalid_close, 'close'].clip(
-                lower=df.loc[invalid_close, 'low'],
-                upper=df.loc[invalid_close, 'high']
-            )
+        if close_count:
+            errors += close_count
+            logger.warning("Close price outside High/Low range", count=close_count)
+            np.clip(c, l, h, out=c)
         
         # Check for zero or negative prices
-        price_cols = ['open', 'high', 'low', 'close']
-        invalid_prices = (df[price_cols] <= 0).any(axis=1)
-        if invalid_prices.any():
-            error_count = invalid_prices.sum()
+        invalid_prices = (o <= 0) | (h <= 0) | (l <= 0) | (c <= 0)
+        error_count = int(invalid_prices.sum())
+        if error_count:
             errors += error_count
             logger.warning("Zero or negative prices", count=error_count)
-            df = df[~invalid_prices]
+            x = x.take(~invalid_prices)
         
-        return df, errors
+        return x, errors
     
-    def _validate_volume(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    def _validate_volume(self, x: OHLCVArrays) -> Tuple[OHLCVArrays, int]:
         """Validate volume data."""
-        anomalies = 0
+        if not len(x):
+            return x, 0
+        
+        volume, median_vol, neg_count, high_count = _volume_stats(x.v)
+        anomalies = int(neg_count) + int(high_count)
         
         # Check for negative volume
-        negative_vol = df['volume'] < 0
-        if negative_vol.any():
-            count = negative_vol.sum()
-            anomalies += count
-            logger.warning("Negative volume detected", count=count)
-            df.loc[negative_vol, 'volume'] = 0
+        if neg_count:
+            logger.warning("Negative volume detected", count=int(neg_count))
         
         # Check for extremely high volume (> 10x median)
-        median_vol = df['volume'].median()
-        if median_vol > 0:
-            high_vol = df['volume'] > (median_vol * 10)
-            if high_vol.any():
-                count = high_vol.sum()
-                anomalies += count
-                logger.warning("Extremely high volume", count=count)
-                # Cap at 10x median
-                df.loc[high_vol, 'volume'] = median_vol * 10
-        
-        return df, anomalies
+        if high_count:
+            logger.warning("Extremely high volume", count=int(high_count))
+            # Cap at 10x median
+            volume = np.minimum(volume, median_vol * 10)
+        
+        x.v = volume
+        
+        return x, anomalies
     
     def _calculate_quality_score(self, metrics: dict) -> float:
         """Calculate overall data quality score (0-100).
@@ -248,33 +401,14 @@ class DataValidator:
         if metrics.get('original_count', 0) == 0:
             return 0.0
         
-        original = metrics['original_count']
-        final = metrics['final_count']
-        
-        # Base score from data retention
-        retention_score = (final / original) * 100
-        
-        # Penalties for issues
-        penalties = 0
-        
-        # Missing data penalty
-        missing_total = sum(metrics.get('missing_data', {}).values())
-        penalties += min((missing_total / original) * 20, 10)
-        
-        # Outlier penalty
-        outlier_total = sum(metrics.get('outliers', {}).values())
-        penalties += min((outlier_total / original) * 10, 5)
-        
-        # OHLC error penalty
-        ohlc_errors = metrics.get('ohlc_errors', 0)
-        penalties += min((ohlc_errors / original) * 15, 10)
-        
-        # Volume anomaly penalty
-        volume_anomalies = metrics.get('volume_anomalies', 0)
-        penalties += min((volume_anomalies / original) * 5, 5)
-        
-        # Calculate final score
-        score = max(retention_score - penalties, 0)
+        score = _quality_score(
+            float(metrics['original_count']),
+            float(metrics['final_count']),
+            float(sum(metrics.get('missing_data', {}).values())),
+            float(sum(metrics.get('outliers', {}).values())),
+            float(metrics.get('ohlc_errors', 0)),
+            float(metrics.get('volume_anomalies', 0))
+        )
         
         return round(score, 2)
 
@@ -1,78 +1,272 @@
 """Delta Exchange API client for fetching market data."""
 
+import asyncio
 import hashlib
 import hmac
+import json
+import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
 
 from src.core.config import settings
 from src.core.logger import logger, get_component_logger
 from src.utils.retry import retry_with_backoff
 
+# Methods and endpoints come from a small fixed set; encode each only once
+_encode_cached = lru_cache(maxsize=128)(str.encode)
+
+# Numeric/legacy resolution codes -> API resolution strings
+_RES_NORMALIZE = {
+    '1': '1m', '3': '3m', '5': '5m', '15': '15m', '30': '30m',
+    '60': '1h', '120': '2h', '240': '4h', '360': '6h',
+    '1440': '1d', '1D': '1d'
+}
+
+# Candle duration in seconds per resolution
+_RES_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '1d': 86400
+}
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+_PRICE_GETTER = itemgetter(*PRICE_FIELDS)
+
+
+def _decode_json(content: bytes) -> Any:
+    """Parse a raw response body (orjson when available).
+    
+    Decoding the bytes directly skips requests' charset sniffing and str
+    decode. Errors surface as requests' JSONDecodeError so retry and
+    logging treat them like response.json() failures.
+    """
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
 
 class DeltaExchangeClient:
     """Client for interacting with Delta Exchange API."""
     
-    def __init__(self):
+    RATE_LIMIT_THRESHOLD = 2  # Hold new requests once this few remain in the window
+    
+    # Signing-path callables bound at class scope
+    _sha256 = hashlib.sha256
+    _clock = staticmethod(time.time)
+    
+    def __init__(self, ticker_cache_ttl: float = 0.5):
         # Initialize component logger
         self.logger = get_component_logger("delta_client")
         
         self.api_key = settings.delta_api_key
         self.api_secret = settings.delta_api_secret
+        self.api_secret_bytes = self.api_secret.encode()
+        # Keyed HMAC template: the ipad/opad key setup is done once and each
+        # signature starts from a copy. Copies are taken under a lock since
+        # the client is shared across sync worker threads.
+        self._hmac_template = hmac.new(self.api_secret_bytes, None, self._sha256)
+        self._hmac_lock = threading.Lock()
         self.base_url = settings.delta_api_url
         self.session = requests.Session()
         
+        # Single-host client: keep enough keep-alive connections for parallel
+        # syncs. Retries are left to retry_with_backoff on _make_request.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, pool_block=False, max_retries=Retry(total=0))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # ACCEPT_ENCODING advertises br/zstd only when brotli/zstandard are
+        # installed for urllib3 to decode them; candle JSON compresses well
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": "kubera/1.0",
+            "Accept-Encoding": ACCEPT_ENCODING
+        })
+        
+        # Rate-limit state from the last response headers, shared by all
+        # worker threads; None means no limit is currently known
+        self._rl_remaining: Optional[int] = None
+        self._rl_reset = 0.0
+        self._rl_condition = threading.Condition()
+        
+        # Per-instance ticker cache: symbol -> (expires_at monotonic, ticker data)
+        self.ticker_cache_ttl = ticker_cache_ttl
+        self._ticker_cache: Dict[str, tuple] = {}
+        
+        # Signed requests for parameterless authenticated endpoints, reused
+        # while their signature timestamp (whole seconds) is current:
+        # (method, endpoint) -> (timestamp, PreparedRequest)
+        self._prepared_auth: Dict[tuple, tuple] = {}
+        
+        # Keep-alive aiohttp session for the async request path; opened by
+        # start_async_session() from inside the running event loop
+        self._async_session = None
+        
         self.logger.info("initialization", "Delta Exchange client initialized", {"base_url": self.base_url})
         
     def _generate_signature(self, method: str, endpoint: str, payload: str = "") -> str:
         """Generate HMAC signature for authenticated requests."""
-        timestamp = str(int(time.time()))
-        signature_data = method + timestamp + endpoint + payload
-        signature = hmac.new(
-            self.api_secret.encode(),
-            signature_data.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        timestamp = str(int(self._clock()))
+        signature_data = b''.join((
+            _encode_cached(method),
+            timestamp.encode(),
+            _encode_cached(endpoint),
+            payload.encode()
+        ))
+        with self._hmac_lock:
+            mac = self._hmac_template.copy()
+        mac.update(signature_data)
+        signature = mac.hexdigest()
         return signature, timestamp
     
+    def _await_rate_limit(self):
+        """Block until the rate-limit window allows another request."""
+        with self._rl_condition:
+            while self._rl_remaining is not None and self._rl_remaining < self.RATE_LIMIT_THRESHOLD:
+                delay = self._rl_reset - self._clock()
+                if delay <= 0:
+                    # Window has reset; the next response refreshes the counters
+                    self._rl_remaining = None
+                    break
+                logger.debug("Waiting for rate limit reset", seconds=round(delay, 3))
+                self._rl_condition.wait(delay)
+            
+            if self._rl_remaining is not None:
+                # Reserve a slot so concurrent workers don't all pass the gate
+                self._rl_remaining -= 1
+    
+    def _update_rate_limit(self, headers, status: int = 200):
+        """Record X-RateLimit-Remaining / X-RateLimit-Reset from a response.
+        
+        The reset header is the time left in the current window in
+        milliseconds, so it is stored as a deadline on ``_clock``. A 429
+        response closes the window until that deadline whatever the
+        remaining count says, so the retry waits for the reset.
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if status == 429:
+            remaining = 0
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining, reset_ms = int(remaining), float(reset)
+        except ValueError:
+            return
+        
+        with self._rl_condition:
+            self._rl_remaining = remaining
+            self._rl_reset = self._clock() + reset_ms / 1000.0
+            self._rl_condition.notify_all()
+    
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait before the next request, reserving a slot when none is needed.
+        
+        Non-blocking counterpart of ``_await_rate_limit`` for the async path.
+        """
+        with self._rl_condition:
+            if self._rl_remaining is None:
+                return 0.0
+            if self._rl_remaining < self.RATE_LIMIT_THRESHOLD:
+                delay = self._rl_reset - self._clock()
+                if delay > 0:
+                    return delay
+                self._rl_remaining = None
+                return 0.0
+            self._rl_remaining -= 1
+            return 0.0
+    
+    def _prepare_authenticated(self, method: str, endpoint: str, url: str,
+                               params: Optional[Dict] = None) -> requests.PreparedRequest:
+        """Build a signed request, reusing one signed within the current second."""
+        key = (method, endpoint)
+        if params is None:
+            cached = self._prepared_auth.get(key)
+            if cached is not None and cached[0] == int(self._clock()):
+                return cached[1]
+        
+        payload = ""
+        signature, timestamp = self._generate_signature(method, endpoint, payload)
+        prepared = self.session.prepare_request(requests.Request(
+            method=method,
+            url=url,
+            params=params,
+            headers={
+                "api-key": self.api_key,
+                "signature": signature,
+                "timestamp": timestamp
+            }
+        ))
+        
+        if params is None:
+            self._prepared_auth[key] = (int(timestamp), prepared)
+        return prepared
+    
     @retry_with_backoff(max_retries=3, initial_delay=1.0, exceptions=(RequestException, ConnectionError))
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        authenticated: bool = False
-    ) -> Dict:
-        """Make HTTP request to Delta Exchange API with automatic retry."""
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
+        authenticated: bool = False,
+        parse: Callable[[bytes], Any] = _decode_json
+    ) -> Any:
+        """Make HTTP request to Delta Exchange API with automatic retry.
         
-        if authenticated:
-            payload = ""
-            signature, timestamp = self._generate_signature(method, endpoint, payload)
-            headers.update({
-                "api-key": self.api_key,
-                "signature": signature,
-                "timestamp": timestamp
-            })
+        ``parse`` receives the raw response bytes; by default they are
+        decoded as JSON. Parsing runs inside the retry scope, so a truncated
+        body is retried like a transport error.
+        """
+        url = f"{self.base_url}{endpoint}"
         
         try:
+            self._await_rate_limit()
             logger.debug(f"API request", method=method, endpoint=endpoint)
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=headers,
-                timeout=10
-            )
+            if authenticated:
+                prepared = self._prepare_authenticated(method, endpoint, url, params)
+                response = self.session.send(
+                    prepared,
+                    timeout=10,
+                    **self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+                )
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    timeout=10
+                )
+            self._update_rate_limit(response.headers, response.status_code)
             response.raise_for_status()
             logger.debug(f"API request successful", endpoint=endpoint, status=response.status_code)
-            return response.json()
+            return parse(response.content)
         except RequestException as e:
             logger.error("API request failed", error=str(e), endpoint=endpoint, url=url)
             raise
@@ -84,7 +278,8 @@ class DeltaExchangeClient:
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         limit: int = 500,
-        use_pagination: bool = True
+        use_pagination: bool = True,
+        dtype: str = 'float64'
     ) -> pd.DataFrame:
         """Fetch OHLC candlestick data with automatic pagination.
         
@@ -95,6 +290,8 @@ class DeltaExchangeClient:
             end: End datetime
             limit: Maximum number of candles to fetch (may require multiple API calls)
             use_pagination: If True, automatically paginate to fetch more than 2000 candles
+            dtype: Float dtype for the OHLCV columns; 'float32' halves memory
+                for consumers that don't need full price precision
             
         Returns:
             DataFrame with OHLC data
@@ -104,30 +301,26 @@ class DeltaExchangeClient:
             Set use_pagination=True to automatically fetch more data.
         """
         request_start_time = time.time()
-        self.logger.info("api_request", f"Fetching OHLC candles for {symbol}", {
-            "symbol": symbol,
-            "resolution": resolution,
-            "limit": limit,
-            "use_pagination": use_pagination
-        })
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("api_request", f"Fetching OHLC candles for {symbol}", {
+                "symbol": symbol,
+                "resolution": resolution,
+                "limit": limit,
+                "use_pagination": use_pagination
+            })
         
         # Ensure resolution is in string format (Delta Exchange India requires this)
-        # Convert numeric to string if needed
-        resolution_map = {
-            '1': '1m', '3': '3m', '5': '5m', '15': '15m', '30': '30m',
-            '60': '1h', '120': '2h', '240': '4h', '360': '6h',
-            '1440': '1d', '1D': '1d'
-        }
-        resolution = resolution_map.get(resolution, resolution)
-        
-        # Ensure resolution is lowercase for consistency
-        resolution = resolution.lower()
+        # and lowercase for consistency
+        resolution = _RES_NORMALIZE.get(resolution, resolution).lower()
         
         params = {
             'resolution': resolution,
             'symbol': symbol,
         }
         
+        # Candle duration, used for the default window and pagination batches
+        candle_seconds = _RES_SECONDS.get(resolution, 86400)
+        
         # Get current timestamp
         current_time = int(time.time())
         
@@ -157,17 +350,7 @@ class DeltaExchangeClient:
             params['start'] = start_timestamp
         else:
             # Default to last 'limit' candles
-            if resolution == '1d':
-                start = datetime.now(timezone.utc) - timedelta(days=limit)
-            else:
-                # Extract minutes from resolution string
-                if 'm' in resolution:
-                    minutes = int(resolution.replace('m', ''))
-                elif 'h' in resolution:
-                    minutes = int(resolution.replace('h', '')) * 60
-                else:
-                    minutes = 1440
-                start = datetime.now(timezone.utc) - timedelta(minutes=minutes * limit)
+            start = datetime.now(timezone.utc) - timedelta(seconds=candle_seconds * limit)
             params['start'] = int(start.timestamp())
         
         try:
@@ -176,7 +359,8 @@ class DeltaExchangeClient:
             # Delta Exchange returns max ~2000 candles per request
             # If limit > 2000 and use_pagination=True, fetch in batches
             MAX_CANDLES_PER_REQUEST = 2000
-            all_candles = []
+            # Response bodies go straight from bytes to column arrays
+            parse_batch = partial(self._parse_candle_batch, dtype=dtype)
             
             if use_pagination and limit > MAX_CANDLES_PER_REQUEST:
                 logger.info(f"Fetching {limit} candles with pagination", 
@@ -184,99 +368,107 @@ class DeltaExchangeClient:
                 
                 # Calculate number of batches needed
                 batches_needed = (limit + MAX_CANDLES_PER_REQUEST - 1) // MAX_CANDLES_PER_REQUEST
-                current_end = params['end']
                 
+                # Batch windows are fixed by the candle duration, so all of them
+                # can be requested at once, newest first
+                window = MAX_CANDLES_PER_REQUEST * candle_seconds
+                batch_windows = []
                 for batch in range(batches_needed):
-                    batch_params = params.copy()
-                    batch_params['end'] = current_end
-                    
-                    response = self._make_request("GET", endpoint, params=batch_params)
-                    
-                    if not response.get('success') or not response.get('result'):
-                        logger.warning("No more candle data available", 
-                                     symbol=symbol, batch=batch+1)
-                        break
-                    
-                    batch_candles = response['result']
-                    if not batch_candles:
-                        break
-                        
-                    all_candles.extend(batch_candles)
-                    
-                    # Update end time to earliest timestamp from this batch for next iteration
-                    if batch_candles:
-                        earliest_time = min(c['time'] for c in batch_candles)
-                        current_end = earliest_time - 1  # Go 1 second earlier
-                    
-                    # Stop if we have enough candles
-                    if len(all_candles) >= limit:
+                    batch_end = params['end'] - batch * window
+                    if batch_end < params['start']:
                         break
-                    
-                    # Respect rate limits - small delay between requests
-                    if batch < batches_needed - 1:
-                        time.sleep(0.2)  # 200ms delay
+                    batch_windows.append({
+                        **params,
+                        'start': max(params['start'], batch_end - window + 1),
+                        'end': batch_end
+                    })
+                
+                def fetch_batch(batch_params: Dict) -> Optional[Dict[str, np.ndarray]]:
+                    return self._make_request("GET", endpoint, params=batch_params, parse=parse_batch)
+                
+                # Shares the session's keep-alive pool; HTTP 429s are retried
+                # by _make_request's backoff
+                with ThreadPoolExecutor(max_workers=max(1, min(8, len(batch_windows)))) as executor:
+                    results = list(executor.map(fetch_batch, batch_windows))
                 
-                candles = all_candles[:limit]  # Trim to requested limit
+                batch_columns = [columns for columns in results if columns is not None]
+                if len(batch_columns) < len(results):
+                    logger.warning("No candle data for some batches",
+                                 symbol=symbol, empty=len(results) - len(batch_columns))
+                
+                # Concatenate once, oldest batch first so the result is
+                # already in time order when each batch is
+                batch_columns.reverse()
+                columns = {
+                    field: np.concatenate([batch[field] for batch in batch_columns])
+                    for field in batch_columns[0]
+                } if batch_columns else {}
+                keep = limit  # Trimmed to the newest 'limit' candles once ordered
             else:
                 # Single request for <= 2000 candles
-                response = self._make_request("GET", endpoint, params=params)
+                columns = self._make_request("GET", endpoint, params=params, parse=parse_batch)
                 
-                if not response.get('success') or not response.get('result'):
+                if columns is None:
                     logger.warning("No candle data returned", symbol=symbol, resolution=resolution)
                     return pd.DataFrame()
                 
-                candles = response['result']
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(candles)
+                keep = None
             
-            if df.empty:
+            if not columns:
                 duration_ms = (time.time() - request_start_time) * 1000
                 self.logger.warning("api_response", f"No candles returned for {symbol}", {
                     "symbol": symbol,
                     "resolution": resolution,
                     "duration_ms": duration_ms
                 })
-                return df
-            
-            # Rename columns
-            column_map = {
-                'time': 'timestamp',
-                'open': 'open',
-                'high': 'high',
-                'low': 'low',
-                'close': 'close',
-                'volume': 'volume'
-            }
-            df = df.rename(columns=column_map)
+                return pd.DataFrame()
             
-            # Convert timestamp to datetime
-            if df['timestamp'].dtype == 'object':
-                # If timestamp is already a datetime string, parse it directly
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Build the frame from per-column arrays rather than row dicts
+            timestamps = columns.pop('timestamp')
+            if timestamps.dtype == np.int64:
+                # Unix seconds: a dtype cast, no per-element parsing
+                timestamps = pd.DatetimeIndex(timestamps.astype('datetime64[s]').astype('datetime64[ns]'))
             else:
-                # If timestamp is numeric (seconds since epoch), convert with unit='s'
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+                # If timestamp is already a datetime string, parse it directly
+                timestamps = pd.to_datetime(timestamps, cache=True)
             
-            # Add symbol and timeframe
-            df['symbol'] = symbol
-            df['timeframe'] = resolution
+            # Order by timestamp: usually already ascending, or descending and
+            # reversed with a view; only fully unordered data gets sorted
+            order = None
+            if not timestamps.is_monotonic_increasing:
+                if timestamps.is_monotonic_decreasing:
+                    order = slice(None, None, -1)
+                else:
+                    order = np.argsort(timestamps.asi8, kind='stable')
+            if order is not None:
+                timestamps = timestamps[order]
+                columns = {field: values[order] for field, values in columns.items()}
             
-            # Select and order columns
-            df = df[['timestamp', 'symbol', 'timeframe', 'open', 'high', 'low', 'close', 'volume']]
+            if keep is not None and len(timestamps) > keep:
+                timestamps = timestamps[-keep:]
+                columns = {field: values[-keep:] for field, values in columns.items()}
             
-            # Sort by timestamp
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            # symbol/timeframe are constant per call: one-category Categoricals
+            # store int8 codes instead of a pointer per row
+            codes = np.zeros(len(timestamps), dtype=np.int8)
+            df = pd.DataFrame({
+                'timestamp': timestamps,
+                'symbol': pd.Categorical.from_codes(codes, categories=[symbol]),
+                'timeframe': pd.Categorical.from_codes(codes, categories=[resolution]),
+                **columns
+            }, copy=False)
             
             duration_ms = (time.time() - request_start_time) * 1000
-            self.logger.info("api_response", f"Successfully fetched candles for {symbol}", {
-                "symbol": symbol,
-                "resolution": resolution,
-                "count": len(df),
-                "start": df['timestamp'].min().isoformat() if not df.empty else None,
-                "end": df['timestamp'].max().isoformat() if not df.empty else None,
-                "duration_ms": duration_ms
-            })
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("api_response", f"Successfully fetched candles for {symbol}", {
+                    "symbol": symbol,
+                    "resolution": resolution,
+                    "count": len(df),
+                    # Frame is sorted, so the range is its first and last row
+                    "start": df['timestamp'].iloc[0].isoformat() if not df.empty else None,
+                    "end": df['timestamp'].iloc[-1].isoformat() if not df.empty else None,
+                    "duration_ms": duration_ms
+                })
             
             return df
             
@@ -290,18 +482,48 @@ class DeltaExchangeClient:
             }, error=e)
             return pd.DataFrame()
     
+    def _parse_candle_batch(self, content: bytes, dtype: str = 'float64') -> Optional[Dict[str, np.ndarray]]:
+        """Decode a candle response body into column arrays; None if it has no candles."""
+        response = _decode_json(content)
+        if not response.get('success') or not response.get('result'):
+            return None
+        return self._candle_columns(response['result'], dtype)
+    
+    def _candle_columns(self, candles: List[Dict], dtype: str = 'float64') -> Dict[str, np.ndarray]:
+        """Split API candle dicts into one array per output column (timestamp + OHLCV)."""
+        times = [c['time'] for c in candles]
+        try:
+            # Unix seconds
+            times = np.array(times, dtype=np.int64)
+        except (TypeError, ValueError):
+            # ISO strings, parsed once the batches are combined
+            times = np.array(times, dtype=object)
+        prices = np.array(list(map(_PRICE_GETTER, candles)), dtype=dtype).reshape(len(candles), len(PRICE_FIELDS))
+        
+        columns = {'timestamp': times}
+        columns.update((field, np.ascontiguousarray(prices[:, i])) for i, field in enumerate(PRICE_FIELDS))
+        return columns
+    
     def get_ticker(self, symbol: str) -> Dict:
         """Get current ticker data for a symbol.
         
+        Successful lookups are reused for ``ticker_cache_ttl`` seconds so
+        back-to-back calls for the same symbol skip the API round trip.
+        
         Args:
             symbol: Trading symbol
             
         Returns:
             Ticker data dictionary
         """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             request_start_time = time.time()
-            self.logger.info("api_request", f"Fetching ticker for {symbol}", {"symbol": symbol})
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("api_request", f"Fetching ticker for {symbol}", {"symbol": symbol})
             
             endpoint = f"/v2/tickers/{symbol}"
             response = self._make_request("GET", endpoint)
@@ -310,12 +532,15 @@ class DeltaExchangeClient:
             
             if response.get('success') and response.get('result'):
                 ticker_data = response['result']
-                self.logger.info("api_response", f"Successfully fetched ticker for {symbol}", {
-                    "symbol": symbol,
-                    "price": ticker_data.get('close', 0),
-                    "volume": ticker_data.get('volume', 0),
-                    "duration_ms": duration_ms
-                })
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("api_response", f"Successfully fetched ticker for {symbol}", {
+                        "symbol": symbol,
+                        "price": ticker_data.get('close', 0),
+                        "volume": ticker_data.get('volume', 0),
+                        "duration_ms": duration_ms
+                    })
+                if self.ticker_cache_ttl > 0:
+                    self._ticker_cache[symbol] = (time.monotonic() + self.ticker_cache_ttl, ticker_data)
                 return ticker_data
             else:
                 self.logger.warning("api_response", f"No ticker data for {symbol}", {
@@ -333,6 +558,137 @@ class DeltaExchangeClient:
             }, error=e)
             return {}
     
+    @property
+    def has_async_session(self) -> bool:
+        """Whether the async request path is available."""
+        return self._async_session is not None and not self._async_session.closed
+    
+    async def start_async_session(self) -> None:
+        """Open the keep-alive aiohttp session used by the async methods.
+        
+        Must be called from inside the event loop that will use it. Does
+        nothing when aiohttp is not installed; callers then stay on the
+        synchronous methods.
+        """
+        if not HAS_AIOHTTP or self.has_async_session:
+            return
+        
+        self._async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+            headers={"User-Agent": "kubera/1.0"},
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        self.logger.info("initialization", "Async HTTP session opened", {"base_url": self.base_url})
+    
+    async def close_async_session(self) -> None:
+        """Close the aiohttp session opened by ``start_async_session``."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+    
+    async def get_ticker_async(self, symbol: str) -> Dict:
+        """Get current ticker data for a symbol without leaving the event loop.
+        
+        Shares the ticker cache and rate-limit state with ``get_ticker``.
+        Unlike ``get_ticker``, transport errors (``aiohttp.ClientError``,
+        ``asyncio.TimeoutError``) are raised so the caller's retry policy
+        applies; a response without data returns an empty dict.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Ticker data dictionary
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        delay = self._rate_limit_delay()
+        if delay > 0:
+            logger.debug("Waiting for rate limit reset", seconds=round(delay, 3))
+            await asyncio.sleep(delay)
+        
+        request_start_time = time.time()
+        endpoint = f"/v2/tickers/{symbol}"
+        async with self._async_session.get(f"{self.base_url}{endpoint}") as response:
+            self._update_rate_limit(response.headers, response.status)
+            response.raise_for_status()
+            body = _json_loads(await response.read())
+        duration_ms = (time.time() - request_start_time) * 1000
+        
+        if body.get('success') and body.get('result'):
+            ticker_data = body['result']
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("api_response", f"Successfully fetched ticker for {symbol}", {
+                    "symbol": symbol,
+                    "price": ticker_data.get('close', 0),
+                    "volume": ticker_data.get('volume', 0),
+                    "duration_ms": duration_ms
+                })
+            if self.ticker_cache_ttl > 0:
+                self._ticker_cache[symbol] = (time.monotonic() + self.ticker_cache_ttl, ticker_data)
+            return ticker_data
+        
+        self.logger.warning("api_response", f"No ticker data for {symbol}", {
+            "symbol": symbol,
+            "duration_ms": duration_ms
+        })
+        return {}
+    
+    def get_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get ticker data for several symbols with a single API call.
+        
+        Fetches ``/v2/tickers`` once and indexes it by symbol; the results
+        also refresh the ``get_ticker`` cache. If every requested symbol is
+        already cached, no request is made.
+        
+        Args:
+            symbols: Symbols to return; None returns every listed ticker
+            
+        Returns:
+            Dictionary of symbol -> ticker data (symbols without data are omitted)
+        """
+        if symbols is not None:
+            now = time.monotonic()
+            cached = {symbol: self._ticker_cache.get(symbol) for symbol in symbols}
+            if all(entry is not None and entry[0] > now for entry in cached.values()):
+                return {symbol: entry[1] for symbol, entry in cached.items()}
+        
+        try:
+            request_start_time = time.time()
+            response = self._make_request("GET", "/v2/tickers")
+            duration_ms = (time.time() - request_start_time) * 1000
+            
+            if not response.get('success') or not response.get('result'):
+                self.logger.warning("api_response", "No ticker data returned", {"duration_ms": duration_ms})
+                return {}
+            
+            tickers = {ticker['symbol']: ticker for ticker in response['result'] if 'symbol' in ticker}
+            
+            if self.ticker_cache_ttl > 0:
+                expires_at = time.monotonic() + self.ticker_cache_ttl
+                self._ticker_cache.update((symbol, (expires_at, ticker)) for symbol, ticker in tickers.items())
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("api_response", "Successfully fetched tickers", {
+                    "count": len(tickers),
+                    "duration_ms": duration_ms
+                })
+            
+            if symbols is None:
+                return tickers
+            return {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+            
+        except Exception as e:
+            duration_ms = (time.time() - request_start_time) * 1000
+            self.logger.error("api_error", "Failed to fetch tickers", {
+                "symbols": symbols,
+                "error": str(e),
+                "duration_ms": duration_ms
+            }, error=e)
+            return {}
+    
     def get_account_balance(self) -> Dict:
         """Get account balance (for authenticated requests).
         
@@ -1,6 +1,6 @@
 """Feature engineering module for creating technical indicators."""
 
-from typing import List
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -8,11 +8,16 @@ import talib
 
 from src.core.config import trading_config
 from src.core.logger import logger
+from src.data._fe_kernels import derived_features, multi_ema, multi_sma, rolling_std, vwap
 
 
 class FeatureEngineer:
     """Create technical indicators and features for ML models."""
     
+    LOOKBACK = 200  # Longest indicator period (SMA-200); rows before it are dropped as NaN
+    WARMUP = 250    # Rows recomputed ahead of new bars so EMA/RSI/ATR recursions settle
+    OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+    
     def __init__(self):
         self.config = trading_config.features
     
@@ -30,178 +35,275 @@ class FeatureEngineer:
             # Return empty DataFrame to prevent invalid predictions
             return pd.DataFrame()
         
-        df = df.copy()
-        
-        # Price-based features
-        df = self._add_moving_averages(df)
-        df = self._add_price_features(df)
-        
-        # Momentum indicators
-        df = self._add_momentum_indicators(df)
-        
-        # Volatility indicators
-        df = self._add_volatility_indicators(df)
-        
-        # Volume indicators
-        df = self._add_volume_indicators(df)
-        
-        # Derived features
-        df = self._add_derived_features(df)
+        # Indicators run on contiguous float64 arrays collected in a plain dict
+        arr = {col: np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in self.OHLCV_COLUMNS}
+        out: Dict[str, np.ndarray] = {}
         
-        # Drop NaN values (from indicator calculation)
-        df = df.dropna().reset_index(drop=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Price-based features
+            self._add_moving_averages(arr, out)
+            self._add_price_features(arr, out)
+            
+            # Momentum indicators
+            self._add_momentum_indicators(arr, out)
+            
+            # Volatility indicators
+            self._add_volatility_indicators(arr, out)
+            
+            # Volume indicators
+            self._add_volume_indicators(arr, out)
+            
+            # Derived features
+            self._add_derived_features(arr, out)
+        
+        # Drop NaN rows (from indicator calculation) with one in-place mask
+        # over the arrays rather than a dropna over the assembled frame
+        dropped = df.isna().any(axis=1).to_numpy()
+        nan = np.empty_like(dropped)
+        for values in out.values():
+            if values.dtype.kind == 'f':
+                np.logical_or(dropped, np.isnan(values, out=nan), out=dropped)
+        rows = np.flatnonzero(~dropped)
+        
+        # Kept rows are gathered straight into float32 (crossover flags are
+        # already int8); OHLCV keeps its input precision
+        features = {}
+        for name, values in out.items():
+            dtype = np.float32 if values.dtype == np.float64 else values.dtype
+            features[name] = values[rows].astype(dtype, copy=False)
+        
+        # One frame construction for the feature block rather than an insert per column
+        df = pd.concat([df.take(rows).reset_index(drop=True), pd.DataFrame(features)], axis=1)
         
         logger.info("Features created", total_features=len(df.columns), rows=len(df))
         
         return df
     
-    def _add_moving_averages(self, df: pd.DataFrame) -> pd.DataFrame:
+    def update_features(self, df: pd.DataFrame, previous: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Extend previously created features with newly arrived bars.
+        
+        Only the tail from the last cached bar onwards is recomputed, over a
+        ``WARMUP``-row slice, and spliced onto ``previous``. The last cached
+        bar is recomputed as well since it may have been in progress.
+        Cumulative features (VWAP, OBV, A/D) depend on where the window
+        starts, so they are recomputed over the whole of ``df``.
+        
+        Args:
+            df: Validated OHLC data sorted by timestamp
+            previous: Result of an earlier create_features call for the same series
+            
+        Returns:
+            DataFrame with features, or None if a full create_features call is needed
+        """
+        if df.empty or previous.empty:
+            return None
+        
+        timestamps = df['timestamp']
+        last_ts = previous['timestamp'].iloc[-1]
+        anchor = int(timestamps.searchsorted(last_ts))
+        if anchor >= len(df) or timestamps.iloc[anchor] != last_ts or anchor < self.WARMUP:
+            return None
+        
+        tail = self.create_features(df.iloc[anchor - self.WARMUP:])
+        if tail.empty:
+            return None
+        
+        # Keep the rows a full recompute over this window would still return
+        first_ts = timestamps.iloc[self.LOOKBACK - 1]
+        kept = previous[(previous['timestamp'] >= first_ts) & (previous['timestamp'] < last_ts)]
+        result = pd.concat([kept, tail[tail['timestamp'] >= last_ts]], ignore_index=True)
+        
+        positions = timestamps.searchsorted(result['timestamp'])
+        for col, values in self._cumulative_features(df).items():
+            if col in result.columns:
+                result[col] = values[positions].astype(np.float32)
+        
+        return result
+    
+    def _cumulative_features(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Compute the features that accumulate from the first row of the window."""
+        arr = {col: np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in self.OHLCV_COLUMNS}
+        features = {'vwap': self._vwap(arr)}
+        if self.config.get('obv_enabled', True):
+            features['obv'] = talib.OBV(arr['close'], arr['volume'])
+        features['ad'] = talib.AD(arr['high'], arr['low'], arr['close'], arr['volume'])
+        return features
+    
+    @staticmethod
+    def _vwap(arr: Dict[str, np.ndarray]) -> np.ndarray:
+        """Volume weighted average price from the start of the window."""
+        return vwap(arr['close'], arr['volume'], np.empty_like(arr['close']))
+    
+    def _add_moving_averages(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add Simple and Exponential Moving Averages."""
-        # SMA
-        for period in self.config.get('sma_periods', [10, 20, 50, 100, 200]):
-            df[f'sma_{period}'] = talib.SMA(df['close'], timeperiod=period)
+        close = arr['close']
         
-        # EMA
-        for period in self.config.get('ema_periods', [9, 12, 26, 50]):
-            df[f'ema_{period}'] = talib.EMA(df['close'], timeperiod=period)
+        # SMA, all periods in one sweep over close
+        sma_periods = np.asarray(self.config.get('sma_periods', [10, 20, 50, 100, 200]), dtype=np.int64)
+        smas = multi_sma(close, sma_periods, np.empty((len(sma_periods), len(close))))
+        for period, values in zip(sma_periods, smas):
+            out[f'sma_{period}'] = values
         
-        # VWAP (Volume Weighted Average Price)
-        df['vwap'] = (df['close'] * df['volume']).cumsum() / df['volume'].cumsum()
+        # EMA, all periods in one sweep over close
+        ema_periods = np.asarray(self.config.get('ema_periods', [9, 12, 26, 50]), dtype=np.int64)
+        emas = multi_ema(close, ema_periods, np.empty((len(ema_periods), len(close))))
+        for period, values in zip(ema_periods, emas):
+            out[f'ema_{period}'] = values
         
-        return df
+        # VWAP (Volume Weighted Average Price)
+        out['vwap'] = self._vwap(arr)
     
-    def _add_price_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_price_features(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add price-based features."""
+        high, low, close = arr['high'], arr['low'], arr['close']
+        
         # Price changes
-        df['price_change'] = df['close'].pct_change()
-        df['price_change_abs'] = df['close'].diff()
+        change = np.full_like(close, np.nan)
+        change[1:] = close[1:] - close[:-1]
+        out['price_change'] = np.concatenate(([np.nan], close[1:] / close[:-1] - 1))
+        out['price_change_abs'] = change
         
         # High-Low range
-        df['hl_range'] = df['high'] - df['low']
-        df['hl_range_pct'] = (df['high'] - df['low']) / df['close']
+        hl_range = high - low
+        out['hl_range'] = hl_range
+        out['hl_range_pct'] = hl_range / close
         
         # Close position in range
-        df['close_position'] = (df['close'] - df['low']) / (df['high'] - df['low'])
+        out['close_position'] = (close - low) / hl_range
         
         # Typical price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+        out['typical_price'] = (high + low + close) / 3
         
         # Bollinger Bands
         bb_period = self.config.get('bollinger_period', 20)
         bb_std = self.config.get('bollinger_std', 2)
-        df['bb_upper'], df['bb_middle'], df['bb_lower'] = talib.BBANDS(
-            df['close'],
-            timeperiod=bb_period,
-            nbdevup=bb_std,
-            nbdevdn=bb_std
-        )
-        df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
-        df['bb_position'] = (df['close'] - df['bb_lower']) / (df['bb_upper'] - df['bb_lower'])
-        
-        return df
+        # The middle band is the SMA already computed for the moving averages
+        bb_middle = out.get(f'sma_{bb_period}')
+        if bb_middle is None:
+            bb_middle = talib.SMA(close, timeperiod=bb_period)
+        bb_band = bb_std * talib.STDDEV(close, timeperiod=bb_period, nbdev=1)
+        bb_upper = bb_middle + bb_band
+        bb_lower = bb_middle - bb_band
+        out['bb_upper'], out['bb_middle'], out['bb_lower'] = bb_upper, bb_middle, bb_lower
+        out['bb_width'] = (bb_upper - bb_lower) / bb_middle
+        out['bb_position'] = (close - bb_lower) / (bb_upper - bb_lower)
     
-    def _add_momentum_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_momentum_indicators(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add momentum indicators."""
+        high, low, close = arr['high'], arr['low'], arr['close']
+        
         # RSI
         rsi_period = self.config.get('rsi_period', 14)
-        df['rsi'] = talib.RSI(df['close'], timeperiod=rsi_period)
+        out['rsi'] = talib.RSI(close, timeperiod=rsi_period)
         
         # MACD
         macd_fast = self.config.get('macd_fast', 12)
         macd_slow = self.config.get('macd_slow', 26)
         macd_signal = self.config.get('macd_signal', 9)
-        df['macd'], df['macd_signal'], df['macd_hist'] = talib.MACD(
-            df['close'],
-            fastperiod=macd_fast,
-            slowperiod=macd_slow,
-            signalperiod=macd_signal
-        )
+        # MACD from the EMAs already computed for the moving averages
+        ema_fast = out.get(f'ema_{macd_fast}')
+        if ema_fast is None:
+            ema_fast = talib.EMA(close, timeperiod=macd_fast)
+        ema_slow = out.get(f'ema_{macd_slow}')
+        if ema_slow is None:
+            ema_slow = talib.EMA(close, timeperiod=macd_slow)
+        macd = ema_fast - ema_slow
+        out['macd'] = macd
+        out['macd_signal'] = talib.EMA(macd, timeperiod=macd_signal)
+        out['macd_hist'] = macd - out['macd_signal']
         
         # Stochastic
         stoch_period = self.config.get('stoch_period', 14)
-        df['stoch_k'], df['stoch_d'] = talib.STOCH(
-            df['high'],
-            df['low'],
-            df['close'],
+        out['stoch_k'], out['stoch_d'] = talib.STOCH(
+            high,
+            low,
+            close,
             fastk_period=stoch_period,
             slowk_period=3,
             slowd_period=3
         )
         
         # Williams %R
-        df['willr'] = talib.WILLR(df['high'], df['low'], df['close'], timeperiod=14)
+        out['willr'] = talib.WILLR(high, low, close, timeperiod=14)
         
-        # Rate of Change
-        df['roc'] = talib.ROC(df['close'], timeperiod=10)
-        
-        # Momentum
-        df['momentum'] = talib.MOM(df['close'], timeperiod=10)
+        # Rate of Change and Momentum share the close from 10 bars back;
+        # same arithmetic as talib.ROC/talib.MOM without two more library calls
+        lagged = np.full_like(close, np.nan)
+        lagged[10:] = close[:-10]
+        out['roc'] = (close / lagged - 1) * 100
+        out['momentum'] = close - lagged
         
         # CCI (Commodity Channel Index)
-        df['cci'] = talib.CCI(df['high'], df['low'], df['close'], timeperiod=20)
-        
-        return df
+        out['cci'] = talib.CCI(high, low, close, timeperiod=20)
     
-    def _add_volatility_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_volatility_indicators(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add volatility indicators."""
+        high, low, close = arr['high'], arr['low'], arr['close']
+        
         # ATR (Average True Range)
         atr_period = self.config.get('atr_period', 14)
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=atr_period)
-        df['atr_pct'] = df['atr'] / df['close']
+        out['atr'] = talib.ATR(high, low, close, timeperiod=atr_period)
+        out['atr_pct'] = out['atr'] / close
         
         # NATR (Normalized ATR)
-        df['natr'] = talib.NATR(df['high'], df['low'], df['close'], timeperiod=atr_period)
+        out['natr'] = out['atr_pct'] * 100  # talib.NATR without recomputing the ATR
         
         # Historical volatility
-        df['volatility'] = df['price_change'].rolling(window=20).std()
-        
-        return df
+        out['volatility'] = rolling_std(out['price_change'], 20, np.empty_like(close))
     
-    def _add_volume_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_volume_indicators(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add volume indicators."""
+        high, low, close, volume = arr['high'], arr['low'], arr['close'], arr['volume']
+        
         if self.config.get('obv_enabled', True):
             # OBV (On-Balance Volume)
-            df['obv'] = talib.OBV(df['close'], df['volume'])
+            out['obv'] = talib.OBV(close, volume)
             
         # Volume SMA
         vol_period = self.config.get('volume_sma_period', 20)
-        df['volume_sma'] = talib.SMA(df['volume'], timeperiod=vol_period)
-        df['volume_ratio'] = df['volume'] / df['volume_sma']
+        out['volume_sma'] = talib.SMA(volume, timeperiod=vol_period)
+        out['volume_ratio'] = volume / out['volume_sma']
         
         # Money Flow Index
-        df['mfi'] = talib.MFI(df['high'], df['low'], df['close'], df['volume'], timeperiod=14)
+        out['mfi'] = talib.MFI(high, low, close, volume, timeperiod=14)
         
         # Accumulation/Distribution
-        df['ad'] = talib.AD(df['high'], df['low'], df['close'], df['volume'])
-        
-        return df
+        out['ad'] = talib.AD(high, low, close, volume)
     
-    def _add_derived_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_derived_features(self, arr: Dict[str, np.ndarray], out: Dict[str, np.ndarray]):
         """Add derived features and ratios."""
+        close = arr['close']
+        n = close.shape[0]
+        missing = np.full(n, np.nan)
+        inputs = [out.get(col, missing) for col in
+                  ('sma_20', 'sma_50', 'sma_200', 'rsi', 'macd', 'macd_signal', 'ema_12', 'ema_26')]
+        
+        price_to_sma = np.empty((3, n))
+        sma_diff = np.empty(n)
+        trend_strength = np.empty(n)
+        crosses = np.empty((4, n), dtype=np.int8)
+        derived_features(close, *inputs, price_to_sma, sma_diff, trend_strength, crosses)
+        
         # Price to MA ratios
-        for period in [20, 50, 200]:
-            if f'sma_{period}' in df.columns:
-                df[f'price_to_sma_{period}'] = df['close'] / df[f'sma_{period}']
+        for row, period in enumerate([20, 50, 200]):
+            if f'sma_{period}' in out:
+                out[f'price_to_sma_{period}'] = price_to_sma[row]
         
         # MA crossovers
-        if 'sma_20' in df.columns and 'sma_50' in df.columns:
-            df['sma_20_50_diff'] = df['sma_20'] - df['sma_50']
-            df['sma_20_50_cross'] = np.where(df['sma_20'] > df['sma_50'], 1, -1)
+        if 'sma_20' in out and 'sma_50' in out:
+            out['sma_20_50_diff'] = sma_diff
+            out['sma_20_50_cross'] = crosses[0]
         
         # RSI levels
-        if 'rsi' in df.columns:
-            df['rsi_overbought'] = np.where(df['rsi'] > 70, 1, 0)
-            df['rsi_oversold'] = np.where(df['rsi'] < 30, 1, 0)
+        out['rsi_overbought'] = crosses[1]
+        out['rsi_oversold'] = crosses[2]
         
         # MACD signal
-        if 'macd' in df.columns and 'macd_signal' in df.columns:
-            df['macd_cross'] = np.where(df['macd'] > df['macd_signal'], 1, -1)
+        out['macd_cross'] = crosses[3]
         
         # Trend strength
-        if 'ema_12' in df.columns and 'ema_26' in df.columns:
-            df['trend_strength'] = (df['ema_12'] - df['ema_26']) / df['close']
-        
-        return df
+        if 'ema_12' in out and 'ema_26' in out:
+            out['trend_strength'] = trend_strength
     
     def get_feature_columns(self, df: pd.DataFrame) -> List[str]:
         """Get list of feature columns (excluding OHLCV and metadata).
@@ -232,11 +334,10 @@ class FeatureEngineer:
         if target_col in feature_cols:
             feature_cols.remove(target_col)
         
-        X = df[feature_cols].copy()
         y = df[target_col].copy() if target_col in df.columns else None
         
-        # Replace inf with nan and fill
-        X = X.replace([np.inf, -np.inf], np.nan)
+        # Replace inf with nan and fill; float32/int8 feature dtypes are kept
+        X = df[feature_cols].replace([np.inf, -np.inf], np.nan)
         X = X.ffill().fillna(0)
         
         return X, y, feature_cols
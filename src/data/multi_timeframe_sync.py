@@ -1,11 +1,21 @@
 """Multi-Timeframe Data Synchronization Service."""
 
 import asyncio
+import threading
+import weakref
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 
-from src.core.config import trading_config
+# Optional parquet engine for persisting feature frames across restarts
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from src.core.config import settings, trading_config
 from src.core.logger import logger
 from src.data.delta_client import DeltaExchangeClient
 from src.data.feature_engineer import FeatureEngineer
@@ -16,6 +26,10 @@ from src.utils.timestamp import get_current_time_utc, format_timestamp
 class MultiTimeframeDataSync:
     """Manages synchronized data fetching across multiple timeframes."""
     
+    MAX_CONCURRENT_FETCHES = 4
+    TAIL_ROWS = 64  # Rows kept per dataset for latest-signal reads
+    SIGNAL_TIMEFRAME = '15m'  # New bars on this timeframe set new_bar_event
+    
     def __init__(self):
         """Initialize the data sync service."""
         self.delta_client = DeltaExchangeClient()
@@ -25,6 +39,18 @@ class MultiTimeframeDataSync:
         # Data storage with metadata
         self.data_store: Dict[str, Dict] = {}  # {symbol_timeframe: {df, timestamp, quality}}
         
+        # Last feature frame per series; new syncs only recompute its tail.
+        # This is the only strong reference to the full frame
+        self._feature_cache: Dict[str, pd.DataFrame] = {}
+        # Last bar the cached frame was built from, per series; polls that
+        # return the same candles reuse the cached frame outright
+        self._feature_memo: Dict[str, tuple] = {}
+        self._feature_lock = threading.Lock()  # Feature work runs on worker threads
+        
+        # Series whose stored frame changed since it was last written to
+        # disk; in-progress candle updates are only flushed on stop()
+        self._unpersisted: set = set()
+        
         # Sync intervals (seconds)
         self.sync_intervals = {
             '15m': 60,    # Sync every 1 minute
@@ -47,6 +73,15 @@ class MultiTimeframeDataSync:
         self.is_running = False
         self.sync_task = None
         
+        # Set when a new SIGNAL_TIMEFRAME bar is stored; the trading loop
+        # waits on it instead of sleeping a fixed interval
+        self.new_bar_event = asyncio.Event()
+        
+        # Feature frames persisted by the last run; lets signals resume
+        # before the first fetch cycle completes
+        self.cache_dir = Path(settings.cache_dir) / 'mtf'
+        self._load_persisted()
+        
         logger.info(
             "MultiTimeframeDataSync initialized",
             symbols=self.symbols,
@@ -76,8 +111,9 @@ class MultiTimeframeDataSync:
         cache_key = self._get_cache_key(symbol, timeframe)
         
         try:
-            # Fetch OHLC data
-            df = self.delta_client.get_ohlc_candles(
+            # Fetch OHLC data off the event loop
+            df = await asyncio.to_thread(
+                self.delta_client.get_ohlc_candles,
                 symbol=symbol,
                 resolution=timeframe,
                 limit=500
@@ -87,31 +123,38 @@ class MultiTimeframeDataSync:
                 logger.warning(f"No data fetched for {symbol} {timeframe}")
                 return False
             
+            # Last traded close, before outlier capping can clip a real move
+            last_close = df['close'].iloc[-1]
+            
             # Validate
-            df, metrics = self.validator.validate_and_clean(df)
+            df, metrics = await asyncio.to_thread(self.validator.validate_and_clean, df)
             
             if df.empty:
                 logger.warning(f"Data validation failed for {symbol} {timeframe}")
                 return False
             
-            # Create features
-            df = self.feature_engineer.create_features(df)
+            # Create features, extending the cached frame when possible
+            df = await asyncio.to_thread(self._create_features, symbol, timeframe, df)
             
             if df.empty:
                 logger.warning(f"Feature engineering failed for {symbol} {timeframe}")
                 return False
             
-            # Store with metadata
-            self.data_store[cache_key] = {
-                'df': df,
-                'timestamp': get_current_time_utc(),
-                'quality_score': metrics.get('quality_score', 0),
-                'num_candles': len(df),
-                'symbol': symbol,
-                'timeframe': timeframe
-            }
+            # Store with metadata. The frame is written once per closed bar;
+            # updates to the in-progress bar wait for the next bar or stop()
+            previous = self.data_store.get(cache_key)
+            unchanged = previous is not None and previous['df_full_ref']() is df
+            new_bar = previous is None or previous['df_tail']['timestamp'].iloc[-1] != df['timestamp'].iloc[-1]
+            self._store(symbol, timeframe, df, metrics.get('quality_score', 0), get_current_time_utc(),
+                        last_close=last_close)
+            if new_bar:
+                await asyncio.to_thread(self._persist, symbol, timeframe, df, metrics.get('quality_score', 0))
+                self._unpersisted.discard(cache_key)
+            elif not unchanged:
+                self._unpersisted.add(cache_key)
             
-            self.last_sync[cache_key] = get_current_time_utc()
+            if new_bar and timeframe == self.SIGNAL_TIMEFRAME:
+                self.new_bar_event.set()
             
             logger.debug(
                 f"Data synced",
@@ -130,25 +173,153 @@ class MultiTimeframeDataSync:
             )
             return False
     
-    async def sync_all(self):
-        """Sync all symbol-timeframe combinations that are stale."""
-        sync_count = 0
+    def _store(self, symbol: str, timeframe: str, df: pd.DataFrame, quality_score: float, synced_at: datetime,
+               last_close: Optional[float] = None):
+        """Record a feature frame in data_store and mark the dataset synced.
+        
+        Only a thin tail is held strongly; the full frame stays owned by the
+        feature cache and is weakly referenced here. ``last_close`` is the
+        fetched close before validation; the frame's own close is used when
+        it is missing.
+        """
+        cache_key = self._get_cache_key(symbol, timeframe)
+        if last_close is None or pd.isna(last_close):
+            last_close = df['close'].iloc[-1]
+        self.data_store[cache_key] = {
+            'df_tail': df.tail(self.TAIL_ROWS).reset_index(drop=True),
+            'df_full_ref': weakref.ref(df),
+            'last_close': float(last_close),
+            'timestamp': synced_at,
+            'quality_score': quality_score,
+            'num_candles': len(df),
+            'symbol': symbol,
+            'timeframe': timeframe
+        }
+        self.last_sync[cache_key] = synced_at
+    
+    def _persist(self, symbol: str, timeframe: str, df: pd.DataFrame, quality_score: float):
+        """Write a feature frame to ``cache_dir`` as zstd parquet."""
+        if not HAS_PYARROW:
+            return
+        
+        path = self.cache_dir / f"{self._get_cache_key(symbol, timeframe)}.parquet"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            frame = df.copy(deep=False)
+            frame.attrs = {'symbol': symbol, 'timeframe': timeframe, 'quality_score': quality_score}
+            tmp_path = path.with_suffix('.tmp')
+            frame.to_parquet(tmp_path, compression='zstd', index=False)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Failed to persist features for {symbol} {timeframe}", error=str(e))
+    
+    def _persist_pending(self):
+        """Write every frame with in-progress updates not yet on disk."""
+        for cache_key in list(self._unpersisted):
+            data = self.data_store.get(cache_key)
+            df = data['df_full_ref']() if data is not None else None
+            if df is not None:
+                self._persist(data['symbol'], data['timeframe'], df, data['quality_score'])
+        self._unpersisted.clear()
+    
+    def _load_persisted(self):
+        """Rehydrate data_store and the feature cache from ``cache_dir``.
+        
+        Each dataset is marked synced at its file's modification time, so
+        staleness checks refresh it on the usual schedule.
+        """
+        if not HAS_PYARROW or not self.cache_dir.is_dir():
+            return
         
         for symbol in self.symbols:
             for timeframe in self.timeframes:
-                if self._is_data_stale(symbol, timeframe):
-                    success = await self._fetch_and_store(symbol, timeframe)
-                    if success:
-                        sync_count += 1
-                    
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.1)
+                cache_key = self._get_cache_key(symbol, timeframe)
+                path = self.cache_dir / f"{cache_key}.parquet"
+                if not path.is_file():
+                    continue
+                
+                try:
+                    df = pd.read_parquet(path)
+                    synced_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+                except Exception as e:
+                    logger.warning(f"Failed to load persisted features for {symbol} {timeframe}", error=str(e))
+                    continue
+                
+                if df.empty:
+                    continue
+                
+                # Parquet may round-trip timestamps at a coarser unit than
+                # fetched candles; keep them comparable for incremental updates
+                df['timestamp'] = df['timestamp'].dt.as_unit('ns')
+                self._feature_cache[cache_key] = df
+                self._store(symbol, timeframe, df, df.attrs.get('quality_score', 0), synced_at)
+        
+        if self.data_store:
+            logger.info("Loaded persisted feature data", datasets=len(self.data_store))
+    
+    def _create_features(self, symbol: str, timeframe: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Create features for a series, recomputing only the new tail if it was seen before.
+        
+        The memo key includes the last bar's OHLCV as well as its timestamp,
+        so updates to an in-progress candle are not served stale features.
+        Only the latest frame per series is kept, so ``data_store``'s weak
+        reference to it clears once a newer frame replaces it.
+        """
+        last = df.iloc[-1]
+        memo_key = (symbol, timeframe, last['timestamp'].value,
+                    *(float(last[col]) for col in FeatureEngineer.OHLCV_COLUMNS))
+        cache_key = self._get_cache_key(symbol, timeframe)
+        with self._feature_lock:
+            previous = self._feature_cache.get(cache_key)
+            if previous is not None and self._feature_memo.get(cache_key) == memo_key:
+                return previous
+        
+        features = None
+        if previous is not None:
+            features = self.feature_engineer.update_features(df, previous)
+        if features is None:
+            features = self.feature_engineer.create_features(df)
+        
+        with self._feature_lock:
+            if features.empty:
+                self._feature_cache.pop(cache_key, None)
+                self._feature_memo.pop(cache_key, None)
+            else:
+                self._feature_cache[cache_key] = features
+                self._feature_memo[cache_key] = memo_key
+        
+        return features
+    
+    async def sync_all(self):
+        """Sync all symbol-timeframe combinations that are stale."""
+        sync_count = await self._sync_stale()
         
         if sync_count > 0:
             logger.info(f"Synced {sync_count} timeframe datasets")
         
         return sync_count
     
+    async def _sync_stale(self) -> int:
+        """Fetch every stale dataset concurrently; returns the number synced.
+        
+        At most ``MAX_CONCURRENT_FETCHES`` fetches are in flight, which also
+        keeps the burst within the API rate limit.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        
+        async def _bounded_fetch(symbol: str, timeframe: str) -> bool:
+            async with semaphore:
+                return await self._fetch_and_store(symbol, timeframe)
+        
+        results = await asyncio.gather(*(
+            _bounded_fetch(symbol, timeframe)
+            for symbol in self.symbols
+            for timeframe in self.timeframes
+            if self._is_data_stale(symbol, timeframe)
+        ))
+        
+        return sum(1 for success in results if success)
+    
     async def sync_loop(self):
         """Background sync loop."""
         logger.info("Multi-timeframe sync loop started")
@@ -158,13 +329,8 @@ class MultiTimeframeDataSync:
         
         while self.is_running:
             try:
-                # Check each timeframe independently
-                for timeframe in self.timeframes:
-                    interval = self.sync_intervals.get(timeframe, 300)
-                    
-                    for symbol in self.symbols:
-                        if self._is_data_stale(symbol, timeframe):
-                            await self._fetch_and_store(symbol, timeframe)
+                # Each dataset refreshes once its own timeframe interval has passed
+                await self._sync_stale()
                 
                 # Wait 30 seconds before next check
                 await asyncio.sleep(30)
@@ -188,14 +354,16 @@ class MultiTimeframeDataSync:
         self.is_running = False
         if self.sync_task:
             self.sync_task.cancel()
+        self._persist_pending()
         logger.info("Multi-timeframe sync service stopped")
     
-    def get_data(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+    def get_data(self, symbol: str, timeframe: str, full: bool = False) -> Optional[pd.DataFrame]:
         """Get data for a specific symbol and timeframe.
         
         Args:
             symbol: Trading symbol
             timeframe: Timeframe (15m, 1h, 4h)
+            full: Return the whole feature frame instead of the last ``TAIL_ROWS`` rows
             
         Returns:
             DataFrame with features or None if not available
@@ -219,13 +387,45 @@ class MultiTimeframeDataSync:
                 max_age=max_age
             )
         
-        return data['df']
+        if not full:
+            return data['df_tail']
+        
+        df = data['df_full_ref']()
+        if df is None:
+            logger.warning(f"Full data for {symbol} {timeframe} is no longer cached")
+        return df
+    
+    def get_latest_price(self, symbol: str, timeframe: Optional[str] = None) -> Optional[Tuple[float, datetime]]:
+        """Get the last close and its sync time from cached candles.
+        
+        The last candle of a fresh fetch is the in-progress bar, so its close
+        is the current price as of the sync. The close is taken from the
+        fetched candles before validation, so outlier capping never clips it.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe to read; defaults to ``SIGNAL_TIMEFRAME``
+            
+        Returns:
+            Tuple of (close, sync time), or None if not cached or older than two sync intervals
+        """
+        timeframe = timeframe or self.SIGNAL_TIMEFRAME
+        data = self.data_store.get(self._get_cache_key(symbol, timeframe))
+        if data is None or data['df_tail'].empty:
+            return None
+        
+        age = (get_current_time_utc() - data['timestamp']).total_seconds()
+        if age > self.sync_intervals.get(timeframe, 300) * 2:
+            return None
+        
+        return data['last_close'], data['timestamp']
     
-    def get_all_data(self, symbol: str) -> Dict[str, pd.DataFrame]:
+    def get_all_data(self, symbol: str, full: bool = False) -> Dict[str, pd.DataFrame]:
         """Get data for all timeframes for a symbol.
         
         Args:
             symbol: Trading symbol
+            full: Return whole feature frames instead of their tails
             
         Returns:
             Dictionary mapping timeframe to DataFrame
@@ -233,7 +433,7 @@ class MultiTimeframeDataSync:
         result = {}
         
         for timeframe in self.timeframes:
-            df = self.get_data(symbol, timeframe)
+            df = self.get_data(symbol, timeframe, full=full)
             if df is not None:
                 result[timeframe] = df
         
@@ -287,6 +487,10 @@ class MultiTimeframeDataSync:
     def clear_cache(self):
         """Clear all cached data."""
         self.data_store.clear()
+        with self._feature_lock:
+            self._feature_cache.clear()
+            self._feature_memo.clear()
+        self._unpersisted.clear()
         self.last_sync.clear()
         logger.info("Data cache cleared")
 
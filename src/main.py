@@ -5,33 +5,40 @@ import asyncio
 import signal
 import sys
 import time
+from collections import deque
 from pathlib import Path
+from statistics import fmean
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
 
+import requests
+
 # Import aiohttp with fallback handling
 try:
     import aiohttp  # type: ignore[import]  # noqa: F401
 except ImportError:
     aiohttp = None  # type: ignore
 
+# libuv-backed event loop where available (not on Windows)
+try:
+    import uvloop  # type: ignore[import]
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.core.config import settings, trading_config
 from src.core.database import SessionLocal, init_db
 from src.core.logger import logger, get_component_logger, cleanup_logs_on_startup
 from src.data.delta_client import DeltaExchangeClient
 from src.data.data_sync import DataSyncService
+from src.data import _fe_kernels as fe_kernels
 from src.data.multi_timeframe_sync import MultiTimeframeDataSync
-from src.ml.predictor import TradingPredictor
-from src.ml.multi_model_predictor import MultiModelPredictor
-from src.ml.model_coordinator import ModelCoordinator
-from src.ml.cross_timeframe_aggregator import CrossTimeframeAggregator
 from src.trading.paper_engine import PaperTradingEngine
-from src.trading.model_position_manager import ModelPositionManager
-from src.trading.intelligent_entry import IntelligentEntry
 from src.telegram.bot import TradingBot, set_bot
 from src.monitoring.health_check import get_health_check
 from src.monitoring.diagnostic_reporter import get_diagnostic_reporter
@@ -44,7 +51,12 @@ from src.shared_state import shared_state
 # HELPER FUNCTIONS FOR REAL-TIME COMMUNICATION
 # ============================================================================
 
-async def notify_backend_api(event_type: str, data: dict, backend_url: str = "http://localhost:8000"):
+async def notify_backend_api(
+    event_type: str,
+    data: dict,
+    backend_url: str = "http://localhost:8000",
+    session: Optional["aiohttp.ClientSession"] = None
+):
     """
     Notify backend API of events for real-time WebSocket broadcasts.
     
@@ -55,40 +67,94 @@ async def notify_backend_api(event_type: str, data: dict, backend_url: str = "ht
         event_type: Type of event ('trade', 'signal', 'position_update', etc.)
         data: Event data to broadcast
         backend_url: Backend API URL (default: http://localhost:8000)
+        session: Keep-alive session to post with; a one-off session is
+            opened and closed when omitted
+    
+    Returns:
+        False if the backend could not be reached (timeout or connection
+        error), True otherwise
+    """
+    return await _post_to_backend(
+        "/api/v1/internal/broadcast",
+        {'type': event_type, 'data': data},
+        event_type,
+        backend_url,
+        session
+    )
+
+
+async def notify_backend_batch(
+    events: list,
+    backend_url: str = "http://localhost:8000",
+    session: Optional["aiohttp.ClientSession"] = None
+):
+    """
+    Notify backend API of several events with a single request.
+    
+    Args:
+        events: (event_type, data) pairs, broadcast in order
+        backend_url: Backend API URL (default: http://localhost:8000)
+        session: Keep-alive session to post with; a one-off session is
+            opened and closed when omitted
+    
+    Returns:
+        False if the backend could not be reached (timeout or connection
+        error), True otherwise
+    """
+    return await _post_to_backend(
+        "/api/v1/internal/broadcast_batch",
+        {'events': [{'type': event_type, 'data': data} for event_type, data in events]},
+        f"batch[{len(events)}]",
+        backend_url,
+        session
+    )
+
+
+async def _post_to_backend(path: str, payload: dict, event_type: str, backend_url: str,
+                           session: Optional["aiohttp.ClientSession"]) -> bool:
+    """POST ``payload`` to a backend broadcast endpoint, logging instead of raising.
+    
+    Returns False only when the backend could not be reached.
     """
     if aiohttp is None:
         logger.warning("aiohttp not available - skipping backend notification")
-        return
-        
+        return True
+    
+    own_session = session is None
+    if own_session:
+        session = aiohttp.ClientSession()
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{backend_url}/api/v1/internal/broadcast",
-                json={
-                    'type': event_type,
-                    'data': data
-                },
-                timeout=aiohttp.ClientTimeout(total=2)
-            ) as response:
-                if response.status == 200:
-                    logger.debug(
-                        "Backend notified successfully",
-                        event_type=event_type,
-                        status=response.status
-                    )
-                else:
-                    logger.warning(
-                        "Backend notification failed",
-                        event_type=event_type,
-                        status=response.status
-                    )
+        async with session.post(
+            f"{backend_url}{path}",
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=2)
+        ) as response:
+            if response.status == 200:
+                logger.debug(
+                    "Backend notified successfully",
+                    event_type=event_type,
+                    status=response.status
+                )
+            else:
+                logger.warning(
+                    "Backend notification failed",
+                    event_type=event_type,
+                    status=response.status
+                )
     except asyncio.TimeoutError:
         logger.debug("Backend notification timeout (non-critical)", event_type=event_type)
+        return False
     except aiohttp.ClientConnectionError:
         logger.debug("Backend API not reachable (non-critical)", event_type=event_type)
+        return False
     except Exception as e:
         logger.debug("Failed to notify backend (non-critical)", event_type=event_type, error=str(e))
+    finally:
+        if own_session:
+            await session.close()
     # Never raise exceptions - notification failures should not stop trading
+    return True
 
 
 class TradingAgent:
@@ -97,6 +163,9 @@ class TradingAgent:
     # PHASE 4.1: Constants
     ALERT_THROTTLE_SECONDS = 3600  # 1 hour
     ERROR_RETRY_DELAY_SECONDS = 60
+    TRANSIENT_ERROR_RETRY_SECONDS = 5
+    RATE_LIMIT_BACKOFF_MIN_SECONDS = 10
+    RATE_LIMIT_BACKOFF_MAX_SECONDS = 300
     STALE_DATA_WARNING_SECONDS = 300  # 5 minutes
     STALE_DATA_ALERT_SECONDS = 600  # 10 minutes
     MAX_HOLDING_HOURS = 168  # 1 week
@@ -106,13 +175,23 @@ class TradingAgent:
     HIGH_VOLATILITY_THRESHOLD = 5.0  # percent
     HIGH_VOLATILITY_MIN_CONFIDENCE = 0.70
     MAX_POSITION_PCT = 0.10  # 10% of balance per trade
+    TICKER_CACHE_TTL_SECONDS = 5.0
+    MAX_PENDING_NOTIFICATIONS = 100
+    MAX_CONCURRENT_NOTIFICATIONS = 64
+    NOTIFY_QUEUE_SIZE = 1024
+    NOTIFY_BATCH_SIZE = 50  # backend accepts at most 100 events per batch
+    NOTIFY_BATCH_WAIT_SECONDS = 1.0
+    BACKEND_BREAKER_FAILURES = 5
+    BACKEND_BREAKER_COOLDOWN_SECONDS = 60
+    NOTIFICATION_DRAIN_TIMEOUT_SECONDS = 10
     
     def __init__(self):
         # Initialize component logger
         self.logger = get_component_logger("trading_agent")
         
         self.is_running = False
-        self.delta_client = DeltaExchangeClient()
+        # Ticker lookups from the trading and monitoring loops share the client's TTL cache
+        self.delta_client = DeltaExchangeClient(ticker_cache_ttl=self.TICKER_CACHE_TTL_SECONDS)
         self.data_sync = DataSyncService()
         self.multi_tf_sync = MultiTimeframeDataSync()
         self.db = None  # Initialize as None, will be created in initialize()
@@ -133,7 +212,12 @@ class TradingAgent:
         if use_intelligent_system:
             self.logger.info("ml_system_init", "Initializing intelligent multi-timeframe system")
             
-            # New intelligent system
+            # New intelligent system (model backends are imported only for the configured system)
+            from src.ml.model_coordinator import ModelCoordinator
+            from src.ml.cross_timeframe_aggregator import CrossTimeframeAggregator
+            from src.trading.model_position_manager import ModelPositionManager
+            from src.trading.intelligent_entry import IntelligentEntry
+            
             self.model_coordinator = ModelCoordinator()
             self.signal_aggregator = CrossTimeframeAggregator()
             self.position_manager = ModelPositionManager()
@@ -162,6 +246,7 @@ class TradingAgent:
         elif multi_model_enabled:
             # Legacy multi-model system
             self.logger.info("ml_system_init", "Using legacy multi-model predictor", {"strategy": strategy})
+            from src.ml.multi_model_predictor import MultiModelPredictor
             self.predictor = MultiModelPredictor(strategy=strategy)
             self.model_coordinator = None
             self.signal_aggregator = None
@@ -180,6 +265,7 @@ class TradingAgent:
         else:
             # Single model system
             self.logger.info("ml_system_init", "Using single model predictor")
+            from src.ml.predictor import TradingPredictor
             self.predictor = TradingPredictor()
             self.model_coordinator = None
             self.signal_aggregator = None
@@ -210,7 +296,7 @@ class TradingAgent:
         else:
             self.expected_models_count = 1
         
-        # Alert throttling (prevent spam) - using class constant
+        # Alert throttling (prevent spam) - monotonic time of the last alert per type
         self.last_circuit_breaker_alert = None
         self.last_model_health_alert = None
         self.last_data_quality_alert = None
@@ -220,16 +306,34 @@ class TradingAgent:
         
         # PHASE 3 enhancements
         self.startup_time = None  # Will be set in initialize() (PHASE 3.1)
-        self.recent_signal_confidences = []  # PHASE 3.2
+        self.recent_signal_confidences = deque(maxlen=self.SIGNAL_CONFIDENCE_HISTORY_SIZE)  # PHASE 3.2
         self.total_transaction_costs = 0.0  # PHASE 3.3
         
         # PHASE 6 safety tracking
         self.consecutive_skips = 0  # PHASE 6.2
         
+        # Current rate-limit backoff for the trading loop (0 = none)
+        self._error_backoff = 0.0
+        
+        # Keep-alive session for backend broadcasts; opened in initialize()
+        self._notify_session = None
+        
+        # Backend broadcasts from the monitoring loops, posted in batches by _notify_flusher
+        self._notify_queue: asyncio.Queue = asyncio.Queue(maxsize=self.NOTIFY_QUEUE_SIZE)
+        self._notify_flusher_task = None
+        # Backend breaker: consecutive unreachable broadcasts and when it opened (monotonic)
+        self._notify_breaker = {'failures': 0, 'opened_at': None}
+        
+        # Notifications sent in the background, referenced until they finish
+        self._pending_notifications = set()
+        self._notification_slots = asyncio.Semaphore(self.MAX_CONCURRENT_NOTIFICATIONS)
+        
         # Config
         self.symbol = trading_config.trading.get('symbol', 'BTCUSD')
         self.update_interval = trading_config.trading.get('update_interval', 300)  # 5 minutes
         self.position_monitoring_interval = trading_config.trading.get('position_monitoring_interval', 300)  # 5 minutes
+        self.entry_signal_interval = trading_config.trading.get('entry_signal_interval', 300)  # 5 minutes
+        self.min_confidence = trading_config.signal_filters.get('min_confidence', 0.60)
         self.timeframe = '15m'  # Primary timeframe for 5-minute signal alignment
         
         self.logger.info(
@@ -243,32 +347,244 @@ class TradingAgent:
             }
         )
     
-    def _should_send_alert(self, alert_type: str, now: datetime) -> bool:
+    def _should_send_alert(self, alert_type: str) -> bool:
         """Check if alert should be sent based on throttling (PHASE 4.2)."""
-        last_alert_attr = f'last_{alert_type}_alert'
-        last_alert = getattr(self, last_alert_attr, None)
+        last_alert = getattr(self, f'last_{alert_type}_alert', None)
+        return last_alert is None or time.monotonic() - last_alert > self.ALERT_THROTTLE_SECONDS
+    
+    def _record_alert_sent(self, alert_type: str):
+        """Record that alert was sent (PHASE 4.2), as a ``time.monotonic()`` value."""
+        setattr(self, f'last_{alert_type}_alert', time.monotonic())
+    
+    @staticmethod
+    def _classify_error(error: Exception) -> str:
+        """Classify a trading loop error as 'rate_limit', 'transient' or 'unknown'."""
+        # aiohttp.ClientResponseError carries .status; requests.HTTPError carries .response
+        status = getattr(error, 'status', None)
+        if status is None and getattr(error, 'response', None) is not None:
+            status = getattr(error.response, 'status_code', None)
+        if status == 429:
+            return 'rate_limit'
+        
+        transient = (asyncio.TimeoutError, TimeoutError, ConnectionError,
+                     requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        if aiohttp is not None:
+            transient += (aiohttp.ClientConnectionError,)
+        if isinstance(error, transient):
+            return 'transient'
+        return 'unknown'
+    
+    def _error_retry_delay(self, error_kind: str) -> float:
+        """Seconds to wait before retrying after an error of ``error_kind``.
+        
+        Rate limits back off exponentially up to a cap until an iteration
+        completes; network errors retry quickly; anything else waits the
+        standard retry delay.
+        """
+        if error_kind == 'rate_limit':
+            self._error_backoff = min(
+                max(self._error_backoff * 2, self.RATE_LIMIT_BACKOFF_MIN_SECONDS),
+                self.RATE_LIMIT_BACKOFF_MAX_SECONDS
+            )
+            return self._error_backoff
+        if error_kind == 'transient':
+            return self.TRANSIENT_ERROR_RETRY_SECONDS
+        return self.ERROR_RETRY_DELAY_SECONDS
+    
+    async def _notify_backend(self, event_type: str, data: dict) -> None:
+        """Broadcast an event through the backend API over the agent's keep-alive session."""
+        if not self._backend_available():
+            return
+        reachable = await notify_backend_api(event_type, data, session=self._notify_session)
+        self._record_backend_result(reachable)
+    
+    def _backend_available(self) -> bool:
+        """Whether backend broadcasts should be attempted.
+        
+        After ``BACKEND_BREAKER_FAILURES`` consecutive unreachable attempts
+        the breaker opens and broadcasts are skipped for
+        ``BACKEND_BREAKER_COOLDOWN_SECONDS``; the next attempt after that
+        either closes it again or reopens it.
+        """
+        opened_at = self._notify_breaker['opened_at']
+        return opened_at is None or time.monotonic() - opened_at >= self.BACKEND_BREAKER_COOLDOWN_SECONDS
+    
+    def _record_backend_result(self, reachable: bool) -> None:
+        """Update the backend breaker with the outcome of a broadcast."""
+        breaker = self._notify_breaker
+        if reachable:
+            if breaker['opened_at'] is not None:
+                logger.info("Backend API reachable again - resuming broadcasts")
+            breaker['failures'] = 0
+            breaker['opened_at'] = None
+            return
+        
+        breaker['failures'] += 1
+        if breaker['failures'] >= self.BACKEND_BREAKER_FAILURES:
+            if breaker['opened_at'] is None:
+                logger.warning(
+                    f"Backend API unreachable - pausing broadcasts for {self.BACKEND_BREAKER_COOLDOWN_SECONDS}s",
+                    failures=breaker['failures']
+                )
+            breaker['opened_at'] = time.monotonic()
+    
+    def _queue_backend_notification(self, event_type: str, data: dict) -> None:
+        """Queue a backend broadcast for the next batch, dropping the oldest when full."""
+        if self._notify_queue.full():
+            dropped_type, _ = self._notify_queue.get_nowait()
+            logger.debug("Backend notification queue full - dropped oldest", event_type=dropped_type)
+        self._notify_queue.put_nowait((event_type, data))
+    
+    def _drain_notify_queue(self, limit: int) -> list:
+        """Take up to ``limit`` queued notifications without waiting."""
+        events = []
+        while len(events) < limit and not self._notify_queue.empty():
+            events.append(self._notify_queue.get_nowait())
+        return events
+    
+    async def _notify_flusher(self) -> None:
+        """Post queued backend notifications in batches.
+        
+        A batch is sent once ``NOTIFY_BATCH_SIZE`` events are collected or
+        ``NOTIFY_BATCH_WAIT_SECONDS`` after its first event, whichever comes
+        first.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._notify_queue.get()]
+            deadline = loop.time() + self.NOTIFY_BATCH_WAIT_SECONDS
+            while len(batch) < self.NOTIFY_BATCH_SIZE:
+                batch.extend(self._drain_notify_queue(self.NOTIFY_BATCH_SIZE - len(batch)))
+                remaining = deadline - loop.time()
+                if len(batch) >= self.NOTIFY_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._notify_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            if not self._backend_available():
+                logger.debug("Backend API unreachable - dropped notification batch", events=len(batch))
+                continue
+            reachable = await notify_backend_batch(batch, session=self._notify_session)
+            self._record_backend_result(reachable)
+    
+    async def _run_notification(self, coro):
+        """Await a notification once a concurrency slot is free."""
+        async with self._notification_slots:
+            return await coro
+    
+    def _notify_in_background(self, coro, description: str) -> None:
+        """Send a notification without holding up the caller.
+        
+        The task is kept in ``_pending_notifications`` until it finishes and
+        failures are logged from its done callback. At most
+        ``MAX_CONCURRENT_NOTIFICATIONS`` run at once; when too many are
+        already pending the notification is dropped rather than queued.
+        """
+        if len(self._pending_notifications) >= self.MAX_PENDING_NOTIFICATIONS:
+            coro.close()
+            logger.warning(f"{description} dropped - {len(self._pending_notifications)} notifications pending")
+            return
+        
+        task = asyncio.create_task(self._run_notification(coro))
+        self._pending_notifications.add(task)
+        
+        def on_done(task: asyncio.Task) -> None:
+            self._pending_notifications.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"{description} failed: {task.exception()}")
+        
+        task.add_done_callback(on_done)
+    
+    async def _wait_for_next_iteration(self, deadline: float) -> None:
+        """Wait until the next trading iteration.
+        
+        ``deadline`` is a ``time.monotonic()`` value, so time spent in the
+        iteration itself counts toward the interval and the cadence does not
+        drift. While multi-timeframe sync is running this also wakes as soon
+        as a new signal-timeframe bar lands; otherwise it is a plain sleep.
+        """
+        timeout = max(0.0, deadline - time.monotonic())
         
-        if last_alert is None:
-            return True
+        if not self.multi_tf_sync.is_running:
+            await asyncio.sleep(timeout)
+            return
         
-        seconds_since_last = (now - last_alert).total_seconds()
-        return seconds_since_last > self.ALERT_THROTTLE_SECONDS
+        try:
+            await asyncio.wait_for(self.multi_tf_sync.new_bar_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.multi_tf_sync.new_bar_event.clear()
     
-    def _record_alert_sent(self, alert_type: str, now: datetime):
-        """Record that alert was sent (PHASE 4.2)."""
-        setattr(self, f'last_{alert_type}_alert', now)
+    async def _get_current_ticker(self) -> Optional[dict]:
+        """Latest ticker for the trading symbol.
+        
+        The multi-timeframe sync already holds the latest 15m close; the
+        ticker endpoint is only hit when that is missing or stale.
+        """
+        latest = self.multi_tf_sync.get_latest_price(self.symbol) if self.multi_tf_sync.is_running else None
+        if latest is not None:
+            close, synced_at = latest
+            return {'close': close, 'timestamp': synced_at.isoformat()}
+        
+        return await self._fetch_with_retry(
+            self._ticker_getter(), self.symbol,
+            operation_name="ticker_fetch"
+        )
     
-    async def _fetch_with_retry(self, fetch_func, max_retries=5, operation_name="fetch"):
-        """Fetch data with exponential backoff retry logic."""
+    async def _fetch_position_prices(self, positions) -> dict:
+        """Current close for each position's symbol, fetched concurrently.
+        
+        Each symbol is fetched once. Symbols whose ticker could not be
+        fetched or has no valid price are logged and left out.
+        """
+        symbols = list(dict.fromkeys(position.symbol for position in positions))
+        tickers = await asyncio.gather(*(
+            self._fetch_with_retry(self._ticker_getter(), symbol, operation_name=f"ticker_fetch_{symbol}")
+            for symbol in symbols
+        ), return_exceptions=True)
+        
+        prices = {}
+        for symbol, ticker in zip(symbols, tickers):
+            if isinstance(ticker, Exception) or not ticker:
+                logger.warning(f"Could not fetch ticker for {symbol}")
+                continue
+            
+            current_price = float(ticker.get('close') or 0)
+            if current_price == 0:
+                logger.warning(f"Invalid price for {symbol}")
+                continue
+            
+            prices[symbol] = current_price
+        return prices
+    
+    def _ticker_getter(self):
+        """Ticker lookup to hand to ``_fetch_with_retry`` along with the symbol.
+        
+        Uses the client's keep-alive aiohttp session when it is open, so the
+        request stays on the event loop; otherwise the sync client runs in a
+        worker thread.
+        """
+        if self.delta_client.has_async_session:
+            return self.delta_client.get_ticker_async
+        return self.delta_client.get_ticker
+    
+    async def _fetch_with_retry(self, fetch_func, *args, max_retries=5, operation_name="fetch", **kwargs):
+        """Fetch data with exponential backoff retry logic.
+        
+        ``fetch_func`` is called as ``fetch_func(*args, **kwargs)`` on each
+        attempt, so callers pass arguments rather than wrapping the call.
+        """
         for attempt in range(max_retries):
             try:
                 # Check if fetch_func is async or sync
                 if asyncio.iscoroutinefunction(fetch_func):
-                    return await fetch_func()
+                    return await fetch_func(*args, **kwargs)
                 else:
                     # Run sync function in thread pool to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    return await loop.run_in_executor(None, fetch_func)
+                    return await asyncio.to_thread(fetch_func, *args, **kwargs)
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 if attempt == max_retries - 1:
                     logger.error(f"{operation_name} failed after {max_retries} attempts: {e}")
@@ -302,6 +618,18 @@ class TradingAgent:
         self.db = SessionLocal()  # Create database session
         self.logger.info("database_init", "Database initialized")
         
+        # Keep-alive HTTP session for ticker lookups made from the event loop
+        await self.delta_client.start_async_session()
+        if aiohttp is not None:
+            self._notify_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+            )
+        self._notify_flusher_task = asyncio.create_task(self._notify_flusher())
+        
+        # Load compiled feature kernels now rather than in the first sync
+        fe_kernels.warmup()
+        self.logger.info("feature_kernels_init", "Feature kernels ready", {"jit": fe_kernels.HAS_NUMBA})
+        
         # Initialize diagnostic reporter
         await self.diagnostic_reporter.initialize()
         self.logger.info("diagnostic_init", "Diagnostic reporter initialized")
@@ -383,13 +711,19 @@ class TradingAgent:
         
         logger.info("All components initialized")
     
-    async def intelligent_position_monitor(self) -> None:
-        """Monitor positions every 5 minutes using model-driven exits.
+    async def position_monitoring_loop(self) -> None:
+        """Monitor open positions every 5 minutes and close those that should exit.
         
-        This loop runs independently and uses continuous model evaluation
-        to determine if positions should be held or exited.
+        This loop runs independently of the trading loop. Prices are fetched
+        once per tick. When the intelligent system is active the model-driven
+        position manager decides exits first; the fixed timeout/SL/TP checks
+        then run in both modes as the hard backstop. Closes, notifications
+        and the equity update are shared.
         """
-        logger.info("🧠 Intelligent position monitoring started - model-driven exits every 5 minutes")
+        if self.model_coordinator is not None:
+            logger.info("🧠 Intelligent position monitoring started - model-driven exits every 5 minutes")
+        else:
+            logger.info("Position monitoring loop started - checking SL/TP every 5 minutes")
         
         while self.is_running:
             try:
@@ -404,200 +738,142 @@ class TradingAgent:
                 # Get current time
                 now = get_current_time_utc()
                 
-                # Check each position using model predictions
-                for position in positions:
-                    try:
-                        # Fetch current price
-                        ticker = await self._fetch_with_retry(
-                            lambda: self.delta_client.get_ticker(position.symbol),
-                            operation_name=f"ticker_fetch_{position.symbol}"
-                        )
-                        
-                        if not ticker:
-                            logger.warning(f"Could not fetch ticker for {position.symbol}")
-                            continue
-                        
-                        current_price = float(ticker.get('close', 0))
-                        
-                        if current_price == 0:
-                            logger.warning(f"Invalid price for {position.symbol}")
-                            continue
-                        
-                        # Get fresh predictions from all models
-                        predictions = self.model_coordinator.get_all_predictions(position.symbol)
-                        
-                        # Evaluate position using model-driven manager
-                        evaluation = self.position_manager.evaluate_position(
-                            position=position,
-                            predictions=predictions,
-                            current_price=current_price
-                        )
-                        
-                        # Take action based on evaluation
-                        if evaluation['action'] == 'exit':
-                            logger.warning(
-                                f"Model-driven EXIT triggered for {position.symbol}",
-                                reason=evaluation['reason'],
-                                pcs=f"{evaluation['pcs']:.2%}",
-                                priority=evaluation['priority']
-                            )
-                            
-                            # Close the position
-                            result = self.trading_engine._close_position(
-                                position.symbol,
-                                current_price,
-                                reason=f"model_exit_{evaluation['reason']}"
-                            )
-                            
-                            if result and result['status'] == 'closed':
-                                # Notify backend for real-time WebSocket broadcast
-                                await notify_backend_api('position_closed', result)
-                                
-                                # Send Telegram notification
-                                if self.telegram_bot:
-                                    try:
-                                        await self.telegram_bot.notify_trade(result)
-                                    except Exception as e:
-                                        logger.warning(f"Telegram notification failed: {e}")
-                                
-                                # Record metrics
-                                self.trading_engine.circuit_breaker.record_trade(pnl=result['pnl'], timestamp=now)
-                                self.health_check.record_trade(result)
-                                await self.diagnostic_reporter.report_trade_execution(result)
-                                
-                                # Cleanup tracker
-                                self.position_manager.cleanup_position(position.symbol)
-                        
-                        # Update position equity
-                        price_map = {position.symbol: current_price}
-                        self.trading_engine.portfolio.update_equity(price_map)
-                        
-                    except Exception as e:
-                        logger.error(f"Error monitoring position {position.symbol}: {e}", exc_info=True)
-                        continue
+                # Fetch every position's price concurrently
+                price_map = await self._fetch_position_prices(positions)
+                
+                closed = []
+                if self.model_coordinator is not None:
+                    closed = self._close_model_exits(positions, price_map)
+                    exited = {result['symbol'] for result in closed}
+                    positions = [position for position in positions if position.symbol not in exited]
+                closed += self._close_fixed_exits(positions, price_map, now)
+                
+                for result in closed:
+                    # Record for circuit breaker tracking
+                    self.trading_engine.circuit_breaker.record_trade(pnl=result['pnl'], timestamp=now)
+                    self.health_check.record_trade(result)
+                
+                # Notifications run in the background so slow endpoints don't delay the next check
+                for result in closed:
+                    self._queue_backend_notification('position_closed', result)
+                    if self.telegram_bot:
+                        self._notify_in_background(self.telegram_bot.notify_trade(result), "Telegram notification")
+                    self._notify_in_background(
+                        self.diagnostic_reporter.report_trade_execution(result), "Diagnostic trade report"
+                    )
+                
+                # Mark every remaining position to market in one pass
+                if price_map:
+                    self.trading_engine.portfolio.update_equity(price_map)
                 
                 # Sleep for 5 minutes before next check
                 await asyncio.sleep(self.position_monitoring_interval)
                 
             except Exception as e:
-                logger.error("Error in intelligent position monitor", error=str(e), exc_info=True)
+                logger.error("Error in position monitoring loop", error=str(e), exc_info=True)
                 # Continue monitoring even on error, but wait before retrying
                 await asyncio.sleep(self.position_monitoring_interval)
     
-    async def position_monitoring_loop(self) -> None:
-        """Monitor positions every 5 minutes for stop-loss/take-profit (LEGACY).
+    def _close_model_exits(self, positions: list, price_map: dict) -> list:
+        """Close positions the model-driven position manager wants to exit.
         
-        This loop runs independently to ensure timely risk management,
-        while the main trading loop handles signal generation every 4 hours.
+        Args:
+            positions: Open positions
+            price_map: Current price by symbol; unpriced positions are skipped
         
-        Note: This is the legacy monitoring loop. Use intelligent_position_monitor for model-driven exits.
+        Returns:
+            Results of the positions that were closed
         """
-        logger.info("Position monitoring loop started - checking SL/TP every 5 minutes")
-        
-        while self.is_running:
+        closed = []
+        for position in positions:
             try:
-                # Only run if we have open positions
-                positions = self.trading_engine.portfolio.get_positions()
+                current_price = price_map.get(position.symbol)
+                if current_price is None:
+                    continue
                 
-                if not positions:
-                    # No positions, sleep and continue
-                    await asyncio.sleep(self.position_monitoring_interval)  # 5 minutes
+                # Get fresh predictions from all models
+                predictions = self.model_coordinator.get_all_predictions(position.symbol)
+                
+                # Evaluate position using model-driven manager
+                evaluation = self.position_manager.evaluate_position(
+                    position=position,
+                    predictions=predictions,
+                    current_price=current_price
+                )
+                if evaluation['action'] != 'exit':
                     continue
                 
-                # Get current time
-                now = get_current_time_utc()
+                logger.warning(
+                    f"Model-driven EXIT triggered for {position.symbol}",
+                    reason=evaluation['reason'],
+                    pcs=f"{evaluation['pcs']:.2%}",
+                    priority=evaluation['priority']
+                )
+                result = self.trading_engine._close_position(
+                    position.symbol,
+                    current_price,
+                    reason=f"model_exit_{evaluation['reason']}"
+                )
                 
-                # Check each position for SL/TP
-                for position in positions:
-                    try:
-                        # Fetch current price for this position
-                        ticker = await self._fetch_with_retry(
-                            lambda: self.delta_client.get_ticker(position.symbol),
-                            operation_name=f"ticker_fetch_{position.symbol}"
-                        )
-                        
-                        if not ticker:
-                            logger.warning(f"Could not fetch ticker for {position.symbol}")
-                            continue
-                        
-                        current_price = float(ticker.get('close', 0))
-                        
-                        if current_price == 0:
-                            logger.warning(f"Invalid price for {position.symbol}")
-                            continue
-                        
-                        # Check position timeout (force close after max holding period)
-                        holding_seconds = (now - position.timestamp).total_seconds()
-                        holding_hours = holding_seconds / 3600
-                        
-                        if holding_hours > self.MAX_HOLDING_HOURS:
-                            logger.warning(f"Position timeout - force closing {position.symbol} after {holding_hours:.1f}h")
-                            result = self.trading_engine._close_position(position.symbol, current_price, reason='timeout')
-                            
-                            if result and result['status'] == 'closed':
-                                # Notify backend for real-time WebSocket broadcast
-                                await notify_backend_api('position_closed', result)
-                                
-                                # Send Telegram notification
-                                if self.telegram_bot:
-                                    try:
-                                        await self.telegram_bot.notify_trade(result)
-                                    except Exception as e:
-                                        logger.warning(f"Telegram notification failed: {e}")
-                                
-                                # Record metrics
-                                self.trading_engine.circuit_breaker.record_trade(pnl=result['pnl'], timestamp=now)
-                                self.health_check.record_trade(result)
-                                await self.diagnostic_reporter.report_trade_execution(result)
-                            continue  # Position closed, move to next
-                        
-                        # Check stop-loss and take-profit
-                        result = self.trading_engine.check_stop_loss_take_profit(
-                            position.symbol,
-                            current_price
-                        )
-                        
-                        if result and result['status'] == 'closed':
-                            # Notify backend for real-time WebSocket broadcast
-                            await notify_backend_api('position_closed', result)
-                            
-                            # Send Telegram notification
-                            if self.telegram_bot:
-                                try:
-                                    await self.telegram_bot.notify_trade(result)
-                                except Exception as e:
-                                    logger.warning(f"Telegram notification failed: {e}")
-                            
-                            # Record for circuit breaker tracking
-                            self.trading_engine.circuit_breaker.record_trade(
-                                pnl=result['pnl'],
-                                timestamp=now
-                            )
-                            self.health_check.record_trade(result)
-                            await self.diagnostic_reporter.report_trade_execution(result)
-                            
-                            logger.info(
-                                f"Position closed via SL/TP monitoring",
-                                symbol=position.symbol,
-                                reason=result.get('close_reason'),
-                                pnl=result.get('pnl')
-                            )
-                        
-                        # Update position equity
-                        price_map = {position.symbol: current_price}
-                        self.trading_engine.portfolio.update_equity(price_map)
-                        
-                    except Exception as e:
-                        logger.error(f"Error monitoring position {position.symbol}: {e}", exc_info=True)
-                        continue
+                if result and result['status'] == 'closed':
+                    closed.append(result)
+                    # Cleanup tracker
+                    self.position_manager.cleanup_position(position.symbol)
                 
-                # Sleep for 5 minutes before next check
-                await asyncio.sleep(self.position_monitoring_interval)
+            except Exception as e:
+                logger.error(f"Error monitoring position {position.symbol}: {e}", exc_info=True)
+        
+        return closed
+    
+    def _close_fixed_exits(self, positions: list, price_map: dict, now: datetime) -> list:
+        """Close positions past the holding period or beyond their SL/TP levels.
+        
+        Args:
+            positions: Open positions
+            price_map: Current price by symbol; unpriced positions are skipped
+            now: Current UTC time
+        
+        Returns:
+            Results of the positions that were closed
+        """
+        closed = []
+        
+        # Force close any position that exceeded the holding period
+        for position in positions:
+            try:
+                current_price = price_map.get(position.symbol)
+                if current_price is None:
+                    continue
+                
+                holding_hours = (now - position.timestamp).total_seconds() / 3600
+                if holding_hours > self.MAX_HOLDING_HOURS:
+                    logger.warning(f"Position timeout - force closing {position.symbol} after {holding_hours:.1f}h")
+                    result = self.trading_engine._close_position(position.symbol, current_price, reason='timeout')
+                    if result and result['status'] == 'closed':
+                        closed.append(result)
                 
             except Exception as e:
-                logger.error("Error in position monitoring loop", error=str(e), exc_info=True)
-                # Continue monitoring even on error, but wait before retrying
-                await asyncio.sleep(self.position_monitoring_interval)
+                logger.error(f"Error monitoring position {position.symbol}: {e}", exc_info=True)
+        
+        # Check stop-loss and take-profit for every priced position at once
+        try:
+            results = self.trading_engine.check_stop_loss_take_profit_bulk(price_map)
+        except Exception as e:
+            logger.error(f"Error checking stop-loss/take-profit: {e}", exc_info=True)
+            results = []
+        
+        for result in results:
+            if result['status'] != 'closed':
+                continue
+            closed.append(result)
+            logger.info(
+                f"Position closed via SL/TP monitoring",
+                symbol=result['symbol'],
+                reason=result.get('close_reason'),
+                pnl=result.get('pnl')
+            )
+        
+        return closed
     
     async def trading_loop(self) -> None:
         """Main trading loop - Signal generation and trade execution.
@@ -610,7 +886,7 @@ class TradingAgent:
         # Determine interval based on system type
         if self.model_coordinator is not None:
             # Intelligent system - 5 minute entry signals
-            entry_interval = trading_config.trading.get('entry_signal_interval', 300)
+            entry_interval = self.entry_signal_interval
             self.logger.info(
                 "trading_loop_start",
                 "Intelligent trading loop started - entry signals every 5 minutes",
@@ -633,11 +909,16 @@ class TradingAgent:
                 }
             )
         
+        # Loop-invariant components, bound once
+        engine = self.trading_engine
+        portfolio = engine.portfolio
+        
         iteration_count = 0
         while self.is_running:
             try:
                 iteration_count += 1
-                loop_start_time = time.time()
+                loop_start_time = time.monotonic()
+                next_iteration_at = loop_start_time + entry_interval
                 
                 # Record heartbeat for health monitoring
                 self.health_check.heartbeat()
@@ -668,14 +949,14 @@ class TradingAgent:
                     )
                     
                     # PHASE 4.2: Use helper methods for throttling
-                    if self.telegram_bot and self._should_send_alert('model_health', now):
+                    if self.telegram_bot and self._should_send_alert('model_health'):
                         await self.telegram_bot.notify_risk_alert({
                             'type': 'model_health',
                             'message': 'Model health check failed - model count mismatch',
                             'expected_models': self.expected_models_count,
                             'current_models': current_model_count
                         })
-                        self._record_alert_sent('model_health', now)
+                        self._record_alert_sent('model_health')
                     
                     # Update health status
                     self.health_check.update_models_loaded(current_model_count)
@@ -686,7 +967,7 @@ class TradingAgent:
                         self.consecutive_skips += 1
                         if self.consecutive_skips >= 3:
                             logger.error(f"Warning: {self.consecutive_skips} consecutive skipped iterations")
-                        await asyncio.sleep(self.update_interval)
+                        await self._wait_for_next_iteration(next_iteration_at)
                         continue
                 
                 # Check database connection health
@@ -725,13 +1006,22 @@ class TradingAgent:
                 )
                 
                 # Note: Removed "Fetching market data" log to reduce noise - this happens every cycle
-                try:
-                    ticker = await self._fetch_with_retry(
-                        lambda: self.delta_client.get_ticker(self.symbol),
-                        operation_name="ticker_fetch"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to fetch ticker data: {e}", exc_info=True)
+                # Model inference does not depend on the ticker, so both run
+                # concurrently and the loop waits for the slower of the two
+                if self.model_coordinator is not None:
+                    inference = asyncio.to_thread(self.model_coordinator.get_all_predictions, self.symbol)
+                else:
+                    inference = asyncio.to_thread(self.predictor.get_latest_signals, [self.symbol], self.timeframe)
+                logger.info(
+                    "Getting trading signal",
+                    time=time_display
+                )
+                ticker_task = asyncio.create_task(self._get_current_ticker())
+                signal_task = asyncio.create_task(inference)
+                ticker, inference_result = await asyncio.gather(ticker_task, signal_task, return_exceptions=True)
+                
+                if isinstance(ticker, Exception):
+                    logger.error(f"Failed to fetch ticker data: {ticker}", exc_info=ticker)
                     ticker = None
                 
                 if not ticker:
@@ -739,7 +1029,7 @@ class TradingAgent:
                     self.consecutive_skips += 1
                     if self.consecutive_skips >= 3:
                         logger.error(f"Warning: {self.consecutive_skips} consecutive skipped iterations")
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
                 current_price = float(ticker.get('close', 0))
@@ -749,7 +1039,7 @@ class TradingAgent:
                     self.consecutive_skips += 1
                     if self.consecutive_skips >= 3:
                         logger.error(f"Warning: {self.consecutive_skips} consecutive skipped iterations")
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
                 # Validate data freshness (check if timestamp is recent)
@@ -772,29 +1062,33 @@ class TradingAgent:
                             )
                             
                             # PHASE 4.2: Use helper methods for throttling
-                            if self.telegram_bot and data_age_seconds > self.STALE_DATA_ALERT_SECONDS and self._should_send_alert('data_quality', now):
+                            if self.telegram_bot and data_age_seconds > self.STALE_DATA_ALERT_SECONDS and self._should_send_alert('data_quality'):
                                 await self.telegram_bot.notify_risk_alert({
                                     'type': 'data_quality',
                                     'message': f'Stale market data: {data_age_seconds/60:.1f} minutes old',
                                     'details': f'Last update: {ticker_time.isoformat()}'
                                 })
-                                self._record_alert_sent('data_quality', now)
+                                self._record_alert_sent('data_quality')
                     except Exception as e:
                         logger.warning(f"Could not validate data freshness: {e}")
                 
                 # 2. Update position unrealized PnL (IMPROVED - Phase 1.2)
-                # NOTE: SL/TP and timeout checks moved to separate position_monitoring_loop (runs every 5 min)
-                positions = self.trading_engine.portfolio.get_positions()
+                # NOTE: Exit checks (model-driven or SL/TP/timeout) live in position_monitoring_loop (runs every 5 min)
+                positions = portfolio.get_positions()
                 price_map = {self.symbol: current_price}
                 for position in positions:
                     if position.symbol not in price_map and position.symbol != self.symbol:
                         try:
-                            ticker = self.delta_client.get_ticker(position.symbol)
+                            ticker = await self._fetch_with_retry(
+                                self._ticker_getter(), position.symbol,
+                                max_retries=1,
+                                operation_name=f"ticker_fetch_{position.symbol}"
+                            )
                             if ticker:
                                 price_map[position.symbol] = float(ticker.get('close', 0))
                         except Exception as e:
                             logger.warning(f"Could not fetch price for {position.symbol}: {e}")
-                self.trading_engine.portfolio.update_equity(price_map)
+                portfolio.update_equity(price_map)
                 # Record equity snapshot for real risk metrics
                 if self.db is not None:
                     try:
@@ -802,8 +1096,8 @@ class TradingAgent:
                         db_session = SessionLocal()
                         try:
                             db_session.add(EquitySnapshot(
-                                equity=self.trading_engine.portfolio.equity,
-                                balance=self.trading_engine.portfolio.balance,
+                                equity=portfolio.equity,
+                                balance=portfolio.balance,
                             ))
                             db_session.commit()
                         except Exception as e:
@@ -814,10 +1108,10 @@ class TradingAgent:
                     except Exception as e:
                         logger.warning("Failed to record equity snapshot", error=str(e))
                 
-                # 4. Check circuit breaker BEFORE getting signal (prevent unnecessary API calls)
-                circuit_status = self.trading_engine.circuit_breaker.check_all_breakers(
-                    self.trading_engine.portfolio.balance,
-                    self.trading_engine.portfolio.initial_balance
+                # 4. Check circuit breaker before acting on the signal
+                circuit_status = engine.circuit_breaker.check_all_breakers(
+                    portfolio.balance,
+                    portfolio.initial_balance
                 )
                 
                 # Update health status (PHASE 1.3 - avoid duplicate check later)
@@ -831,29 +1125,24 @@ class TradingAgent:
                     )
                     
                     # PHASE 4.2: Use helper methods for throttling
-                    if self.telegram_bot and self._should_send_alert('circuit_breaker', now):
+                    if self.telegram_bot and self._should_send_alert('circuit_breaker'):
                         await self.telegram_bot.notify_risk_alert({
                             'type': 'circuit_breaker',
                             'reason': circuit_status['reason'],
                             'details': str(circuit_status)
                         })
-                        self._record_alert_sent('circuit_breaker', now)
+                        self._record_alert_sent('circuit_breaker')
                     
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
-                # 5. Get AI trading signal
-                logger.info(
-                    "Getting trading signal",
-                    time=time_display
-                )
-                
-                # Note: Removed "Generating AI trading signal" log to reduce noise - only log the actual prediction result
+                # 5. Use the AI trading signal started alongside the ticker fetch
+                if isinstance(inference_result, Exception):
+                    raise inference_result
                 
-                # Use intelligent system if available, otherwise use legacy predictor
                 if self.model_coordinator is not None:
                     # Intelligent multi-timeframe system
-                    predictions = self.model_coordinator.get_all_predictions(self.symbol)
+                    predictions = inference_result
                     
                     # Get ATR for volatility adjustment
                     atr = 0
@@ -903,7 +1192,7 @@ class TradingAgent:
                     )
                 else:
                     # Legacy predictor
-                    signal = self.predictor.get_latest_signal(self.symbol, self.timeframe)
+                    signal = inference_result[self.symbol]
                     
                     # Log prediction result for legacy system
                     if signal:
@@ -931,7 +1220,7 @@ class TradingAgent:
                     self.consecutive_skips += 1
                     if self.consecutive_skips >= 3:
                         logger.error(f"Warning: {self.consecutive_skips} consecutive skipped iterations")
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
                 # Check for error in signal
@@ -946,7 +1235,7 @@ class TradingAgent:
                     self.consecutive_skips += 1
                     if self.consecutive_skips >= 3:
                         logger.error(f"Warning: {self.consecutive_skips} consecutive skipped iterations")
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
                 # Record signal generation
@@ -954,16 +1243,14 @@ class TradingAgent:
                 # Report to diagnostic service
                 await self.diagnostic_reporter.report_signal_generation(signal)
                 # Notify backend for real-time WebSocket broadcast
-                await notify_backend_api('signal', signal)
+                await self._notify_backend('signal', signal)
                 
                 # PHASE 3.2: Track signal confidence trends (using class constants)
                 self.recent_signal_confidences.append(signal['confidence'])
-                if len(self.recent_signal_confidences) > self.SIGNAL_CONFIDENCE_HISTORY_SIZE:
-                    self.recent_signal_confidences.pop(0)
                 
                 if len(self.recent_signal_confidences) >= self.MIN_CONFIDENCE_SAMPLES:
                     try:
-                        avg_confidence = sum(self.recent_signal_confidences) / len(self.recent_signal_confidences)
+                        avg_confidence = fmean(self.recent_signal_confidences)
                         if avg_confidence < self.CONFIDENCE_DEGRADATION_THRESHOLD:
                             logger.warning(f"Model confidence degrading: {avg_confidence:.2%}")
                     except (ZeroDivisionError, TypeError) as e:
@@ -977,7 +1264,7 @@ class TradingAgent:
                     min_confidence = self.HIGH_VOLATILITY_MIN_CONFIDENCE
                     logger.info(f"High volatility ({volatility_pct:.2f}%) - requiring confidence >= {min_confidence:.0%}")
                 else:
-                    min_confidence = trading_config.signal_filters.get('min_confidence', 0.60)
+                    min_confidence = self.min_confidence
                 
                 # Override is_actionable with dynamic threshold
                 signal['is_actionable'] = signal['confidence'] >= min_confidence and signal['prediction'] != 'HOLD'
@@ -992,7 +1279,7 @@ class TradingAgent:
                 if not signal.get('is_actionable'):
                     logger.debug("No actionable signal", signal=signal.get('prediction'))
                     self.consecutive_skips += 1
-                    await asyncio.sleep(entry_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
                 # 6. Execute trade based on signal
@@ -1005,7 +1292,7 @@ class TradingAgent:
                 # Use intelligent entry engine if available
                 if self.entry_engine is not None:
                     # Check if position already exists
-                    has_position = self.trading_engine.portfolio.get_position(self.symbol) is not None
+                    has_position = portfolio.get_position(self.symbol) is not None
                     
                     # Generate entry decision
                     entry_decision = self.entry_engine.generate_entry_signal(
@@ -1022,7 +1309,7 @@ class TradingAgent:
                             details=entry_decision.get('details', '')
                         )
                         self.consecutive_skips += 1
-                        await asyncio.sleep(entry_interval)
+                        await self._wait_for_next_iteration(next_iteration_at)
                         continue
                     
                     # Entry approved - update signal with entry rationale
@@ -1033,10 +1320,10 @@ class TradingAgent:
                     )
                 
                 # PHASE 6.1: Validate position size before execution
-                max_position_value = self.trading_engine.portfolio.balance * self.MAX_POSITION_PCT
-                expected_size = self.trading_engine.position_sizer.calculate_position_size(
+                max_position_value = portfolio.balance * self.MAX_POSITION_PCT
+                expected_size = engine.position_sizer.calculate_position_size(
                     signal['confidence'], 
-                    self.trading_engine.portfolio.balance, 
+                    portfolio.balance, 
                     current_price
                 )
                 expected_value = current_price * expected_size
@@ -1046,10 +1333,10 @@ class TradingAgent:
                         f"Position size too large: ${expected_value:.2f} > ${max_position_value:.2f} (max {self.MAX_POSITION_PCT:.0%} of balance)"
                     )
                     self.consecutive_skips += 1
-                    await asyncio.sleep(self.update_interval)
+                    await self._wait_for_next_iteration(next_iteration_at)
                     continue
                 
-                result = self.trading_engine.execute_signal(
+                result = engine.execute_signal(
                     symbol=self.symbol,
                     signal=signal['prediction'],
                     confidence=signal['confidence'],
@@ -1100,13 +1387,10 @@ class TradingAgent:
                 # 7. Send notification and record trade
                 if result['status'] in ['filled', 'closed', 'rejected']:
                     # Notify backend for real-time WebSocket broadcast
-                    await notify_backend_api('trade', result)
+                    await self._notify_backend('trade', result)
                     
                     if self.telegram_bot:
-                        try:
-                            await self.telegram_bot.notify_trade(result)
-                        except Exception as e:
-                            logger.warning(f"Telegram trade notification failed: {e}")
+                        self._notify_in_background(self.telegram_bot.notify_trade(result), "Telegram trade notification")
                     if result['status'] == 'filled':
                         self.health_check.record_trade(result)
                         # Report to diagnostic service
@@ -1122,23 +1406,24 @@ class TradingAgent:
                 
                 # 8. Record trade for circuit breaker tracking
                 if result['status'] == 'filled':
-                    self.trading_engine.circuit_breaker.record_trade(
+                    engine.circuit_breaker.record_trade(
                         pnl=0,  # Will be updated when position closes
-                        timestamp=get_current_time_utc()
+                        timestamp=now
                     )
                 
-                # PHASE 1.3: Duplicate circuit breaker check removed (already done at line 286-287)
+                # PHASE 1.3: No second circuit breaker check here - the step 4 result stands
+                # for this iteration and a fill is picked up by next iteration's check
                 
                 # 8. Save daily metrics (PHASE 2.2 - date-based trigger, not time-based)
                 today = now.date()
                 if self.last_daily_save_date != today:
                     logger.info("Saving daily metrics")
-                    self.trading_engine.portfolio.save_daily_metrics()
+                    portfolio.save_daily_metrics()
                     
                     # Send daily report
                     if self.telegram_bot:
                         try:
-                            status = self.trading_engine.get_status()
+                            status = engine.get_status()
                             await self.telegram_bot.send_daily_report(status['portfolio'])
                         except Exception as e:
                             logger.warning(f"Daily report failed: {e}")
@@ -1148,17 +1433,22 @@ class TradingAgent:
                 # 9. Log status (PHASE 5.1: Optimized - direct access instead of get_status())
                 logger.info(
                     "Trading iteration complete",
-                    balance=self.trading_engine.portfolio.balance,
-                    equity=self.trading_engine.portfolio.equity,
+                    balance=portfolio.balance,
+                    equity=portfolio.equity,
                     positions=len(positions),
                     time=time_display
                 )
                 
-                # 10. Sleep until next iteration
-                await asyncio.sleep(entry_interval)
+                # Iteration completed, so any rate-limit backoff starts over
+                self._error_backoff = 0.0
+                
+                # 10. Wait for the next bar or the entry interval
+                await self._wait_for_next_iteration(next_iteration_at)
                 
             except Exception as e:
-                logger.error("Error in trading loop", error=str(e), exc_info=True)
+                error_kind = self._classify_error(e)
+                # Tracebacks only for unexpected errors; network and rate-limit failures are routine
+                logger.error("Error in trading loop", error=str(e), kind=error_kind, exc_info=error_kind == 'unknown')
                 self.health_check.record_error(str(e))
                 
                 # Log error activity
@@ -1180,8 +1470,8 @@ class TradingAgent:
                     logger.warning(f"Failed to report error to diagnostic service: {report_error}")
                 
                 # Improved error recovery - don't exit on single error
-                retry_delay = 300  # 5 minutes to match update interval
-                logger.warning(f"Error in trading loop, retrying in {retry_delay} seconds")
+                retry_delay = self._error_retry_delay(error_kind)
+                logger.warning(f"Error in trading loop ({error_kind}), retrying in {retry_delay} seconds")
                 await asyncio.sleep(retry_delay)
                 continue  # Continue loop instead of exiting
     
@@ -1230,15 +1520,9 @@ class TradingAgent:
             heartbeat_task = asyncio.create_task(self.heartbeat_task())
             self.logger.info("heartbeat_start", "Heartbeat task started (60-second interval)")
             
-            # Start appropriate position monitoring loop
-            if self.model_coordinator is not None:
-                # Intelligent system - model-driven exits every 5 minutes
-                monitoring_task = asyncio.create_task(self.intelligent_position_monitor())
-                self.logger.info("monitoring_start", "Intelligent position monitoring task started (5-minute interval)")
-            else:
-                # Legacy system - fixed SL/TP checks every 5 minutes
-                monitoring_task = asyncio.create_task(self.position_monitoring_loop())
-                self.logger.info("monitoring_start", "Position monitoring task started (5-minute interval)")
+            # Start position monitoring (model-driven exits or fixed SL/TP, every 5 minutes)
+            monitoring_task = asyncio.create_task(self.position_monitoring_loop())
+            self.logger.info("monitoring_start", "Position monitoring task started (5-minute interval)")
             
             # Run main trading loop (4-hour signal generation)
             try:
@@ -1284,6 +1568,10 @@ class TradingAgent:
             self.multi_tf_sync.stop()
             self.logger.info("multi_tf_sync_stop", "Multi-timeframe sync service stopped")
         
+        # Let in-flight notifications finish before the bot goes away
+        if self._pending_notifications:
+            await asyncio.wait(self._pending_notifications, timeout=self.NOTIFICATION_DRAIN_TIMEOUT_SECONDS)
+        
         # Stop Telegram bot
         if self.telegram_bot:
             await self.telegram_bot.notifications.send_shutdown_message()
@@ -1293,6 +1581,21 @@ class TradingAgent:
         # Close diagnostic reporter
         await self.diagnostic_reporter.close()
         
+        await self.delta_client.close_async_session()
+        
+        # Stop the batch flusher and send whatever is still queued
+        if self._notify_flusher_task is not None:
+            self._notify_flusher_task.cancel()
+            await asyncio.gather(self._notify_flusher_task, return_exceptions=True)
+            self._notify_flusher_task = None
+        queued = self._drain_notify_queue(self.NOTIFY_QUEUE_SIZE)
+        for start in range(0, len(queued), self.NOTIFY_BATCH_SIZE):
+            await notify_backend_batch(queued[start:start + self.NOTIFY_BATCH_SIZE], session=self._notify_session)
+        
+        if self._notify_session is not None:
+            await self._notify_session.close()
+            self._notify_session = None
+        
         # Close database
         if self.db is not None:
             self.db.close()
@@ -1306,13 +1609,19 @@ async def main():
     agent = TradingAgent()
     shutdown_event = asyncio.Event()
     
-    def signal_handler(sig, frame):
+    loop = asyncio.get_running_loop()
+    
+    def signal_handler(sig):
         logger.info(f"Received signal {sig}, initiating graceful shutdown...")
         shutdown_event.set()
     
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Register signal handlers on the loop so the event is set from loop context
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler; hand over to the loop thread instead
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(signal_handler, signum))
     
     try:
         # Initialize and start agent
@@ -1357,6 +1666,8 @@ if __name__ == "__main__":
     
     try:
         lock.acquire()
+        if HAS_UVLOOP:
+            uvloop.install()
         # Add timeout to prevent hanging
         asyncio.run(asyncio.wait_for(main(), timeout=None))
     except KeyboardInterrupt:
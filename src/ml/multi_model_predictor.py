@@ -210,6 +210,22 @@ class MultiModelPredictor:
             )
             return self._empty_signal()
     
+    def get_latest_signals(self, symbols: List[str], timeframe: str = '15m') -> Dict[str, Dict]:
+        """Get combined trading signals for several symbols.
+        
+        Same interface as ``TradingPredictor.get_latest_signals``; each
+        symbol's features are already shared by all models, so symbols are
+        scored one after another.
+        
+        Args:
+            symbols: Trading symbols
+            timeframe: Primary timeframe (used for data fetching)
+            
+        Returns:
+            Dictionary mapping symbol to combined signal dictionary
+        """
+        return {symbol: self.get_latest_signal(symbol, timeframe) for symbol in symbols}
+    
     def _combine_predictions(self, predictions: List[Dict]) -> Dict:
         """Combine predictions from multiple models based on strategy.
         
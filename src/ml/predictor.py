@@ -1,7 +1,7 @@
 """Prediction service for generating trading signals."""
 
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -45,42 +45,64 @@ class TradingPredictor:
         Returns:
             Signal dictionary with prediction, confidence, and metadata
         """
+        return self.get_latest_signals([symbol], timeframe)[symbol]
+    
+    def get_latest_signals(self, symbols: List[str], timeframe: str = '15m') -> Dict[str, Dict]:
+        """Get latest trading signals for several symbols.
+        
+        Each symbol's latest feature row is built separately, then all rows
+        are scored in a single model call.
+        
+        Args:
+            symbols: Trading symbols
+            timeframe: Candle timeframe
+            
+        Returns:
+            Dictionary mapping symbol to signal dictionary
+        """
         import time
         start_time = time.time()
         
-        self.logger.info("signal_generation", f"Generating signal for {symbol}", {"symbol": symbol, "timeframe": timeframe})
+        signals: Dict[str, Dict] = {}
+        latest_rows: Dict[str, pd.DataFrame] = {}
+        quality_scores: Dict[str, float] = {}
+        
+        for symbol in symbols:
+            self.logger.info("signal_generation", f"Generating signal for {symbol}", {"symbol": symbol, "timeframe": timeframe})
+            
+            try:
+                latest_features, quality_metrics, reason = self._latest_features(symbol, timeframe)
+            except Exception as e:
+                duration_ms = (time.time() - start_time) * 1000
+                self.logger.error("signal_generation", "Signal generation failed", {"symbol": symbol, "error": str(e)}, duration_ms=duration_ms, error=e)
+                signals[symbol] = self._empty_signal(f"Error: {str(e)}")
+                continue
+            
+            if latest_features is None:
+                signals[symbol] = self._empty_signal(reason)
+            else:
+                latest_rows[symbol] = latest_features
+                quality_scores[symbol] = quality_metrics.get('quality_score', 100)
+        
+        if not latest_rows:
+            return {symbol: signals[symbol] for symbol in symbols}
         
+        # Make predictions for all symbols at once
         try:
-            # Fetch latest data (need enough for indicators)
-            df = self.delta_client.get_ohlc_candles(
-                symbol=symbol,
-                resolution=timeframe,
-                limit=300  # Enough for all indicators
-            )
-            
-            if df.empty:
-                return self._empty_signal("No data available")
-            
-            # Validate data
-            df, quality_metrics = self.validator.validate_and_clean(df)
-            
-            if df.empty:
-                return self._empty_signal("Data validation failed")
-            
-            # Create features
-            df = self.feature_engineer.create_features(df)
-            
-            if df.empty:
-                return self._empty_signal("Feature engineering failed")
-            
-            # Get latest row for prediction
-            latest_features = df.tail(1)
-            
-            # Make prediction
-            prediction, confidence, probabilities = self.model.predict_single(latest_features)
-            
+            predictions = self.model.predict_batch(pd.concat(latest_rows.values(), ignore_index=True))
+        except Exception as e:
+            duration_ms = (time.time() - start_time) * 1000
+            for symbol in latest_rows:
+                self.logger.error("signal_generation", "Signal generation failed", {"symbol": symbol, "error": str(e)}, duration_ms=duration_ms, error=e)
+                signals[symbol] = self._empty_signal(f"Error: {str(e)}")
+            return {symbol: signals[symbol] for symbol in symbols}
+        
+        min_confidence = trading_config.signal_filters.get('min_confidence', 0.65)
+        duration_ms = (time.time() - start_time) * 1000
+        
+        for (symbol, latest_features), (prediction, confidence, probabilities) in zip(latest_rows.items(), predictions):
             # Get latest price info
-            latest_candle = df.iloc[-1]
+            latest_candle = latest_features.iloc[-1]
             
             signal = {
                 'timestamp': datetime.now(timezone.utc),
@@ -94,15 +116,13 @@ class TradingPredictor:
                 'rsi': float(latest_candle.get('rsi', 50)),
                 'macd': float(latest_candle.get('macd', 0)),
                 'volume_ratio': float(latest_candle.get('volume_ratio', 1)),
-                'quality_score': quality_metrics.get('quality_score', 100),
+                'quality_score': quality_scores[symbol],
                 'candle_timestamp': latest_candle['timestamp']
             }
             
             # Determine if signal is actionable
-            min_confidence = trading_config.signal_filters.get('min_confidence', 0.65)
             signal['is_actionable'] = confidence >= min_confidence and prediction != 'HOLD'
             
-            duration_ms = (time.time() - start_time) * 1000
             self.logger.info(
                 "signal_generated",
                 "Signal generated successfully",
@@ -116,12 +136,36 @@ class TradingPredictor:
                 duration_ms=duration_ms
             )
             
-            return signal
-            
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self.logger.error("signal_generation", "Signal generation failed", {"symbol": symbol, "error": str(e)}, duration_ms=duration_ms, error=e)
-            return self._empty_signal(f"Error: {str(e)}")
+            signals[symbol] = signal
+        
+        return {symbol: signals[symbol] for symbol in symbols}
+    
+    def _latest_features(self, symbol: str, timeframe: str) -> Tuple[Optional[pd.DataFrame], Dict, str]:
+        """Fetch, validate and featurize candles; returns (latest row, quality metrics, failure reason)."""
+        # Fetch latest data (need enough for indicators)
+        df = self.delta_client.get_ohlc_candles(
+            symbol=symbol,
+            resolution=timeframe,
+            limit=300  # Enough for all indicators
+        )
+        
+        if df.empty:
+            return None, {}, "No data available"
+        
+        # Validate data
+        df, quality_metrics = self.validator.validate_and_clean(df)
+        
+        if df.empty:
+            return None, quality_metrics, "Data validation failed"
+        
+        # Create features
+        df = self.feature_engineer.create_features(df)
+        
+        if df.empty:
+            return None, quality_metrics, "Feature engineering failed"
+        
+        # Get latest row for prediction
+        return df.tail(1), quality_metrics, ""
     
     def get_multi_timeframe_signal(self, symbol: str) -> Dict:
         """Get signals from multiple timeframes and combine.
@@ -1,7 +1,7 @@
 """XGBoost model for trading signal prediction."""
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import joblib
 import numpy as np
@@ -145,23 +145,38 @@ class XGBoostTradingModel:
         Returns:
             Tuple of (prediction, confidence, probabilities dict)
         """
-        predictions, confidence = self.predict(features)
+        return self.predict_batch(features)[0]
+    
+    def predict_batch(self, features: pd.DataFrame) -> List[Tuple[str, float, dict]]:
+        """Predict for several samples with detailed output.
         
-        # Get class probabilities
-        X_scaled = self.scaler.transform(features[self.feature_names])
-        probs = self.model.predict_proba(X_scaled)[0]
+        The rows are scaled and scored in one predict_proba call; the
+        prediction is the most probable class.
         
-        prob_dict = {
-            'SELL': float(probs[0]),
-            'HOLD': float(probs[1]),
-            'BUY': float(probs[2])
-        }
+        Args:
+            features: DataFrame with one row per sample
+            
+        Returns:
+            List of (prediction, confidence, probabilities dict), one per row
+        """
+        if self.model is None or self.scaler is None:
+            raise ValueError("Model not trained. Call train() or load() first.")
+        
+        X = features[self.feature_names] if self.feature_names else features
+        probabilities = self.model.predict_proba(self.scaler.transform(X))
         
         # Map prediction to label
         label_map = {0: 'SELL', 1: 'HOLD', 2: 'BUY'}
-        prediction_label = label_map[predictions[0]]
-        
-        return prediction_label, float(confidence[0]), prob_dict
+        results = []
+        for probs in probabilities:
+            prob_dict = {
+                'SELL': float(probs[0]),
+                'HOLD': float(probs[1]),
+                'BUY': float(probs[2])
+            }
+            results.append((label_map[int(probs.argmax())], float(probs.max()), prob_dict))
+        
+        return results
     
     def get_feature_importance(self, top_n: int = 20) -> pd.DataFrame:
         """Get feature importance scores.
@@ -29,6 +29,7 @@ except ImportError:
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.core.config import load_yaml
 from src.core.logger import get_component_logger, logger
 
 
@@ -430,7 +431,7 @@ class SystemMonitor:
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = load_yaml(f)
                     self.logger.info("config_loaded", f"Loaded configuration from {self.config_path}")
                     return config
             else:
@@ -1,16 +1,19 @@
 """Shared state manager for communication between trading agent and API."""
 
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from datetime import datetime, timezone
 
 from src.trading.paper_engine import PaperTradingEngine
-from src.ml.predictor import TradingPredictor
-from src.ml.multi_model_predictor import MultiModelPredictor
 from src.data.delta_client import DeltaExchangeClient
 from src.risk.risk_manager import RiskManager
 from typing import Union
 
+if TYPE_CHECKING:
+    # Annotation-only: the agent imports the predictor backend it actually uses
+    from src.ml.predictor import TradingPredictor
+    from src.ml.multi_model_predictor import MultiModelPredictor
+
 
 class SharedState:
     """Thread-safe shared state between trading agent and API."""
@@ -29,7 +32,7 @@ class SharedState:
     def __init__(self):
         if not self._initialized:
             self.trading_engine: Optional[PaperTradingEngine] = None
-            self.predictor: Optional[Union[TradingPredictor, MultiModelPredictor, Any]] = None
+            self.predictor: Optional[Union['TradingPredictor', 'MultiModelPredictor', Any]] = None
             self.delta_client: Optional[DeltaExchangeClient] = None
             self.risk_manager: Optional[RiskManager] = None
             self.is_trading_agent_running = False
@@ -39,7 +42,7 @@ class SharedState:
     def set_trading_agent_components(
         self,
         trading_engine: PaperTradingEngine,
-        predictor: Union[TradingPredictor, MultiModelPredictor, Any],
+        predictor: Union['TradingPredictor', 'MultiModelPredictor', Any],
         delta_client: DeltaExchangeClient,
         risk_manager: RiskManager
     ):
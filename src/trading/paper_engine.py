@@ -1,7 +1,7 @@
 """Paper trading engine for simulating trades."""
 
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -423,6 +423,33 @@ class PaperTradingEngine:
         if not position:
             return None
         
+        return self._check_exit_levels(position, current_price)
+    
+    def check_stop_loss_take_profit_bulk(self, price_map: Dict[str, float]) -> List[Dict]:
+        """Check stop loss and take profit for every priced position in one pass.
+        
+        Open positions are loaded with a single query rather than one lookup
+        per symbol.
+        
+        Args:
+            price_map: Dict of symbol: current market price
+            
+        Returns:
+            Execution results for the positions that were closed
+        """
+        results = []
+        for position in self.portfolio.get_positions():
+            if position.symbol not in price_map:
+                continue
+            result = self._check_exit_levels(position, price_map[position.symbol])
+            if result:
+                results.append(result)
+        return results
+    
+    def _check_exit_levels(self, position, current_price: float) -> Optional[Dict]:
+        """Close ``position`` if ``current_price`` reaches its stop loss or take profit."""
+        symbol = position.symbol
+        
         # Check stop loss
         if position.stop_loss:
             if (position.side == 'buy' and current_price <= position.stop_loss) or \
@@ -44,6 +44,162 @@ class TestFeatureEngineer:
         assert len(result.columns) > 20  # Should have many features
 
 
+class TestFeatureKernels:
+    """Test the compiled feature kernels against their NumPy/TA-Lib fallbacks."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numba(self):
+        pytest.importorskip('numba')
+
+    def test_vwap_and_rolling_std(self):
+        """Test the VWAP and rolling standard deviation kernels."""
+        from src.data import _fe_kernels as k
+
+        close = 100 + np.cumsum(np.random.normal(0, 1, 300))
+        volume = np.random.uniform(0, 10, 300)
+        volume[:3] = 0.0
+        np.testing.assert_allclose(k.vwap(close, volume, np.empty(300)),
+                                   k._numpy_vwap(close, volume, np.empty(300)), rtol=1e-9)
+
+        returns = np.diff(close, prepend=np.nan)
+        returns[[10, 150]] = np.nan
+        np.testing.assert_allclose(k.rolling_std(returns, 20, np.empty(300)),
+                                   k._numpy_rolling_std(returns, 20, np.empty(300)), rtol=1e-7)
+
+    def test_moving_averages(self):
+        """Test the multi-period SMA and EMA kernels."""
+        from src.data import _fe_kernels as k
+
+        close = 40000 + np.cumsum(np.random.normal(0, 50, 500))
+        periods = np.array([5, 20, 50, 200], dtype=np.int64)
+        for kernel, fallback in ((k.multi_sma, k._numpy_multi_sma), (k.multi_ema, k._numpy_multi_ema)):
+            np.testing.assert_allclose(kernel(close, periods, np.empty((4, 500))),
+                                       fallback(close, periods, np.empty((4, 500))), rtol=1e-9)
+
+    def test_derived_features(self):
+        """Test the ratio, spread and crossover kernel."""
+        import talib
+        from src.data import _fe_kernels as k
+
+        close = 40000 + np.cumsum(np.random.normal(0, 50, 300))
+        macd, macd_signal, _ = talib.MACD(close)
+        inputs = (close, talib.SMA(close, 20), talib.SMA(close, 50), talib.SMA(close, 200),
+                  talib.RSI(close), macd, macd_signal, talib.EMA(close, 12), talib.EMA(close, 26))
+
+        def run(kernel):
+            outputs = (np.empty((3, 300)), np.empty(300), np.empty(300), np.empty((4, 300), dtype=np.int8))
+            kernel(*inputs, *outputs)
+            return outputs
+
+        for compiled, fallback in zip(run(k.derived_features), run(k._numpy_derived_features)):
+            np.testing.assert_allclose(compiled, fallback, rtol=1e-12)
+
+
+class TestMultiTimeframeDataSync:
+    """Test feature reuse across syncs."""
+    
+    def test_features_reused_and_extended(self):
+        """Test that unchanged candles reuse features and new bars extend them."""
+        from src.data.multi_timeframe_sync import MultiTimeframeDataSync
+        
+        close = 40000 + np.cumsum(np.random.normal(0, 50, 501))
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=501, freq='15min'),
+            'symbol': 'BTCUSD',
+            'timeframe': '15m',
+            'open': close,
+            'high': close + 30,
+            'low': close - 30,
+            'close': close,
+            'volume': np.random.uniform(1000, 5000, 501)
+        })
+        
+        sync = MultiTimeframeDataSync()
+        first = sync._create_features('BTCUSD', '15m', df.iloc[:500])
+        assert sync._create_features('BTCUSD', '15m', df.iloc[:500].copy()) is first
+        
+        extended = sync._create_features('BTCUSD', '15m', df.iloc[1:].reset_index(drop=True))
+        full = sync.feature_engineer.create_features(df.iloc[1:].reset_index(drop=True))
+        assert list(extended.columns) == list(full.columns)
+        pd.testing.assert_series_equal(extended['timestamp'], full['timestamp'])
+        pd.testing.assert_series_equal(extended['sma_200'], full['sma_200'])
+        pd.testing.assert_series_equal(extended['ema_50'], full['ema_50'], rtol=1e-5)
+
+        sync.delta_client.session.close()
+
+    def test_persist_on_new_bar_and_stop(self, tmp_path):
+        """Test that frames are written per new bar and in-progress updates on stop."""
+        import asyncio
+        from unittest import mock
+        from src.data.multi_timeframe_sync import MultiTimeframeDataSync
+
+        close = 40000 + np.cumsum(np.random.normal(0, 50, 502))
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=502, freq='15min'),
+            'symbol': 'BTCUSD',
+            'timeframe': '15m',
+            'open': close,
+            'high': close + 30,
+            'low': close - 30,
+            'close': close,
+            'volume': np.random.uniform(1000, 5000, 502)
+        })
+
+        def tick(frame):
+            frame = frame.copy()
+            frame.loc[frame.index[-1], 'close'] += 5
+            return frame
+
+        sync = MultiTimeframeDataSync()
+        sync.cache_dir = tmp_path
+        fetches = [df.iloc[:500], tick(df.iloc[:500]),
+                   df.iloc[1:501].reset_index(drop=True), tick(df.iloc[1:501].reset_index(drop=True))]
+
+        with mock.patch.object(sync.delta_client, 'get_ohlc_candles', side_effect=fetches), \
+             mock.patch.object(sync, '_persist', wraps=sync._persist) as persist:
+            writes = []
+            for _ in fetches:
+                assert asyncio.run(sync._fetch_and_store('BTCUSD', '15m'))
+                writes.append(persist.call_count)
+            assert writes == [1, 1, 2, 2]
+
+            sync.stop()
+            assert persist.call_count == 3
+            assert (tmp_path / 'BTCUSD_15m.parquet').is_file()
+
+        sync.delta_client.session.close()
+
+    def test_latest_price_not_clipped(self, tmp_path):
+        """Test that a spike on the last candle is returned as fetched, not capped."""
+        import asyncio
+        from unittest import mock
+        from src.data.multi_timeframe_sync import MultiTimeframeDataSync
+
+        close = np.full(500, 40000.0) + np.random.normal(0, 20, 500)
+        close[-1] = 60000.0
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=500, freq='15min'),
+            'symbol': 'BTCUSD',
+            'timeframe': '15m',
+            'open': close,
+            'high': close + 30,
+            'low': close - 30,
+            'close': close,
+            'volume': np.random.uniform(1000, 5000, 500)
+        })
+
+        sync = MultiTimeframeDataSync()
+        sync.cache_dir = tmp_path
+        with mock.patch.object(sync.delta_client, 'get_ohlc_candles', return_value=df):
+            assert asyncio.run(sync._fetch_and_store('BTCUSD', '15m'))
+
+        assert sync.get_data('BTCUSD', '15m')['close'].iloc[-1] < 60000.0
+        price, _ = sync.get_latest_price('BTCUSD')
+        assert price == 60000.0
+
+        sync.delta_client.session.close()
+
+
 class TestDataValidator:
     """Test data validation."""
     
@@ -85,6 +241,24 @@ class TestDataValidator:
         assert not result.empty
         assert metrics['missing_data']['open'] == 10
 
+    def test_jit_kernels_match_python(self):
+        """Test that the compiled validator kernels agree with their Python source."""
+        pytest.importorskip('numba')
+        from src.data.data_validator import _quality_score, _volume_stats
+
+        volume = np.random.uniform(1000, 5000, 200)
+        volume[[3, 50]] = -10.0
+        volume[[7, 120]] = 1e6
+
+        compiled = _volume_stats(volume.copy())
+        python = _volume_stats.py_func(volume.copy())
+        np.testing.assert_array_equal(compiled[0], python[0])
+        assert compiled[1:] == pytest.approx(python[1:])
+        assert (compiled[2], compiled[3]) == (2, 2)
+
+        for args in [(200, 190, 12, 4, 3, 2), (100, 100, 0, 0, 0, 0), (10, 1, 10, 10, 10, 10)]:
+            assert _quality_score(*args) == pytest.approx(_quality_score.py_func(*args))
+
 
 class TestPositionSizer:
     """Test position sizing."""
@@ -151,6 +325,287 @@ class TestRiskManager:
         db.close()
 
 
+class TestDataSyncService:
+    """Test candle storage."""
+    
+    def test_store_candles_upserts(self, tmp_path):
+        """Test that re-stored candles are updated rather than duplicated."""
+        import asyncio
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import sessionmaker
+        from src.core.database import Base
+        from src.data.data_sync import DataSyncService
+        
+        engine = create_engine(f"sqlite:///{tmp_path / 'ohlcv.db'}")
+        Base.metadata.tables['ohlcv_data'].create(engine)
+        
+        service = DataSyncService()
+        service.session_factory = sessionmaker(bind=engine)
+        
+        def candles(start, close):
+            return pd.DataFrame({
+                'timestamp': pd.date_range(start, periods=5, freq='4h'),
+                'open': 100.0, 'high': 110.0, 'low': 90.0,
+                'close': close, 'volume': 1000.0
+            })
+        
+        asyncio.run(service.store_candles(candles('2024-01-01 00:00', 100.0), 'BTCUSD', '4h'))
+        asyncio.run(service.store_candles(candles('2024-01-01 12:00', 105.0), 'BTCUSD', '4h'))
+        
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT time, close FROM ohlcv_data ORDER BY time")).fetchall()
+        assert len(rows) == 8
+        assert [r[1] for r in rows] == [100.0] * 3 + [105.0] * 5
+        
+        service.close()
+
+
+class TestDatabaseMigration:
+    """Test index migration on existing databases."""
+
+    def test_migrate_indexes_drops_obsolete_indexes(self, tmp_path):
+        """Test that single-column indexes from the old schema are dropped."""
+        from sqlalchemy import create_engine, inspect, text
+        from src.core.database import Base, migrate_indexes
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        Base.metadata.tables['ohlcv_data'].create(engine)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE INDEX ix_ohlcv_data_symbol ON ohlcv_data (symbol)"))
+
+        migrate_indexes(engine)
+
+        names = {index['name'] for index in inspect(engine).get_indexes('ohlcv_data')}
+        assert 'ix_ohlcv_data_symbol' not in names
+        assert 'ix_ohlcv_key' in names
+
+    def test_migrate_indexes_adds_upsert_key(self, tmp_path):
+        """Test that a table without the upsert key is deduplicated and gets it."""
+        from sqlalchemy import create_engine, inspect, text
+        from src.core.database import Base, migrate_indexes
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        Base.metadata.tables['ohlcv_data'].create(engine)
+        insert = text(
+            "INSERT INTO ohlcv_data (time, symbol, timeframe, open, high, low, close, volume) "
+            "VALUES ('2024-01-01 00:00:00', 'BTCUSD', '4h', 1, 1, 1, :close, 1)"
+        )
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_ohlcv_key"))
+            conn.execute(insert, {'close': 100.0})
+            conn.execute(insert, {'close': 105.0})
+
+        migrate_indexes(engine)
+
+        names = {index['name'] for index in inspect(engine).get_indexes('ohlcv_data')}
+        assert 'ix_ohlcv_key' in names
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT close FROM ohlcv_data")).fetchall()
+        assert [r[0] for r in rows] == [105.0]
+
+
+class TestPaperTradingEngine:
+    """Test stop-loss/take-profit checks."""
+
+    def test_bulk_sl_tp_closes_only_hit_positions(self, tmp_path):
+        """Test that the bulk check closes positions whose levels were reached."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from src.core.database import Base
+        from src.trading.paper_engine import PaperTradingEngine
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'paper.db'}")
+        for table in ('trades', 'positions', 'performance_metrics'):
+            Base.metadata.tables[table].create(engine)
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
+
+        paper = PaperTradingEngine(db, 10000)
+        # Keep the positions referenced so the session returns them with their tz-aware timestamps
+        positions = [
+            paper.portfolio.add_position('BTCUSD', 'buy', 100.0, 1.0, stop_loss=95.0, take_profit=110.0),
+            paper.portfolio.add_position('ETHUSD', 'sell', 50.0, 2.0, stop_loss=55.0, take_profit=40.0),
+            paper.portfolio.add_position('SOLUSD', 'buy', 20.0, 5.0, stop_loss=18.0, take_profit=25.0),
+        ]
+
+        results = paper.check_stop_loss_take_profit_bulk({'BTCUSD': 94.0, 'ETHUSD': 39.0, 'SOLUSD': 21.0})
+
+        assert {r['symbol']: r['close_reason'] for r in results} == {
+            'BTCUSD': 'stop_loss', 'ETHUSD': 'take_profit'
+        }
+        assert [p.symbol for p in paper.portfolio.get_positions()] == ['SOLUSD']
+
+        db.close()
+
+
+class TestTradingPredictor:
+    """Test batched signal generation."""
+
+    def test_latest_signals_single_model_call(self):
+        """Test that several symbols are scored in one call and a failing symbol is isolated."""
+        from unittest import mock
+        from src.ml.predictor import TradingPredictor
+
+        predictor = TradingPredictor(model_path='missing_model.pkl')
+        predictor.model.feature_names = ['rsi']
+        predictor.model.scaler = mock.Mock(transform=lambda X: X.to_numpy())
+        predictor.model.model = mock.Mock()
+        predictor.model.model.predict_proba.return_value = np.array([[0.1, 0.2, 0.7], [0.8, 0.1, 0.1]])
+
+        def latest_features(symbol, timeframe):
+            if symbol == 'XRPUSD':
+                raise ConnectionError('candles unavailable')
+            row = pd.DataFrame({'timestamp': [pd.Timestamp('2024-01-01')], 'close': [100.0], 'rsi': [55.0]})
+            return row, {'quality_score': 99.0}, ""
+
+        with mock.patch.object(predictor, '_latest_features', side_effect=latest_features):
+            signals = predictor.get_latest_signals(['BTCUSD', 'XRPUSD', 'ETHUSD'])
+
+        assert predictor.model.model.predict_proba.call_count == 1
+        assert len(predictor.model.model.predict_proba.call_args[0][0]) == 2
+        assert signals['BTCUSD']['prediction'] == 'BUY'
+        assert signals['ETHUSD']['prediction'] == 'SELL'
+        assert signals['XRPUSD']['prediction'] == 'HOLD'
+        assert signals['XRPUSD']['reason'].startswith('Error')
+
+        predictor.delta_client.session.close()
+
+
+class TestDeltaExchangeClient:
+    """Test API client caching."""
+
+    def test_get_ticker_cached_within_ttl(self):
+        """Test that repeated ticker lookups reuse the cached result until the TTL expires."""
+        import time
+        from unittest import mock
+        from src.data.delta_client import DeltaExchangeClient
+
+        client = DeltaExchangeClient(ticker_cache_ttl=0.2)
+        response = {'success': True, 'result': {'symbol': 'BTCUSD', 'close': 50000.0}}
+
+        with mock.patch.object(client, '_make_request', return_value=response) as request:
+            assert client.get_ticker('BTCUSD') == response['result']
+            assert client.get_ticker('BTCUSD') == response['result']
+            assert request.call_count == 1
+
+            time.sleep(0.25)
+            client.get_ticker('BTCUSD')
+            assert request.call_count == 2
+
+        client.session.close()
+
+    def test_get_tickers_single_fetch(self):
+        """Test that a batch ticker lookup makes one request and fills the per-symbol cache."""
+        from unittest import mock
+        from src.data.delta_client import DeltaExchangeClient
+
+        client = DeltaExchangeClient(ticker_cache_ttl=60)
+        response = {'success': True, 'result': [
+            {'symbol': 'BTCUSD', 'close': 50000.0},
+            {'symbol': 'ETHUSD', 'close': 3000.0},
+            {'symbol': 'SOLUSD', 'close': 150.0},
+        ]}
+
+        with mock.patch.object(client, '_make_request', return_value=response) as request:
+            tickers = client.get_tickers(['BTCUSD', 'ETHUSD', 'XRPUSD'])
+            assert set(tickers) == {'BTCUSD', 'ETHUSD'}
+            assert client.get_ticker('SOLUSD')['close'] == 150.0
+            assert client.get_tickers(['BTCUSD', 'ETHUSD'])['ETHUSD']['close'] == 3000.0
+            assert request.call_count == 1
+
+        client.session.close()
+
+    def test_rate_limit_reset_is_relative_ms(self):
+        """Test that the reset header is read as milliseconds left and a 429 waits for it."""
+        from requests.structures import CaseInsensitiveDict
+        from src.data.delta_client import DeltaExchangeClient
+
+        client = DeltaExchangeClient()
+        now = [1_700_000_000.0]
+        client._clock = lambda: now[0]
+
+        client._update_rate_limit(CaseInsensitiveDict({
+            'x-ratelimit-limit': '10000', 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '1500'
+        }))
+        assert client._rate_limit_delay() == pytest.approx(1.5)
+        now[0] += 1.5
+        assert client._rate_limit_delay() == 0.0
+
+        client._update_rate_limit(CaseInsensitiveDict({
+            'x-ratelimit-remaining': '40', 'x-ratelimit-reset': '250'
+        }), status=429)
+        assert client._rate_limit_delay() == pytest.approx(0.25)
+
+        client.session.close()
+
+
+class TestComponentLogger:
+    """Test component logging."""
+
+    def test_level_aliases(self, tmp_path, monkeypatch):
+        """Test that logging's WARN/FATAL aliases are accepted as levels."""
+        import logging
+        from src.core.logger import ComponentLogger
+
+        monkeypatch.chdir(tmp_path)
+        log = ComponentLogger('test_level_aliases', log_level='WARN')
+        assert log.logger.level == logging.WARNING
+        log.log('fatal', 'check', 'alias level')
+
+        for handler in log.logger.handlers:
+            handler.close()
+
+    def test_numpy_context_values(self, tmp_path, monkeypatch):
+        """Test that numpy values in the context are written as plain JSON values."""
+        import json
+        from src.core.logger import ComponentLogger
+
+        monkeypatch.chdir(tmp_path)
+        log = ComponentLogger('test_numpy_context')
+        log.info('predict', 'model output', {
+            'confidence': np.float64(0.75), 'signal': np.int64(1), 'probs': np.array([0.25, 0.75])
+        })
+
+        for handler in log.logger.handlers:
+            handler.close()
+        (log_file,) = (tmp_path / 'logs').glob('test_numpy_context_*.json')
+        record = json.loads(log_file.read_text().splitlines()[-1])
+        assert record['context'] == {'confidence': 0.75, 'signal': 1, 'probs': [0.25, 0.75]}
+
+    def test_numpy_context_values_without_msgspec(self, tmp_path, monkeypatch):
+        """Test that the json fallback encodes the same numpy values."""
+        import json
+        from src.core import logger as logger_module
+        from src.core.logger import ComponentLogger
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(logger_module, 'HAS_MSGSPEC', False)
+        log = ComponentLogger('test_numpy_context_json')
+        log.info('predict', 'model output', {'signal': np.int64(1), 'probs': np.array([0.25, 0.75])})
+
+        for handler in log.logger.handlers:
+            handler.close()
+        (log_file,) = (tmp_path / 'logs').glob('test_numpy_context_json_*.json')
+        record = json.loads(log_file.read_text().splitlines()[-1])
+        assert record['context'] == {'signal': 1, 'probs': [0.25, 0.75]}
+
+
+class TestTradingAgent:
+    """Test trading agent construction."""
+
+    def test_agent_constructs(self):
+        """Test that the agent can be built from the shipped config and models."""
+        pytest.importorskip('telegram')
+        from src.core.config import trading_config
+        from src.main import TradingAgent
+
+        agent = TradingAgent()
+
+        assert agent.min_confidence == trading_config.signal_filters.get('min_confidence', 0.60)
+        assert not agent.is_running
+
+        agent.delta_client.session.close()
+
+
 def test_imports():
     """Test that all modules can be imported."""
     from src.core.config import settings, trading_config